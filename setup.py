@@ -17,6 +17,10 @@ setup(
         "numpy~=2.3.1",
         "pandas~=2.3.0",
     ],
+    extras_require={
+        "arrow": ["pyarrow>=14"],
+        "memory": ["psutil>=5.9"],
+    },
     python_requires=">=3.10",
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -26,9 +30,9 @@ setup(
         "Topic :: Text Processing :: Markup :: PDF",
         "Topic :: Scientific/Engineering :: Information Analysis",
     ],
-    # entry_points={
-    #     "console_scripts": [
-    #         "tablex=tablex.cli:main",  # 如果你有 tablex/cli.py 提供命令行接口
-    #     ],
-    # },
+    entry_points={
+        "console_scripts": [
+            "tablex=tablex.cli:main",
+        ],
+    },
 )
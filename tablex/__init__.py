@@ -1,32 +1,31 @@
-"""Top-level convenience imports for tablex."""
-from pdfplumber.utils.text import WordExtractor
+"""Top-level convenience imports for tablex.
 
-from .lines import ExplicitLineExtractor, extract_explicit_lines
-from .scoring import score_tables, search_best_table_settings
-from .utils.table_settings import iter_table_settings
+Submodules are imported on first attribute access (PEP 562), so
+``import tablex`` stays cheap for CLI workers and forked pool workers
+that only need part of the package.
+"""
+from typing import TYPE_CHECKING
 
+from tablex.utils.lazy import attach
 
-__all__ = [
-    "extract_explicit_lines",
-    "ExplicitLineExtractor",
-    "search_best_table_settings",
-    "score_tables",
-    "iter_table_settings",
-]
 
-# —— 1. 备份原始 __init__ ——
-WordExtractor._orig_init = WordExtractor.__init__
+_LAZY = {
+    "extract_explicit_lines": ".lines",
+    "ExplicitLineExtractor": ".lines",
+    "search_best_table_settings": ".scoring",
+    "score_tables": ".scoring",
+    "iter_table_settings": ".utils.table_settings",
+    "extract_document": ".pipeline",
+    "aextract_document": ".pipeline",
+    "aiter_document": ".pipeline",
+}
 
+__all__ = list(_LAZY)
+__getattr__, __dir__ = attach(__name__, _LAZY)
 
-# —— 2. 定义补丁 init ——
-def _patched_init(self, *args, **kwargs):
-    # 尝试 pop 出 text_settings，并打印出来
-    removed = kwargs.pop("settings", None)
-    if removed is not None:
-        print(f"[PATCH] Removed settings: {removed!r}")
-    # 调用原始 __init__
-    return WordExtractor._orig_init(self, *args, **kwargs)
 
-
-# —— 3. 应用补丁 ——
-WordExtractor.__init__ = _patched_init
+if TYPE_CHECKING:  # pragma: no cover
+    from .lines import ExplicitLineExtractor, extract_explicit_lines
+    from .pipeline import aextract_document, aiter_document, extract_document
+    from .scoring import score_tables, search_best_table_settings
+    from .utils.table_settings import iter_table_settings
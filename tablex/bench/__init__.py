@@ -0,0 +1,19 @@
+"""Benchmark suite: synthetic page stubs and per-stage timings.
+
+Run ``python -m tablex.bench --help``.
+"""
+
+from .runner import STAGES, compare, import_report, load_results, run_benchmark, triage_report, write_results
+from .stubs import GENERATORS, make_page
+
+__all__ = [
+    "GENERATORS",
+    "STAGES",
+    "compare",
+    "import_report",
+    "load_results",
+    "make_page",
+    "run_benchmark",
+    "triage_report",
+    "write_results",
+]
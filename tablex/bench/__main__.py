@@ -0,0 +1,70 @@
+"""``python -m tablex.bench`` – run the stage benchmark and compare to a baseline."""
+
+import argparse
+import sys
+
+from tablex.bench.runner import (
+    DEFAULT_SIZES,
+    STAGES,
+    compare,
+    import_report,
+    load_results,
+    run_benchmark,
+    triage_report,
+    write_results,
+)
+from tablex.bench.stubs import GENERATORS
+from tablex.utils.log import enable_console
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tablex.bench", description=__doc__)
+    parser.add_argument("--kinds", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--stages", nargs="+", default=list(STAGES), choices=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--force", action="store_true", help="run slow stages on every size")
+    parser.add_argument("-o", "--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="regression ratio (default 1.25)")
+    parser.add_argument("--triage", action="store_true", help="report the triage false-negative rate")
+    parser.add_argument("--triage-seeds", type=int, default=3, help="stub seeds per kind/size for --triage")
+    parser.add_argument("--imports", action="store_true", help="also time cold imports of the main modules")
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    if not args.quiet:
+        enable_console("INFO", "bench")
+
+    doc = run_benchmark(args.kinds, args.sizes, args.stages, repeat=args.repeat, seed=args.seed, force=args.force)
+    if args.triage:
+        sizes = [n for n in args.sizes if n <= STAGES["search"].max_primitives] or [min(args.sizes)]
+        doc["triage"] = triage_report(args.kinds, sizes, range(args.triage_seeds))
+        t = doc["triage"]
+        print(
+            f"triage: skipped {t['skipped']}/{t['pages']} pages, "
+            f"false negatives {t['false_negatives']}/{t['positives']} (rate {t['fn_rate']})"
+        )
+    if args.imports:
+        report = import_report(repeat=args.repeat)
+        doc["results"] += report["results"]
+        doc["imports"] = report["loaded"]
+        for r in report["results"]:
+            print(f"import {r['stage']}: {r['p50_ms']} ms, loads {', '.join(report['loaded'][r['stage']]) or '-'}")
+    if args.output:
+        write_results(doc, args.output)
+
+    if args.baseline:
+        regressions = compare(load_results(args.baseline), doc, threshold=args.threshold)
+        for reg in regressions:
+            print(
+                f"REGRESSION {reg['kind']}/{reg['size']}/{reg['stage']} {reg['metric']}: "
+                f"{reg['baseline']} -> {reg['current']} (x{reg['ratio']})"
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
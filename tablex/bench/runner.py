@@ -0,0 +1,323 @@
+"""
+Stage timing runner.
+
+`run_benchmark` builds one stub page per (kind, size), times every stage
+*repeat* times (``perf_counter``, page caches flushed before each run) and
+measures peak Python allocations of one extra run under `tracemalloc`.
+`compare` checks a run against a stored baseline document.
+`triage_report` measures how often the triage pre-screen drops a page on
+which the full search does find a table (false negatives).
+`import_report` times ``import <module>`` in fresh interpreters.
+"""
+
+import json
+import os
+import pathlib
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pdfplumber
+from pdfplumber.table import TableSettings
+
+from tablex.bench.stubs import GENERATORS, make_page
+from tablex.lines import extract_explicit_lines
+from tablex.scoring import search_best_table_settings
+from tablex.scoring.cache import PageFeatureCache
+from tablex.scoring.grid import grid_tables
+from tablex.scoring.triage import DEFAULT_TRIAGE, TriageConfig, triage_page
+from tablex.utils.char_index import CharIndex
+from tablex.utils.cluster import cluster
+from tablex.utils.geometry import PageGeometry
+from tablex.utils.large_table import get_large_table_hlines, has_large_table
+from tablex.utils.log import get_logger
+
+
+logger = get_logger(__name__)
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+DEFAULT_IMPORTS = ("tablex", "tablex.cli", "tablex.scoring.search", "tablex.pipeline.document")
+HEAVY_MODULES = ("numpy", "pdfplumber", "PIL")
+
+
+@dataclass(frozen=True, slots=True)
+class Stage:
+    """A timed callable; *prepare* runs untimed and returns the call argument."""
+
+    name: str
+    run: Callable[[Any], Any]
+    prepare: Callable[[Any], Any] = lambda page: page
+    max_primitives: Optional[int] = None  # skip larger pages unless forced
+
+
+def _flushed(page):
+    page.flush_cache()
+    return page
+
+
+def _triage_input(page):
+    # geometry and char index are shared with the search, so only the verdict is timed
+    page = _flushed(page)
+    return page, PageGeometry.from_page(page), CharIndex.from_page(page)
+
+
+def _grid_input(page):
+    # merged lines-lines edges; only intersections → cells → tables are timed
+    page = _flushed(page)
+    return page, PageFeatureCache(page).edges(TableSettings.resolve({}))
+
+
+def _cluster_input(page) -> List[float]:
+    return [o["x0"] for o in page.lines + page.rects + page.curves] + [c["x0"] for c in page.chars]
+
+
+STAGES: Dict[str, Stage] = {
+    s.name: s
+    for s in (
+        Stage("explicit_lines", lambda p: extract_explicit_lines(p, dump_rects_log=False), _flushed),
+        Stage("has_large_table", has_large_table, _flushed),
+        Stage("get_large_table_hlines", get_large_table_hlines, _flushed),
+        Stage("cluster", cluster, _cluster_input),
+        Stage("grid_tables", lambda a: grid_tables(*a), _grid_input),
+        Stage("triage", lambda a: triage_page(a[0], geometry=a[1], char_index=a[2]), _triage_input),
+        Stage("search", lambda p: search_best_table_settings(p, debug=False), _flushed, max_primitives=10_000),
+    )
+}
+
+
+@dataclass(slots=True)
+class StageResult:
+    kind: str
+    size: int
+    primitives: int
+    stage: str
+    repeat: int
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    mean_ms: Optional[float] = None
+    peak_kib: Optional[float] = None
+    error: Optional[str] = None
+
+
+def _call(stage: Stage, arg) -> Optional[str]:
+    """Run the stage; an exception is part of the measured outcome."""
+    try:
+        stage.run(arg)
+    except Exception as exc:  # noqa: BLE001
+        return f"{type(exc).__name__}: {exc}"
+    return None
+
+
+def _time_stage(stage: Stage, page, repeat: int) -> Dict[str, Any]:
+    times = []
+    error = None
+    for _ in range(repeat):
+        arg = stage.prepare(page)
+        t0 = time.perf_counter()
+        error = _call(stage, arg)
+        times.append((time.perf_counter() - t0) * 1000.0)
+
+    arg = stage.prepare(page)
+    tracemalloc.start()
+    try:
+        _call(stage, arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    p50, p95 = np.percentile(times, [50, 95])
+    return {
+        "p50_ms": round(float(p50), 4),
+        "p95_ms": round(float(p95), 4),
+        "mean_ms": round(float(np.mean(times)), 4),
+        "peak_kib": round(peak / 1024.0, 1),
+        "error": error,
+    }
+
+
+def run_benchmark(
+    kinds: Iterable[str] = tuple(GENERATORS),
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    stages: Iterable[str] = tuple(STAGES),
+    repeat: int = 5,
+    seed: int = 0,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """Time *stages* on every (kind, size) stub page and return a JSON-ready dict.
+
+    Stages with ``max_primitives`` are skipped on larger pages unless
+    *force* is set.  A stage that raises is still timed; the exception is
+    recorded in ``error`` (the pre-existing "no table" warning is a normal
+    outcome on ruled-only pages).
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"unknown stages: {sorted(unknown)}")
+
+    results: List[StageResult] = []
+    for kind in kinds:
+        for size in sizes:
+            page = make_page(kind, size, seed=seed)
+            for name in stages:
+                stage = STAGES[name]
+                res = StageResult(kind, size, len(page), name, repeat)
+                if stage.max_primitives and len(page) > stage.max_primitives and not force:
+                    res.error = "skipped"
+                else:
+                    for key, value in _time_stage(stage, page, repeat).items():
+                        setattr(res, key, value)
+                logger.info("%-7s %7d %-24s p50=%s ms peak=%s KiB %s",
+                            kind, size, name, res.p50_ms, res.peak_kib, res.error or "")
+                results.append(res)
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pdfplumber": pdfplumber.__version__,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": [asdict(r) for r in results],
+    }
+
+
+def write_results(doc: Dict[str, Any], path) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(doc, fh, indent=2, ensure_ascii=False)
+
+
+def load_results(path) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 1.25,
+    min_ms: float = 0.5,
+    metrics: Sequence[str] = ("p50_ms", "p95_ms", "peak_kib"),
+) -> List[Dict[str, Any]]:
+    """Entries of *current* that are worse than *baseline* by more than *threshold*×.
+
+    Timing differences below *min_ms* are ignored as noise.  Each
+    regression is ``{kind, size, stage, metric, baseline, current, ratio}``.
+    """
+    base = {(r["kind"], r["size"], r["stage"]): r for r in baseline["results"]}
+    out = []
+    for r in current["results"]:
+        b = base.get((r["kind"], r["size"], r["stage"]))
+        if b is None:
+            continue
+        for metric in metrics:
+            old, new = b.get(metric), r.get(metric)
+            if old is None or new is None or old <= 0:
+                continue
+            if metric.endswith("_ms") and new - old < min_ms:
+                continue
+            ratio = new / old
+            if ratio > threshold:
+                out.append({
+                    "kind": r["kind"], "size": r["size"], "stage": r["stage"], "metric": metric,
+                    "baseline": old, "current": new, "ratio": round(ratio, 3),
+                })
+    return out
+
+
+def _has_table(page) -> bool:
+    try:
+        return search_best_table_settings(page, debug=False)[0] is not None
+    except RuntimeWarning:  # "此页没有表格"
+        return False
+
+
+def triage_report(
+    kinds: Iterable[str] = tuple(GENERATORS),
+    sizes: Iterable[int] = (300, 1_000, 3_000),
+    seeds: Iterable[int] = range(3),
+    config: TriageConfig = DEFAULT_TRIAGE,
+) -> Dict[str, Any]:
+    """Triage verdicts vs. the full search on every (kind, size, seed) stub.
+
+    ``fn_rate`` is false negatives / pages with a table; ``skip_rate`` is
+    the share of pages the triage lets the search skip.
+    """
+    pages = positives = skipped = 0
+    misses: List[Dict[str, Any]] = []
+    for kind in kinds:
+        for size in sizes:
+            for seed in seeds:
+                page = make_page(kind, size, seed=seed)
+                verdict = triage_page(page, config, char_index=PageFeatureCache(page).char_index())
+                truth = _has_table(page)
+                pages += 1
+                positives += truth
+                skipped += not verdict.possible
+                if truth and not verdict.possible:
+                    misses.append({"kind": kind, "size": size, "seed": seed})
+    return {
+        "config": asdict(config),
+        "pages": pages,
+        "positives": positives,
+        "skipped": skipped,
+        "false_negatives": len(misses),
+        "fn_rate": round(len(misses) / positives, 4) if positives else 0.0,
+        "skip_rate": round(skipped / pages, 4) if pages else 0.0,
+        "misses": misses,
+    }
+
+
+_IMPORT_PROBE = "import json, sys; import {module}; print(json.dumps([m for m in {heavy!r} if m in sys.modules]))"
+
+
+def _import_once(module: str) -> Tuple[float, List[str]]:
+    """(cumulative µs of ``import module`` per ``-X importtime``, heavy modules loaded)."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [str(pathlib.Path(__file__).resolve().parents[2]), os.environ.get("PYTHONPATH")])
+    ))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    cumulative = 0.0
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if line.startswith("import time:") and len(parts) == 3 and parts[2].strip() == module:
+            cumulative = float(parts[1])
+    return cumulative, json.loads(proc.stdout)
+
+
+def import_report(modules: Iterable[str] = DEFAULT_IMPORTS, repeat: int = 5) -> Dict[str, Any]:
+    """Cold-import time of every module in a fresh interpreter.
+
+    ``results`` uses the stage-result layout (kind ``"import"``, size 0,
+    stage = module), so `compare` checks it against a baseline like any
+    other stage; ``loaded`` lists which of `HEAVY_MODULES` each import
+    pulled in.
+    """
+    results, loaded = [], {}
+    for module in modules:
+        times = []
+        for _ in range(repeat):
+            us, heavy = _import_once(module)
+            times.append(us / 1000.0)
+        p50, p95 = np.percentile(times, [50, 95])
+        results.append(asdict(StageResult(
+            "import", 0, 0, module, repeat,
+            p50_ms=round(float(p50), 3), p95_ms=round(float(p95), 3), mean_ms=round(float(np.mean(times)), 3),
+        )))
+        loaded[module] = heavy
+        logger.info("import %-28s p50=%s ms loads %s", module, results[-1]["p50_ms"], ", ".join(heavy) or "-")
+    return {"results": results, "loaded": loaded}
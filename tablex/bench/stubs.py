@@ -0,0 +1,169 @@
+"""
+Synthetic page stubs for the benchmark.
+
+Every generator returns a `PrimitivePage` with roughly *n* primitives
+(lines + rects + curves + chars) so stage timings can be compared across
+10²–10⁵ primitives.  Large sizes grow the page height (ledger-style long
+pages) instead of shrinking cells below a readable size.
+"""
+
+import math
+import random
+from typing import Callable, Dict, List, Tuple
+
+from tablex.utils.pages import PrimitivePage, make_chars, make_curve, make_line, make_rect
+
+
+W = 612.0
+MARGIN = 72.0
+ROW_H = 14.0
+MAX_COLS = 12
+
+
+def _row_h(rows: int) -> float:
+    # small grids still span half a letter page, like a real table would
+    return max(ROW_H, 324.0 / rows)
+
+
+def _page_height(rows: int) -> float:
+    return max(792.0, rows * _row_h(rows) + 2 * MARGIN)
+
+
+def _cells(rows: int, cols: int, H: float, chars: List[dict], xs: List[float], ys: List[float]) -> None:
+    for r in range(rows):
+        for c in range(cols):
+            chars.extend(make_chars(f"r{r}c{c}", xs[c] + 2, ys[r] + 2, H, size=8.0))
+
+
+def _label_chars(rows: int, cols: int) -> int:
+    """Total chars of all ``r{r}c{c}`` labels of a rows × cols grid."""
+    digits_r = sum(len(str(r)) for r in range(rows))
+    digits_c = sum(len(str(c)) for c in range(cols))
+    return 2 * rows * cols + cols * digits_r + rows * digits_c
+
+
+def _grid_shape(n: int, cost: Callable[[int, int], int]) -> Tuple[int, int]:
+    """(rows, cols) whose primitive count *cost* is closest to *n* (≥ 2 × 2)."""
+    cols = max(2, min(MAX_COLS, int(math.sqrt(n / 7))))
+    lo, hi = 2, 2
+    while cost(hi, cols) < n:
+        lo, hi = hi, hi * 2
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if cost(mid, cols) < n:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo, cols
+
+
+def _axes(rows: int, cols: int, H: float):
+    xs = [MARGIN + (W - 2 * MARGIN) * i / cols for i in range(cols + 1)]
+    ys = [MARGIN + _row_h(rows) * i for i in range(rows + 1)]
+    return xs, ys
+
+
+def grid_page(n: int, seed: int = 0) -> PrimitivePage:
+    """Fully ruled grid with one text label per cell."""
+    rows, cols = _grid_shape(n, lambda r, c: (r + 1) + (c + 1) + _label_chars(r, c))
+    H = _page_height(rows)
+    xs, ys = _axes(rows, cols, H)
+    lines = [make_line(xs[0], y, xs[-1], y, H) for y in ys]
+    lines += [make_line(x, ys[0], x, ys[-1], H) for x in xs]
+    chars: List[dict] = []
+    _cells(rows, cols, H, chars, xs, ys)
+    return PrimitivePage(W, H, lines=lines, chars=chars)
+
+
+def ruled_page(n: int, seed: int = 0) -> PrimitivePage:
+    """Horizontal rules only (no vertical borders), text columns."""
+    rows, cols = _grid_shape(n, lambda r, c: (r + 1) + _label_chars(r, c))
+    H = _page_height(rows)
+    xs, ys = _axes(rows, cols, H)
+    lines = [make_line(xs[0], y, xs[-1], y, H) for y in ys]
+    chars: List[dict] = []
+    _cells(rows, cols, H, chars, xs, ys)
+    return PrimitivePage(W, H, lines=lines, chars=chars)
+
+
+def dashed_page(n: int, seed: int = 0, dash: float = 3.0, gap: float = 2.0) -> PrimitivePage:
+    """Grid whose borders are drawn as short dash segments (thin rects)."""
+    step = dash + gap
+    width = W - 2 * MARGIN
+    rows, cols = _grid_shape(
+        n, lambda r, c: int((r + 1) * width / step + (c + 1) * r * _row_h(r) / step) + _label_chars(r, c),
+    )
+    H = _page_height(rows)
+    xs, ys = _axes(rows, cols, H)
+    rects = []
+    for y in ys:
+        x = xs[0]
+        while x < xs[-1]:
+            rects.append(make_rect(x, y - 0.25, min(x + dash, xs[-1]), y + 0.25, H))
+            x += step
+    for x in xs:
+        y = ys[0]
+        while y < ys[-1]:
+            rects.append(make_rect(x - 0.25, y, x + 0.25, min(y + dash, ys[-1]), H))
+            y += step
+    chars: List[dict] = []
+    _cells(rows, cols, H, chars, xs, ys)
+    return PrimitivePage(W, H, rects=rects, chars=chars)
+
+
+def noise_page(n: int, seed: int = 0) -> PrimitivePage:
+    """Vector-art noise (curves, coloured rects, slanted lines) around a small grid."""
+    rng = random.Random(seed)
+    base = grid_page(120, seed)
+    H = base.height
+    lines, rects, curves = list(base.lines), [], []
+    for i in range(max(n - len(base), 0)):
+        x, y = rng.uniform(0, W), rng.uniform(0, H)
+        color = (rng.random(), rng.random(), rng.random())
+        kind = i % 3
+        if kind == 0:
+            pts = [(x, y)] + [(x + rng.uniform(-20, 20), y + rng.uniform(-20, 20)) for _ in range(3)]
+            curves.append(make_curve(pts, H, color=color))
+        elif kind == 1:
+            w, h = rng.uniform(1, 30), rng.uniform(1, 30)
+            rects.append(make_rect(x, y, min(x + w, W), min(y + h, H), H, fill=color))
+        else:
+            lines.append(make_line(x, y, min(x + rng.uniform(2, 40), W), min(y + rng.uniform(2, 40), H), H, color=color))
+    return PrimitivePage(W, H, lines=lines, rects=rects, curves=curves, chars=base.chars)
+
+
+def prose_page(n: int, seed: int = 0) -> PrimitivePage:
+    """Running text between a header and a footer rule (no table)."""
+    rng = random.Random(seed)
+    size = 10.0
+    per_line = int((W - 2 * MARGIN) / (size * 0.5))
+    n_lines = max(1, n // per_line)
+    H = max(792.0, n_lines * ROW_H + 2 * MARGIN)
+    chars: List[dict] = []
+    for i in range(n_lines):
+        words, length = [], 0
+        while length < per_line - 12:
+            word = "".join(rng.choice("etaoinshrdlu") for _ in range(rng.randint(2, 9)))
+            words.append(word)
+            length += len(word) + 1
+        chars.extend(make_chars(" ".join(words), MARGIN, MARGIN + i * ROW_H, H, size=size))
+    lines = [make_line(MARGIN, MARGIN - 8, W - MARGIN, MARGIN - 8, H), make_line(MARGIN, H - 40, W - MARGIN, H - 40, H)]
+    return PrimitivePage(W, H, lines=lines, chars=chars)
+
+
+GENERATORS: Dict[str, Callable[..., PrimitivePage]] = {
+    "grid": grid_page,
+    "ruled": ruled_page,
+    "dashed": dashed_page,
+    "noise": noise_page,
+    "prose": prose_page,
+}
+
+
+def make_page(kind: str, n: int, seed: int = 0) -> PrimitivePage:
+    """Stub page of *kind* (see `GENERATORS`) with about *n* primitives."""
+    try:
+        gen = GENERATORS[kind]
+    except KeyError:
+        raise ValueError(f"unknown page kind {kind!r}; choose from {sorted(GENERATORS)}") from None
+    return gen(n, seed=seed)
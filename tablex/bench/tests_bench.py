@@ -0,0 +1,77 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import copy
+
+import pytest
+
+from tablex.bench import GENERATORS, compare, load_results, make_page, run_benchmark, write_results
+from tablex.bench.__main__ import main
+
+
+@pytest.mark.parametrize("kind", sorted(GENERATORS))
+@pytest.mark.parametrize("n", [1_000, 10_000])
+def test_stub_sizes(kind, n):
+    page = make_page(kind, n)
+    assert 0.8 * n <= len(page) <= 1.2 * n
+    assert page.edges and page.chars
+
+
+def test_grid_stub_finds_table():
+    page = make_page("grid", 300)
+    (table,) = page.find_tables()
+    assert table.extract()[0][0] == "r0c0"
+
+
+def test_run_and_compare(tmp_path):
+    doc = run_benchmark(kinds=["grid", "ruled"], sizes=[200], stages=["explicit_lines", "cluster"], repeat=2)
+    assert {(r["kind"], r["stage"]) for r in doc["results"]} == {
+        (k, s) for k in ("grid", "ruled") for s in ("explicit_lines", "cluster")
+    }
+    assert all(r["p50_ms"] is not None and r["peak_kib"] is not None for r in doc["results"])
+
+    path = tmp_path / "base.json"
+    write_results(doc, path)
+    base = load_results(path)
+    assert compare(base, doc) == []
+
+    slower = copy.deepcopy(doc)
+    slower["results"][0]["p50_ms"] = base["results"][0]["p50_ms"] * 3 + 10
+    (reg,) = compare(base, slower)
+    assert reg["metric"] == "p50_ms" and reg["ratio"] > 1.25
+
+
+def test_cli_exit_code(tmp_path):
+    out = tmp_path / "run.json"
+    args = ["--kinds", "grid", "--sizes", "200", "--stages", "cluster", "--repeat", "1", "-q", "-o", str(out)]
+    assert main(args) == 0
+    assert main(args[:-2] + ["--baseline", str(out), "--threshold", "1000"]) == 0
+    with pytest.raises(ValueError):
+        run_benchmark(stages=["nope"])
+
+
+def test_triage_report():
+    from tablex.bench import triage_report
+
+    report = triage_report(kinds=["grid", "prose"], sizes=[300], seeds=[0, 1])
+    assert (report["pages"], report["positives"], report["skipped"]) == (4, 2, 2)
+    assert report["false_negatives"] == 0 and report["fn_rate"] == 0.0
+
+
+def test_import_report_lazy_package():
+    from tablex.bench import import_report
+
+    report = import_report(["tablex"], repeat=1)
+    assert report["loaded"] == {"tablex": []}  # no pdfplumber / numpy / PIL on `import tablex`
+    (res,) = report["results"]
+    assert res["kind"] == "import" and res["p50_ms"] > 0
+
+    import tablex
+    from tablex.scoring.search import search_best_table_settings
+
+    assert tablex.search_best_table_settings is search_best_table_settings
+    assert "extract_document" in dir(tablex)
+    with pytest.raises(AttributeError):
+        tablex.nope
@@ -0,0 +1,70 @@
+"""``tablex`` – batch table extraction over directories or file lists."""
+
+import argparse
+import sys
+
+from tablex.pipeline.batch import DEFAULT_PACK_BYTES, DEFAULT_PACK_FILES, run_batch
+from tablex.pipeline.document import DEFAULT_CHUNKSIZE
+from tablex.utils.log import configure, enable_console
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="tablex",
+        description="Run the table settings search on many PDFs and write one JSON line per page.",
+    )
+    parser.add_argument("inputs", nargs="+", help="PDF files, directories or @list files (one path per line)")
+    parser.add_argument("-o", "--output", required=True, help="JSONL output file")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: <output>.ckpt)")
+    parser.add_argument("--restart", action="store_true", help="ignore an existing checkpoint and start over")
+    parser.add_argument("-r", "--recursive", action="store_true", help="search directories recursively")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="pool size (default: CPU count, 0: no pool)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="pages per task for large files")
+    parser.add_argument("--pack-bytes", type=int, default=DEFAULT_PACK_BYTES,
+                        help="files below this size are packed into shared tasks")
+    parser.add_argument("--pack-files", type=int, default=DEFAULT_PACK_FILES, help="max files per packed task")
+    parser.add_argument("--sticky", action="store_true", help="try the previous page's preset first")
+    parser.add_argument("--no-text", action="store_true", help="skip cell text extraction")
+    parser.add_argument("--triage", action="store_true", help="skip pages that cannot hold a table")
+    parser.add_argument("--preset-stats", help="adaptive preset order backed by this JSON stats file")
+    parser.add_argument("--no-carry", action="store_true", help="do not carry explicit lines across pages")
+    parser.add_argument("--cache-dir", help="primitive cache directory")
+    parser.add_argument("--rss-limit-mb", type=float, default=None, help="per-process RSS ceiling")
+    parser.add_argument("--log", help='log spec, e.g. "INFO,scoring.search=DEBUG"')
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    if not args.quiet:
+        enable_console("INFO", "pipeline.batch")
+    if args.log:
+        configure(args.log)
+
+    stats = run_batch(
+        args.inputs,
+        args.output,
+        checkpoint=args.checkpoint,
+        restart=args.restart,
+        recursive=args.recursive,
+        max_workers=args.workers,
+        chunksize=args.chunksize,
+        pack_bytes=args.pack_bytes,
+        pack_files=args.pack_files,
+        carry_forward=not args.no_carry,
+        extract_text=not args.no_text,
+        sticky=args.sticky,
+        cache_dir=args.cache_dir,
+        rss_limit_mb=args.rss_limit_mb,
+        triage=args.triage,
+        preset_stats=args.preset_stats,
+    )
+    if not args.quiet:
+        print(
+            f"{stats.pages} pages from {stats.files} files "
+            f"({stats.skipped_files} already done, {stats.errors} errors)",
+            file=sys.stderr,
+        )
+    return 1 if stats.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
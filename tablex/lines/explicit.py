@@ -1,8 +1,14 @@
 from typing import Any, Iterable, List, Optional, Tuple
 
-from tablex.utils.cluster import cluster
-from tablex.utils.color import is_dark_and_greyscale_like
-from tablex.utils.debug import draw_lines_on_page_plus
+import numpy as np
+
+from tablex.utils.cluster import cluster, cluster_lists
+from tablex.utils.geometry import PageGeometry, ensure_geometry
+from tablex.utils.log import TRACE, get_logger
+from tablex.utils.overlay import Overlay, dump_overlay
+
+
+logger = get_logger(__name__)
 
 
 class ExplicitLineExtractor:
@@ -26,18 +32,25 @@ class ExplicitLineExtractor:
         page_rects: Optional[Iterable[Any]] = None,
         page_curves: Optional[Iterable[Any]] = None,
         dump_explicit: bool = False,
+        geometry: Optional[PageGeometry] = None,
     ) -> Tuple[List[float], List[float]]:
-        """Return clustered explicit vertical and horizontal lines."""
+        """Return clustered explicit vertical and horizontal lines.
+
+        *geometry* is a prebuilt `PageGeometry`; when omitted it is built once
+        from the page (or the ``page_*`` overrides) and shared by every step.
+        """
 
         cluster_tol = self.cluster_tol
+        if geometry is None:
+            geometry = PageGeometry.from_page(page, lines=page_lines, rects=page_rects, curves=page_curves)
 
-        print(f"[INFO] === Page {page.page_number} Start ===")
+        logger.debug("=== Page %s Start ===", page.page_number)
 
         raw_v: List[float] = []
         raw_h: List[float] = []
 
         # Step 1: 提取 page.lines 中结构性线段
-        ev0, eh0 = extract_lines_from_page_lines(page, lines=page_lines)
+        ev0, eh0 = extract_lines_from_page_lines(page, geometry=geometry)
         raw_v.extend(ev0)
         raw_h.extend(eh0)
 
@@ -47,35 +60,34 @@ class ExplicitLineExtractor:
             use_color_filter=self.use_color_filter,
             dump_log=self.dump_rects_log,
             rects=page_rects,
+            geometry=geometry,
         )
         raw_v.extend(ev1)
         raw_h.extend(eh1)
 
         # Step 3: 提取 page.curves 中近似直线
-        ev2, eh2 = extract_lines_from_page_curves(page, curves=page_curves)
+        ev2, eh2 = extract_lines_from_page_curves(page, curves=page_curves, geometry=geometry)
         raw_v.extend(ev2)
         raw_h.extend(eh2)
 
-        # Step 4: 坐标聚类处理，合并相近位置的线段
-        explicit_v = sorted(cluster(raw_v, cluster_tol=cluster_tol))
-        explicit_h = sorted(cluster(raw_h, cluster_tol=cluster_tol))
+        # Step 4: 坐标聚类处理，合并相近位置的线段（竖线/横线一次分段聚类）
+        explicit_v, explicit_h = cluster_lists([raw_v, raw_h], cluster_tol=cluster_tol)
 
         # Step 5: 判断是否缺少顶部横线，必要时补全
-        explicit_h_pdf_top = ensure_header_line(page, explicit_h, explicit_v, cluster_tol)
+        explicit_h_pdf_top = ensure_header_line(page, explicit_h, explicit_v, cluster_tol, geometry=geometry)
         explicit_h2 = sorted(cluster(explicit_h + explicit_h_pdf_top, cluster_tol=cluster_tol))
 
-        print(f"[INFO] explicit_v={explicit_v}; explicit_h={explicit_h2}")
-        print(f"[INFO] === Page {page.page_number} End ===")
+        logger.debug("explicit_v=%s; explicit_h=%s", explicit_v, explicit_h2)
+        logger.debug("=== Page %s End ===", page.page_number)
         if dump_explicit:
-            draw_lines_on_page_plus(page, explicit_v, explicit_h2)
+            dump_overlay(page, Overlay.from_page(page, explicit_v, explicit_h2, title="explicit"), "explicit")
 
         if (not explicit_v) or (not explicit_h2):
-            ev0, eh0 = extract_lines_from_page_lines(page, plus=True)
+            ev0, eh0 = extract_lines_from_page_lines(page, plus=True, geometry=geometry)
             raw_v.extend(ev0)
             raw_h.extend(eh0)
-            explicit_v = sorted(cluster(raw_v, cluster_tol=cluster_tol))
-            explicit_h2 = sorted(cluster(raw_h, cluster_tol=cluster_tol))
-            print("兼容")
+            explicit_v, explicit_h2 = cluster_lists([raw_v, raw_h], cluster_tol=cluster_tol)
+            logger.debug("兼容：使用 plus 回退")
 
         return explicit_v, explicit_h2
 
@@ -90,6 +102,7 @@ def extract_explicit_lines(
     page_lines: Optional[Iterable[Any]] = None,
     page_rects: Optional[Iterable[Any]] = None,
     page_curves: Optional[Iterable[Any]] = None,
+    geometry: Optional[PageGeometry] = None,
 ) -> Tuple[List[float], List[float]]:
     """
     主函数：融合提取结构性竖线/横线，并返回聚类后的 explicit_v/h。
@@ -98,7 +111,8 @@ def extract_explicit_lines(
         - page: pdfplumber 的页面对象
         - cluster_tol: 坐标聚类容差
         - use_color_filter: 是否使用颜色过滤，仅保留近黑色线
-        - dump_rects_log: 是否输出 rects 调试信息
+        - dump_rects_log: 是否输出 rects 调试信息（TRACE 级别）
+        - geometry: 预先构建的 PageGeometry（可选，避免重复遍历图元）
 
     输出：
         - explicit_v: 所有聚类后的竖线位置（升序）
@@ -115,6 +129,7 @@ def extract_explicit_lines(
         page_rects=page_rects,
         page_curves=page_curves,
         dump_explicit=dump_explicit,
+        geometry=geometry,
     )
 
 
@@ -122,33 +137,35 @@ def extract_lines_from_page_lines(
     page,
     lines: Optional[Iterable[Any]] = None,
     plus=False,
+    geometry: Optional[PageGeometry] = None,
 ) -> tuple[list[Any], list[Any]]:
     """
     提取 page.lines 中结构性横线（长）和竖线（高），返回坐标列表。
     横线条件：接近水平且长度 > 页宽 70%；竖线条件：接近竖直且高度 > 页高 25%
     """
     W, H = page.width, page.height
-    bucket_v, bucket_h = [], []
-    lines = list(page.lines if lines is None else lines)
-    for l in lines:
-        dx, dy = l["x1"] - l["x0"], l["y1"] - l["y0"]
-        length = (dx ** 2 + dy ** 2) ** 0.5  # 计算线段长度
-        if abs(dy) <= 2 and length >= W * 0.70:
-            # TODO|<TASK1>: 究竟是用 l["y0"] 还是 H - l["y0"] 这是个谜
-            bucket_h.append(H - l["y0"])  # 保留水平线 y 坐标
-        elif abs(dx) <= 2 and length >= H * 0.25:
-            bucket_v.append(l["x0"])  # 保留竖直线 x 坐标
-
-    if plus:  # 通过edges获取边框, 非必要
-        try:
-            if not bucket_h:
-                edge_h = [l["bottom"] for l in page.rects]
-                bucket_h = [max(edge_h), min(edge_h)]
-            if not bucket_v:
-                edge_v = [l["x0"] for l in page.rects]
-                bucket_v = [max(edge_v), min(edge_v)]
-        except ValueError:
+    if geometry is None:
+        geometry = PageGeometry.from_page(page, lines=lines, curves=[])
+    g = geometry
+
+    is_line = g.lines
+    dx, dy = g.dx, g.dy
+    long_h = is_line & (np.abs(dy) <= 2) & (g.length >= W * 0.70)
+    long_v = is_line & ~long_h & (np.abs(dx) <= 2) & (g.length >= H * 0.25)
+    # TODO|<TASK1>: 究竟是用 l["y0"] 还是 H - l["y0"] 这是个谜
+    bucket_h = (H - g.y0[long_h]).tolist()  # 保留水平线 y 坐标
+    bucket_v = g.x0[long_v].tolist()  # 保留竖直线 x 坐标
+
+    if plus and (not bucket_h or not bucket_v):  # 通过edges获取边框, 非必要
+        rects = g.rects
+        if not rects.any():
             raise RuntimeWarning("警告：此页没有表格！")
+        if not bucket_h:
+            edge_h = g.bottom[rects]
+            bucket_h = [float(edge_h.max()), float(edge_h.min())]
+        if not bucket_v:
+            edge_v = g.x0[rects]
+            bucket_v = [float(edge_v.max()), float(edge_v.min())]
     return bucket_v, bucket_h
 
 
@@ -160,65 +177,70 @@ def extract_lines_from_page_rects(
     power_draw=False,
     *,
     rects: Optional[Iterable[Any]] = None,
+    geometry: Optional[PageGeometry] = None,
 ) -> tuple[list[Any], list[Any]]:
     """
     提取 page.rects 中的结构线（粗竖线或长横线），返回坐标列表。
     条件：横线高度较小且长度 ≥ 页宽 75%；竖线宽度较小且高度 ≥ 页高 35%
     """
     W, H = page.width, page.height
-    bucket_v, bucket_h = [], []
-    rects = list(page.rects if rects is None else rects)
+    if geometry is None:
+        geometry = PageGeometry.from_page(page, lines=[], rects=rects, curves=[])
+    g = geometry
+
+    dump_log = dump_log and logger.isEnabledFor(TRACE)
+    if dump_log or simple_draw or power_draw:
+        rects = list(page.rects if rects is None else rects)
     if dump_log:
-        print(f"[DEBUG] page.rects：\n{rects}\n")
-
-    for ix, r in enumerate(page.rects):
-        rw, rh = r["x1"] - r["x0"], r["y1"] - r["y0"]  # 计算矩形宽高
-        color = r.get("non_stroking_color", 0.0)
-        if dump_log and (simple_draw or power_draw):
-            print([rw, rh], r["x0"], r["y0"], r["x1"], r["y1"])
-
-        if simple_draw:
-            im = page.to_image().draw_rect(r, stroke="blue", fill="red")
-            # im.show()
-        elif power_draw:
-            bbox = (r["x0"], r["top"], r["x1"], r["bottom"])  # 注意y轴方向不同
-            im = page.to_image()
-            im.draw.rectangle(bbox, outline="red", width=3)
-            # im.show()
-
-        if use_color_filter and (not is_dark_and_greyscale_like(color)):
-            continue  # 跳过非黑色边框
-
-        # 策略1,使用debug决定：没有效果
-        #     if (0.5 <= rh) and (rw >= W * 0.55):
-        #         bucket_h.extend([r["y0"], r["y1"]])  # 横线 y 坐标
-        #     elif (0.5 <= rw) and (rh >= H * 0.35):
-        #         bucket_v.extend([r["x0"], r["x1"]])  # 竖线 x 坐标
-        # return bucket_v, bucket_h
-
-        # 策略2,使用debug决定：page.rects属于点-线融合
-        # TODO|<TASK1>: 究竟是用 [r["y0"], r["y1"]] 还是 [H - r["y0"], H - r["y1"]] 这是个谜
-        bucket_h.extend([H - r["y0"], H - r["y1"]])  # 横线 y 坐标
-        bucket_v.extend([r["x0"], r["x1"]])  # 竖线 x 坐标
-    return cluster(bucket_v), cluster(bucket_h)
+        logger.log(TRACE, "page.rects：\n%s", rects)
+        for r in rects:
+            rw, rh = r["x1"] - r["x0"], r["y1"] - r["y0"]  # 计算矩形宽高
+            logger.log(TRACE, "%s %s %s %s %s", [rw, rh], r["x0"], r["y0"], r["x1"], r["y1"])
+
+    if simple_draw or power_draw:
+        # 整页只画一次：simple_draw 输出矢量 SVG，power_draw 输出栅格 PNG（每页只栅格化一次）
+        overlay = Overlay.from_page(page, rects=rects, title="page.rects")
+        dump_overlay(page, overlay, "rects", "svg" if simple_draw else "png")
+
+    keep = g.rects
+    if use_color_filter:
+        keep = keep & g.fill_dark  # 跳过非黑色边框
+
+    # 策略1,使用debug决定：没有效果
+    #     if (0.5 <= rh) and (rw >= W * 0.55):
+    #         bucket_h.extend([r["y0"], r["y1"]])  # 横线 y 坐标
+    #     elif (0.5 <= rw) and (rh >= H * 0.35):
+    #         bucket_v.extend([r["x0"], r["x1"]])  # 竖线 x 坐标
+    # return bucket_v, bucket_h
+
+    # 策略2,使用debug决定：page.rects属于点-线融合
+    # TODO|<TASK1>: 究竟是用 [r["y0"], r["y1"]] 还是 [H - r["y0"], H - r["y1"]] 这是个谜
+    bucket_h = np.concatenate([H - g.y0[keep], H - g.y1[keep]])  # 横线 y 坐标
+    bucket_v = np.concatenate([g.x0[keep], g.x1[keep]])  # 竖线 x 坐标
+    v_lines, h_lines = cluster_lists([bucket_v, bucket_h])
+    return v_lines, h_lines
 
 
 def extract_lines_from_page_curves(
     page,
     curves: Optional[Iterable[Any]] = None,
+    geometry: Optional[PageGeometry] = None,
 ) -> tuple[list[Any], list[Any]]:
     """
     提取 page.curves 中近似水平或竖直的曲线段，返回坐标列表。
     """
-    curves = list(getattr(page, "curves", []) if curves is None else curves)
-    print(f"[DEBUG] page.curves：\n{curves}\n")
-    bucket_v, bucket_h = [], []
-    for c in curves:
-        if abs(c["x1"] - c["x0"]) < 1:
-            bucket_v.extend([c["x0"], c["x1"]])  # 近似竖线
-        if abs(c["y1"] - c["y0"]) < 1:
-            bucket_h.extend([c["y0"], c["y1"]])  # 近似横线
-    return bucket_v, bucket_h
+    if geometry is None:  # 预先构建的 geometry 已含曲线，无需再读 page.curves
+        curves = list(getattr(page, "curves", []) if curves is None else curves)
+        logger.log(TRACE, "page.curves：\n%s", curves)
+        geometry = PageGeometry.from_page(page, lines=[], rects=[], curves=curves)
+    g = geometry
+
+    is_curve = g.curves
+    near_v = is_curve & (np.abs(g.dx) < 1)  # 近似竖线
+    near_h = is_curve & (np.abs(g.dy) < 1)  # 近似横线
+    bucket_v = np.column_stack([g.x0[near_v], g.x1[near_v]]).ravel()
+    bucket_h = np.column_stack([g.y0[near_h], g.y1[near_h]]).ravel()
+    return bucket_v.tolist(), bucket_h.tolist()
 
 
 def ensure_header_line(
@@ -226,6 +248,7 @@ def ensure_header_line(
     explicit_h: List[float],
     explicit_v: List[float],
     cluster_tol: float,
+    geometry: Optional[PageGeometry] = None,
 ) -> List[float]:
     """
     检查是否缺失表头横线，若缺失则通过：
@@ -234,6 +257,7 @@ def ensure_header_line(
       3）第一列文字 bottom 推断
     """
     H = page.height
+    g = ensure_geometry(page, geometry)
     # 底部判断器，使用 draw_lines_on_page_plus(page, v_lines=[], h_lines=[y_min, y_max])
     # y_min, y_max = H * 0.80, H * 0.95
     # footer_missing = all(not (y_min <= y <= y_max) for y in explicit_h)
@@ -241,37 +265,36 @@ def ensure_header_line(
     # 顶部判断器，使用 draw_lines_on_page_plus(page, v_lines=[], h_lines=[y_min, y_max])
     y_min, y_max = H * 0.1, H * 0.2
     header_missing = all(not (y_min <= y <= y_max) for y in explicit_h)
-    print(f"[DEBUG] 表头线缺失：{header_missing}")
+    logger.debug("表头线缺失：%s", header_missing)
 
     if not header_missing or not explicit_h:
         return []
 
     bottom_y = min(explicit_h)  # 底部横线位置
     bottom_len = None
-    for l in page.lines:
-        if abs(l["y0"] - bottom_y) < cluster_tol:
-            dx, dy = l["x1"] - l["x0"], l["y1"] - l["y0"]
-            bottom_len = (dx ** 2 + dy ** 2) ** 0.5  # 计算底部线段长度
-            break
+    hits = np.flatnonzero(g.lines & (np.abs(g.y0 - bottom_y) < cluster_tol))
+    if hits.size:
+        bottom_len = float(g.length[hits[0]])  # 计算底部线段长度
 
     if bottom_len:
-        print(f"[INFO] Found bottom line length = {bottom_len:.2f}")
+        logger.debug("Found bottom line length = %.2f", bottom_len)
     else:
-        print(f"[WARN] Failed to find bottom line length")
+        logger.debug("Failed to find bottom line length")
 
+    rect_ix = np.flatnonzero(g.rects)
     if bottom_len:
-        left_rect = min(page.rects, key=lambda r: r["x0"], default=None)
-        if left_rect:
-            header_y = left_rect["y1"]
-            header_x = left_rect["x0"]
-            print(f"[INFO] Use rect(x={header_x:.2f}, y={header_y:.2f}) + len={bottom_len:.2f} to synth header")
+        if rect_ix.size:
+            left_ix = rect_ix[np.argmin(g.x0[rect_ix])]
+            header_y = float(g.y1[left_ix])
+            header_x = float(g.x0[left_ix])
+            logger.debug("Use rect(x=%.2f, y=%.2f) + len=%.2f to synth header", header_x, header_y, bottom_len)
             explicit_h.append(header_y)
             return sorted(cluster(explicit_h, cluster_tol=cluster_tol))
 
-    if page.rects:
-        r_max = max(page.rects, key=lambda r: (r["x1"] - r["x0"]) * (r["y1"] - r["y0"]))
-        fallback_y = r_max["y1"]  # 表示最大矩形的底边位置
-        print(f"[INFO] Fallback: Use max rect y1={fallback_y:.2f} as header line")
+    if rect_ix.size:
+        area = g.dx[rect_ix] * g.dy[rect_ix]
+        fallback_y = float(g.y1[rect_ix[np.argmax(area)]])  # 表示最大矩形的底边位置
+        logger.debug("Fallback: Use max rect y1=%.2f as header line", fallback_y)
         explicit_h.append(fallback_y)
         return sorted(cluster(explicit_h, cluster_tol=cluster_tol))
 
@@ -280,7 +303,7 @@ def ensure_header_line(
         col_chars = [c for c in page.chars if c["x0"] <= limit]
         if col_chars:
             inferred_line = max(c["bottom"] for c in col_chars) + 1.0
-            print(f"[INFO] Fallback line from char bottom: {inferred_line:.2f}")
+            logger.debug("Fallback line from char bottom: %.2f", inferred_line)
             return [inferred_line]
 
     return explicit_h
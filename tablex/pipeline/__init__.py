@@ -0,0 +1,38 @@
+"""Document-level pipeline utilities.
+
+This package fans single-page routines out over whole PDF documents.
+Names are resolved lazily (PEP 562); ``import tablex.pipeline.batch``
+does not pull in the asyncio, writer or stitching modules.
+"""
+from typing import TYPE_CHECKING
+
+from tablex.utils.lazy import attach
+
+
+_LAZY = {
+    "ArrowTableWriter": ".writers",
+    "CsvTableWriter": ".writers",
+    "ParquetTableWriter": ".writers",
+    "open_writer": ".writers",
+    "aextract_document": ".aio",
+    "aiter_document": ".aio",
+    "DocumentSession": ".session",
+    "LogicalTable": ".stitch",
+    "TableStitcher": ".stitch",
+    "stitch_document": ".stitch",
+    "stitch_results": ".stitch",
+    "extract_document": ".document",
+    "PageResult": ".document",
+    "TableResult": ".document",
+}
+
+__all__ = list(_LAZY)
+__getattr__, __dir__ = attach(__name__, _LAZY)
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .aio import aextract_document, aiter_document
+    from .document import PageResult, TableResult, extract_document
+    from .session import DocumentSession
+    from .stitch import LogicalTable, TableStitcher, stitch_document, stitch_results
+    from .writers import ArrowTableWriter, CsvTableWriter, ParquetTableWriter, open_writer
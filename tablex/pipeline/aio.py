@@ -0,0 +1,163 @@
+"""
+asyncio front-end for the document pipeline.
+
+`aiter_document` is the async counterpart of `extract_document`: chunks of
+pages run in an executor (a private `ProcessPoolExecutor` by default, or
+any `concurrent.futures.Executor` passed in), an `asyncio.Semaphore` caps
+the number of chunks in flight, and every `PageResult` is delivered as soon
+as its chunk finishes, so downstream stages start before the document is
+done.  `aextract_document` collects the stream into a list.
+
+Each executor task opens the document itself, so the same task function
+works for thread and process executors; ``chunksize`` amortises the open.
+Cancelling the consumer (or leaving the ``async for`` early) cancels every
+chunk that has not started yet; chunks already running in a process are
+left to finish and their results discarded.
+
+>>> async for result in aiter_document("statement.pdf", max_workers=4):
+...     await sink.put(result)
+"""
+
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
+
+from tablex.pipeline.document import (
+    DEFAULT_CHUNKSIZE,
+    PageResult,
+    _chunked,
+    _open_source,
+    process_pages,
+)
+from tablex.utils.log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _page_count(path: str, open_kwargs: Dict[str, Any], cache_dir: Optional[str]) -> int:
+    with _open_source(path, open_kwargs, cache_dir) as pdf:
+        return len(pdf.pages)
+
+
+def _run_path_chunk(
+    path: str,
+    open_kwargs: Dict[str, Any],
+    cache_dir: Optional[str],
+    page_indices: Sequence[int],
+    carry_forward: bool,
+    extract_text: bool,
+    sticky: bool,
+    rss_limit_mb: Optional[float],
+    triage: bool = False,
+    preset_stats: Optional[str] = None,
+) -> List[PageResult]:
+    """Executor task: open the document, process one chunk, close it."""
+    with _open_source(path, open_kwargs, cache_dir) as pdf:
+        return process_pages(
+            pdf, page_indices, carry_forward=carry_forward, extract_text=extract_text,
+            sticky=sticky, rss_limit_mb=rss_limit_mb, triage=triage, preset_stats=preset_stats,
+        )
+
+
+async def aiter_document(
+    path: str,
+    pages: Optional[Iterable[int]] = None,
+    *,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_in_flight: Optional[int] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    ordered: bool = True,
+    carry_forward: bool = True,
+    extract_text: bool = True,
+    sticky: bool = False,
+    open_kwargs: Optional[Dict[str, Any]] = None,
+    cache_dir: Optional[str] = None,
+    rss_limit_mb: Optional[float] = None,
+    triage: bool = False,
+    preset_stats: Optional[str] = None,
+) -> AsyncIterator[PageResult]:
+    """Yield the `PageResult` of every page of *path* without blocking the loop.
+
+    Parameters
+    ----------
+    executor:
+        Where the CPU work runs.  ``None`` creates a `ProcessPoolExecutor`
+        with *max_workers* processes, shut down when the stream ends.  A
+        caller-owned executor is left running.
+    max_workers:
+        Size of the own pool, and the worker count the default
+        *max_in_flight* is derived from – pass it alongside a caller-owned
+        *executor* (its size is not inspected); defaults to
+        ``os.cpu_count()``.
+    max_in_flight:
+        Chunks submitted but not yet consumed (default ``2 × max_workers``).
+        Ignored when *semaphore* is given.
+    semaphore:
+        Shared limiter, e.g. one semaphore for all documents of a service.
+        One permit is held per chunk from submission until its results
+        have been yielded.
+
+    The remaining parameters mean the same as in `extract_document`.
+    """
+    open_kwargs = dict(open_kwargs or {})
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    cache_dir = cache_dir and str(cache_dir)
+    path = str(path)
+
+    loop = asyncio.get_running_loop()
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    workers = max_workers or os.cpu_count() or 1
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(max_in_flight or 2 * workers, 1))
+
+    pending: deque = deque()
+    try:
+        if pages is None:
+            n = await loop.run_in_executor(executor, _page_count, path, open_kwargs, cache_dir)
+            indices = list(range(n))
+        else:
+            indices = sorted(set(pages))
+        todo = deque(_chunked(indices, chunksize))
+        task = partial(_run_path_chunk, path, open_kwargs, cache_dir)
+        task_args = (carry_forward, extract_text, sticky, rss_limit_mb, triage, preset_stats and str(preset_stats))
+
+        while todo or pending:
+            # never block on the semaphore while own results are waiting
+            while todo and (not pending or not semaphore.locked()):
+                await semaphore.acquire()
+                pending.append(loop.run_in_executor(executor, task, todo.popleft(), *task_args))
+
+            if ordered:
+                results = await pending[0]
+                pending.popleft()
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                fut = next(f for f in pending if f in done)
+                pending.remove(fut)
+                results = fut.result()
+            semaphore.release()
+
+            for result in results:
+                yield result
+    finally:
+        for fut in pending:
+            fut.cancel()
+            semaphore.release()
+        if pending:
+            logger.debug("cancelled %d pending chunks of %s", len(pending), path)
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aextract_document(path: str, pages: Optional[Iterable[int]] = None, **kwargs: Any) -> List[PageResult]:
+    """Collect `aiter_document` into a list (same keyword arguments)."""
+    return [result async for result in aiter_document(path, pages, **kwargs)]
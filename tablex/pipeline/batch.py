@@ -0,0 +1,317 @@
+"""
+Batch runner over many PDF files.
+
+`run_batch` expands directories / list files into PDF paths, plans worker
+tasks, runs them over a process pool and appends one JSON line per page
+(``{"file": ..., **PageResult.to_dict()}``) to an output file.
+
+* **Packing** – files smaller than ``pack_bytes`` are grouped into one
+  task (up to ``pack_files`` files), so pool and ``pdfplumber.open``
+  overhead is shared by many tiny PDFs.  Larger files are split into
+  ``chunksize``-page tasks.
+* **Checkpointing** – after the results of a whole task are written and
+  synced (one ``fsync``), the completed ``(file, pages)`` pairs of all its
+  slices are appended to a `Checkpoint` (one more ``fsync``).  A rerun
+  with the same checkpoint skips every recorded page, so a killed job
+  resumes where it stopped.  Results are written
+  before the checkpoint, so a crash in between can duplicate, never lose,
+  pages.
+
+Files that fail to open or process produce an ``{"file", "error"}`` line
+and are retried on the next run.
+"""
+
+import json
+import os
+import pathlib
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from tablex.pipeline.document import DEFAULT_CHUNKSIZE, PageResult, _chunked, _open_source, process_pages
+from tablex.utils.log import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_PACK_BYTES = 1 << 20
+DEFAULT_PACK_FILES = 64
+
+
+@dataclass(frozen=True, slots=True)
+class WorkItem:
+    """One file slice of a task; ``pages=None`` means every page not in *skip*."""
+
+    path: str
+    pages: Optional[Tuple[int, ...]] = None
+    skip: Tuple[int, ...] = ()
+
+
+@dataclass(slots=True)
+class ItemResult:
+    path: str
+    total: Optional[int]
+    results: List[PageResult] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class BatchStats:
+    files: int = 0
+    tasks: int = 0
+    pages: int = 0
+    skipped_files: int = 0
+    errors: int = 0
+
+
+class Checkpoint:
+    """Append-only JSONL record of completed ``(file, page)`` pairs.
+
+    Each line is ``{"file": path, "pages": [...], "total": n}``; a torn last
+    line (job killed mid-write) is ignored on load.
+    """
+
+    def __init__(self, path) -> None:
+        self.path = pathlib.Path(path)
+        self.done: Dict[str, Set[int]] = {}
+        self.totals: Dict[str, int] = {}
+        if self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        with self.path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    logger.warning("ignoring damaged checkpoint line in %s", self.path)
+                    continue
+                self.done.setdefault(rec["file"], set()).update(rec["pages"])
+                if rec.get("total") is not None:
+                    self.totals[rec["file"]] = rec["total"]
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self.done.values())
+
+    def pages_done(self, path: str) -> Set[int]:
+        return self.done.get(path, set())
+
+    def is_complete(self, path: str) -> bool:
+        total = self.totals.get(path)
+        return total is not None and len(self.pages_done(path)) >= total
+
+    def record(self, path: str, pages: Iterable[int], total: Optional[int]) -> None:
+        self.record_many([(path, pages, total)])
+
+    def record_many(self, entries: Iterable[Tuple[str, Iterable[int], Optional[int]]]) -> None:
+        """Append ``(path, pages, total)`` records with a single ``fsync``."""
+        lines = []
+        for path, pages, total in entries:
+            pages = sorted(pages)
+            self.done.setdefault(path, set()).update(pages)
+            if total is not None:
+                self.totals[path] = total
+            lines.append(json.dumps({"file": path, "pages": pages, "total": total}) + "\n")
+        if not lines:
+            return
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.writelines(lines)
+            fh.flush()
+            os.fsync(fh.fileno())
+
+
+# ------------------------------------------------------------------- #
+# 1.   Planning
+# ------------------------------------------------------------------- #
+
+def discover_pdfs(inputs: Iterable[str], recursive: bool = False) -> List[str]:
+    """Absolute PDF paths from files, directories and ``@list`` files (one path per line)."""
+    found: Dict[str, None] = {}
+    for item in inputs:
+        item = str(item)
+        if item.startswith("@"):
+            lines = pathlib.Path(item[1:]).read_text(encoding="utf-8").splitlines()
+            paths = [pathlib.Path(s.strip()) for s in lines if s.strip() and not s.lstrip().startswith("#")]
+        elif os.path.isdir(item):
+            pattern = "**/*" if recursive else "*"
+            paths = sorted(p for p in pathlib.Path(item).glob(pattern) if p.suffix.lower() == ".pdf" and p.is_file())
+        else:
+            paths = [pathlib.Path(item)]
+        for p in paths:
+            found.setdefault(os.path.abspath(p), None)
+    return list(found)
+
+
+def plan_tasks(
+    files: Iterable[str],
+    checkpoint: Optional[Checkpoint] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    pack_bytes: int = DEFAULT_PACK_BYTES,
+    pack_files: int = DEFAULT_PACK_FILES,
+    open_kwargs: Optional[Dict[str, Any]] = None,
+    cache_dir: Optional[str] = None,
+) -> Tuple[List[List[WorkItem]], int]:
+    """Group *files* into worker tasks; returns ``(tasks, n_skipped_files)``."""
+    open_kwargs = dict(open_kwargs or {})
+    tasks: List[List[WorkItem]] = []
+    pack: List[WorkItem] = []
+    pack_size = 0
+    skipped = 0
+    for path in files:
+        done = checkpoint.pages_done(path) if checkpoint else set()
+        if checkpoint and checkpoint.is_complete(path):
+            skipped += 1
+            continue
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size < pack_bytes:
+            pack.append(WorkItem(path, skip=tuple(sorted(done))))
+            pack_size += size
+            if pack_size >= pack_bytes or len(pack) >= pack_files:
+                tasks.append(pack)
+                pack, pack_size = [], 0
+            continue
+        try:
+            with _open_source(path, open_kwargs, cache_dir) as pdf:
+                n_pages = len(pdf.pages)
+        except Exception:  # reported by the worker
+            tasks.append([WorkItem(path, skip=tuple(sorted(done)))])
+            continue
+        todo = [i for i in range(n_pages) if i not in done]
+        tasks.extend([WorkItem(path, pages=tuple(chunk))] for chunk in _chunked(todo, chunksize))
+    if pack:
+        tasks.append(pack)
+    return tasks, skipped
+
+
+# ------------------------------------------------------------------- #
+# 2.   Worker
+# ------------------------------------------------------------------- #
+
+def run_task(items: List[WorkItem], options: Dict[str, Any]) -> List[ItemResult]:
+    """Process every slice of one task; failures are reported, not raised.
+
+    Table-free pages are ordinary (empty) page results – see `process_page` –
+    so an error line means the file itself could not be processed.
+    """
+    out = []
+    for item in items:
+        try:
+            with _open_source(item.path, options.get("open_kwargs") or {}, options.get("cache_dir")) as pdf:
+                total = len(pdf.pages)
+                if item.pages is not None:
+                    indices = list(item.pages)
+                else:
+                    skip = set(item.skip)
+                    indices = [i for i in range(total) if i not in skip]
+                results = process_pages(
+                    pdf, indices,
+                    carry_forward=options.get("carry_forward", True),
+                    extract_text=options.get("extract_text", True),
+                    sticky=options.get("sticky", False),
+                    rss_limit_mb=options.get("rss_limit_mb"),
+                    triage=options.get("triage", False),
+                    preset_stats=options.get("preset_stats"),
+                )
+            out.append(ItemResult(item.path, total, results))
+        except Exception as exc:
+            logger.warning("%s: %s", item.path, exc)
+            out.append(ItemResult(item.path, None, error=f"{type(exc).__name__}: {exc}"))
+    return out
+
+
+# ------------------------------------------------------------------- #
+# 3.   Driver
+# ------------------------------------------------------------------- #
+
+def _iter_task_results(tasks, options, max_workers, max_in_flight):
+    if max_workers == 0:
+        for task in tasks:
+            yield run_task(task, options)
+        return
+
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    in_flight = max(max_in_flight or 2 * workers, 1)
+    todo = deque(tasks)
+    pending: Set = set()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            while todo or pending:
+                while todo and len(pending) < in_flight:
+                    pending.add(executor.submit(run_task, todo.popleft(), options))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield fut.result()
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+
+def run_batch(
+    inputs: Iterable[str],
+    output,
+    *,
+    checkpoint=None,
+    restart: bool = False,
+    recursive: bool = False,
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    pack_bytes: int = DEFAULT_PACK_BYTES,
+    pack_files: int = DEFAULT_PACK_FILES,
+    carry_forward: bool = True,
+    extract_text: bool = True,
+    sticky: bool = False,
+    open_kwargs: Optional[Dict[str, Any]] = None,
+    cache_dir: Optional[str] = None,
+    rss_limit_mb: Optional[float] = None,
+    triage: bool = False,
+    preset_stats: Optional[str] = None,
+) -> BatchStats:
+    """Process every PDF under *inputs* into the JSONL file *output*.
+
+    *checkpoint* defaults to ``<output>.ckpt``.  With an existing checkpoint
+    the output is appended to; ``restart=True`` discards both first.
+    ``max_workers=0`` runs in the current process.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    output = pathlib.Path(output)
+    ckpt_path = pathlib.Path(checkpoint) if checkpoint else output.with_name(output.name + ".ckpt")
+    if restart and ckpt_path.exists():
+        ckpt_path.unlink()
+    ckpt = Checkpoint(ckpt_path)
+    resume = len(ckpt) > 0
+    if resume:
+        logger.info("resuming: %d pages already done (%s)", len(ckpt), ckpt_path)
+
+    cache_dir = cache_dir and str(cache_dir)
+    files = discover_pdfs(inputs, recursive=recursive)
+    tasks, skipped = plan_tasks(files, ckpt, chunksize, pack_bytes, pack_files, open_kwargs, cache_dir)
+    stats = BatchStats(files=len(files), tasks=len(tasks), skipped_files=skipped)
+    logger.info("%d files, %d tasks (%d files already complete)", len(files), len(tasks), skipped)
+
+    options = dict(
+        carry_forward=carry_forward, extract_text=extract_text, sticky=sticky,
+        open_kwargs=dict(open_kwargs or {}), cache_dir=cache_dir, rss_limit_mb=rss_limit_mb,
+        triage=triage, preset_stats=preset_stats and str(preset_stats),
+    )
+    with output.open("a" if resume else "w", encoding="utf-8") as out:
+        for item_results in _iter_task_results(tasks, options, max_workers, max_in_flight):
+            done = []
+            for item in item_results:
+                if item.error is not None:
+                    stats.errors += 1
+                    out.write(json.dumps({"file": item.path, "error": item.error}, ensure_ascii=False) + "\n")
+                    continue
+                for result in item.results:
+                    out.write(json.dumps({"file": item.path, **result.to_dict()}, ensure_ascii=False) + "\n")
+                done.append((item.path, [r.page_number - 1 for r in item.results], item.total))
+                stats.pages += len(item.results)
+            # one sync per task: results are durable before any of its pages is checkpointed
+            out.flush()
+            if done:
+                os.fsync(out.fileno())
+                ckpt.record_many(done)
+            logger.info("%d pages written", stats.pages)
+    return stats
@@ -0,0 +1,447 @@
+"""
+Process-pool document pipeline.
+
+`extract_document` opens the PDF once per worker process, spreads page
+indices over a `ProcessPoolExecutor` in chunks and yields one
+`PageResult` per page, either in page order or as chunks complete.
+
+Within a chunk, pages are processed sequentially and the explicit lines
+detected on a page are handed to the following pages through the
+``first_page_explicit_v/_h`` arguments of `search_best_table_settings`,
+until a page detects its own or `CARRY_PAGES` pages have passed.  The
+carry depends only on the lines detected on earlier pages (never on which
+preset won), so the first page of every chunk is seeded by walking back
+over at most `CARRY_PAGES` pages and gets exactly the lines it would get
+inside a chunk: ``chunksize`` and ``max_workers`` do not change results
+(with ``sticky=True`` the session itself still lives for one chunk).
+
+With ``sticky=True`` every chunk runs through one `DocumentSession`, which
+re-tries the previous page's winning preset before the full sweep.
+
+Memory stays bounded on long documents: every page is closed (its layout
+cache released) as soon as its `PageResult` is materialised, at most
+``max_in_flight`` chunks are pending at a time, an optional RSS ceiling
+is enforced per process, and pool workers can be recycled after a number
+of pages or once they grow past a size.
+"""
+
+import gc
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pdfplumber
+
+from tablex.lines import extract_explicit_lines
+from tablex.pipeline.session import DocumentSession, column_xs
+from tablex.scoring import search_best_table_settings
+from tablex.scoring.adaptive import AdaptiveOrder
+from tablex.scoring.triage import triage_page
+from tablex.utils.log import get_logger
+from tablex.utils.memory import MemoryLimitExceeded, rss_mb
+from tablex.utils.page_cache import PageSource, PrimitiveCache
+from tablex.utils.table_text import extract_tables
+
+
+logger = get_logger(__name__)
+
+DEFAULT_CHUNKSIZE = 8
+CARRY_PAGES = 8  # line-free pages an explicit line set is carried over
+
+
+@dataclass(slots=True)
+class TableResult:
+    """Materialised table: bbox plus the rows ``Table.extract()`` would return."""
+
+    bbox: Tuple[float, float, float, float]
+    rows: List[List[Optional[str]]] = field(default_factory=list)
+    columns: List[float] = field(default_factory=list)  # column boundaries (cell x0s + right edge)
+
+
+@dataclass(slots=True)
+class PageResult:
+    """Picklable per-page outcome of `search_best_table_settings`."""
+
+    page_number: int
+    preset: Optional[str]
+    strategy: Tuple[Optional[str], Optional[str]]
+    settings: Optional[Dict[str, Any]]
+    tables: List[TableResult]
+    explicit_v: List[float]
+    explicit_h: List[float]
+    reused_preset: bool = False
+    page_height: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# ------------------------------------------------------------------- #
+# 1.   Per-page / per-chunk work (runs inside the worker)
+# ------------------------------------------------------------------- #
+
+def process_page(
+    page,
+    carry_v: Optional[List[float]] = None,
+    carry_h: Optional[List[float]] = None,
+    extract_text: bool = True,
+    debug: bool = False,
+    session: Optional[DocumentSession] = None,
+    triage: bool = False,
+    order: Optional[AdaptiveOrder] = None,
+    explicit_lines: Optional[Tuple[List[float], List[float]]] = None,
+) -> PageResult:
+    """Search the best settings for *page* and materialise the result.
+
+    *explicit_lines* takes the page's precomputed `extract_explicit_lines`
+    output.  A page without any rule or rect (“此页没有表格”) yields an
+    empty result instead of aborting the document.
+    """
+    try:
+        if session is not None:
+            name, strat, cfg, tables, ev, eh = session.search(page, carry_v, carry_h, explicit_lines=explicit_lines)
+        else:
+            name, strat, cfg, tables, ev, eh = search_best_table_settings(
+                page,
+                first_page_explicit_v=carry_v,
+                first_page_explicit_h=carry_h,
+                debug=debug,
+                explicit_lines=explicit_lines,
+                triage=triage,
+                order=order,
+            )
+    except RuntimeWarning:  # “此页没有表格”
+        name, strat, cfg, tables, ev, eh = None, (None, None), None, [], [], []
+    return page_result(page, (name, strat, cfg, tables, ev, eh), extract_text, session is not None and session.last_hit)
+
+
+def page_result(page, result: Tuple, extract_text: bool = True, reused_preset: bool = False) -> PageResult:
+    """Materialise a `search_best_table_settings` tuple of *page* as a `PageResult`."""
+    name, strat, cfg, tables, ev, eh = result
+    rows = extract_tables(tables, page) if extract_text else [[] for _ in tables]
+    return PageResult(
+        page_number=page.page_number,
+        preset=name,
+        strategy=strat,
+        settings=cfg,
+        tables=[
+            TableResult(bbox=tuple(tbl.bbox), rows=r, columns=column_xs([tbl])) for tbl, r in zip(tables, rows)
+        ],
+        explicit_v=list(ev),
+        explicit_h=list(eh),
+        reused_preset=reused_preset,
+        page_height=float(page.height),
+    )
+
+
+def _page_lines(page, triage: bool = False) -> Optional[Tuple[List[float], List[float]]]:
+    """`extract_explicit_lines` of *page*; ``None`` when triage or “此页没有表格” rules it out."""
+    if triage and not triage_page(page).possible:
+        return None
+    try:
+        return extract_explicit_lines(page, dump_rects_log=False)
+    except RuntimeWarning:  # “此页没有表格”: nothing to carry
+        return None
+
+
+@dataclass(slots=True)
+class _Carry:
+    """Explicit lines handed to the next page, in ``first_page_explicit_v/_h`` form."""
+
+    v: Optional[List[float]] = None
+    h: Optional[List[float]] = None
+    v_age: int = 0  # pages since *v* / *h* were detected
+    h_age: int = 0
+
+    def push(self, page_height: float, lines: Optional[Tuple[List[float], List[float]]]) -> None:
+        """Account one page and the explicit lines detected on it."""
+        explicit_v, explicit_h_img = lines or ([], [])
+        if len(explicit_v) >= 2:
+            self.v, self.v_age = list(explicit_v), 0
+        elif self.v is not None:
+            self.v_age += 1
+            if self.v_age >= CARRY_PAGES:
+                self.v = None
+        if explicit_h_img:
+            self.h, self.h_age = [page_height - y for y in explicit_h_img], 0
+        elif self.h is not None:
+            self.h_age += 1
+            if self.h_age >= CARRY_PAGES:
+                self.h = None
+
+    @classmethod
+    def seed(cls, pdf, ix: int, triage: bool = False) -> "_Carry":
+        """Carry for page *ix*, rebuilt from the (at most `CARRY_PAGES`) pages before it."""
+        carry = cls()
+        found_v = found_h = False
+        for back in range(1, min(ix, CARRY_PAGES) + 1):
+            page = pdf.pages[ix - back]
+            explicit_v, explicit_h_img = _page_lines(page, triage) or ([], [])
+            if not found_v and len(explicit_v) >= 2:
+                carry.v, carry.v_age, found_v = list(explicit_v), back - 1, True
+            if not found_h and explicit_h_img:
+                carry.h, carry.h_age, found_h = [page.height - y for y in explicit_h_img], back - 1, True
+            page.close()
+            if found_v and found_h:
+                break
+        return carry
+
+
+def _enforce_rss(pdf, rss_limit_mb: Optional[float]) -> None:
+    """Release document-level caches when over *rss_limit_mb*; raise if that is not enough."""
+    if rss_limit_mb is None:
+        return
+    rss = rss_mb()
+    if rss is None or rss <= rss_limit_mb:
+        return
+    logger.info("RSS %.0f MiB above %.0f MiB: flushing document caches", rss, rss_limit_mb)
+    pdf.flush_cache()
+    gc.collect()
+    rss = rss_mb()
+    if rss is not None and rss > rss_limit_mb:
+        raise MemoryLimitExceeded(f"RSS {rss:.0f} MiB exceeds the {rss_limit_mb:.0f} MiB ceiling")
+
+
+def iter_pages(
+    pdf,
+    page_indices: Sequence[int],
+    carry_forward: bool = True,
+    extract_text: bool = True,
+    debug: bool = False,
+    sticky: bool = False,
+    rss_limit_mb: Optional[float] = None,
+    triage: bool = False,
+    preset_stats: Optional[str] = None,
+) -> Iterator[PageResult]:
+    """Process *page_indices* of an open pdf one by one, carrying lines forward.
+
+    Every page is closed right after its result is materialised, so only
+    the `PageResult` (no ``Table`` / page references) outlives it.  With
+    *preset_stats* the presets run in `AdaptiveOrder` of that stats file,
+    which is updated when the generator finishes.
+    """
+    order = AdaptiveOrder.open(preset_stats) if preset_stats else None
+    try:
+        yield from _iter_pages(pdf, page_indices, carry_forward, extract_text, debug, sticky, rss_limit_mb, triage, order)
+    finally:
+        if order is not None:
+            order.save()
+
+
+def _iter_pages(pdf, page_indices, carry_forward, extract_text, debug, sticky, rss_limit_mb, triage, order):
+    """Body of `iter_pages` with the `AdaptiveOrder` already opened."""
+    session = DocumentSession(debug=debug, triage=triage, order=order) if sticky else None
+    carry = _Carry()
+
+    prev_ix = None
+    for ix in page_indices:
+        if carry_forward and ix != (prev_ix if prev_ix is not None else -1) + 1:
+            # 块首页或非连续页：从前面的页重新播种
+            carry = _Carry.seed(pdf, ix, triage)
+
+        if session is not None and prev_ix is not None and ix != prev_ix + 1:
+            session.reset()
+        page = pdf.pages[ix]
+        lines = _page_lines(page, triage) if carry_forward else None
+        result = process_page(
+            page, carry.v, carry.h, extract_text=extract_text, debug=debug, session=session, triage=triage,
+            order=order, explicit_lines=lines,
+        )
+        if carry_forward:
+            carry.push(page.height, lines)
+        page.close()
+        del page
+        prev_ix = ix
+        yield result
+        _enforce_rss(pdf, rss_limit_mb)
+
+
+def process_pages(
+    pdf,
+    page_indices: Sequence[int],
+    carry_forward: bool = True,
+    extract_text: bool = True,
+    debug: bool = False,
+    sticky: bool = False,
+    rss_limit_mb: Optional[float] = None,
+    triage: bool = False,
+    preset_stats: Optional[str] = None,
+) -> List[PageResult]:
+    """List form of `iter_pages` (one worker chunk)."""
+    return list(iter_pages(
+        pdf, page_indices, carry_forward, extract_text, debug, sticky, rss_limit_mb, triage, preset_stats,
+    ))
+
+
+_WORKER_PDF = None
+
+
+def _open_source(path: str, open_kwargs: Dict[str, Any], cache_dir: Optional[str] = None):
+    """Open PDF, or a cache-first `PageSource` when *cache_dir* is set."""
+    if cache_dir is None:
+        return pdfplumber.open(path, **open_kwargs)
+    return PageSource(path, cache=PrimitiveCache(cache_dir), open_kwargs=open_kwargs)
+
+
+def _init_worker(path: str, open_kwargs: Dict[str, Any], cache_dir: Optional[str] = None) -> None:
+    """Open the PDF once per worker process."""
+    global _WORKER_PDF
+    _WORKER_PDF = _open_source(path, open_kwargs, cache_dir)
+
+
+def _run_chunk(
+    page_indices: Sequence[int],
+    carry_forward: bool,
+    extract_text: bool,
+    sticky: bool = False,
+    rss_limit_mb: Optional[float] = None,
+    triage: bool = False,
+    preset_stats: Optional[str] = None,
+) -> Tuple[List[PageResult], Optional[float]]:
+    """Process a chunk in the worker; returns its results and the worker RSS."""
+    results = process_pages(
+        _WORKER_PDF, page_indices, carry_forward=carry_forward, extract_text=extract_text,
+        sticky=sticky, rss_limit_mb=rss_limit_mb, triage=triage, preset_stats=preset_stats,
+    )
+    return results, rss_mb()
+
+
+# ------------------------------------------------------------------- #
+# 2.   Document entry point
+# ------------------------------------------------------------------- #
+
+def _chunked(indices: Sequence[int], chunksize: int) -> List[List[int]]:
+    return [list(indices[i:i + chunksize]) for i in range(0, len(indices), chunksize)]
+
+
+def extract_document(
+    path: str,
+    pages: Optional[Iterable[int]] = None,
+    *,
+    max_workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+    carry_forward: bool = True,
+    extract_text: bool = True,
+    sticky: bool = False,
+    open_kwargs: Optional[Dict[str, Any]] = None,
+    cache_dir: Optional[str] = None,
+    rss_limit_mb: Optional[float] = None,
+    recycle_pages: Optional[int] = None,
+    recycle_mb: Optional[float] = None,
+    max_in_flight: Optional[int] = None,
+    triage: bool = False,
+    preset_stats: Optional[str] = None,
+) -> Iterator[PageResult]:
+    """Run the settings search on every page of *path* across processes.
+
+    Parameters
+    ----------
+    path:
+        PDF file path; each worker opens it once.
+    pages:
+        0-based page indices to process (default: all pages).
+    max_workers:
+        Size of the process pool (default ``os.cpu_count()``). ``0`` runs
+        everything in the current process without a pool, streaming page
+        by page.
+    chunksize:
+        Number of consecutive pages handed to a worker per task.
+    ordered:
+        Yield results in page order; otherwise yield chunks as they complete.
+    carry_forward:
+        Feed the explicit lines of the last page that had any (at most
+        `CARRY_PAGES` pages back) into ``first_page_explicit_v/_h``.
+    extract_text:
+        Materialise ``Table.extract()`` rows in the worker.
+    sticky:
+        Try the previous page's winning preset first (see `DocumentSession`);
+        the session lives for one chunk.
+    cache_dir:
+        Read pages from a `PrimitiveCache` under this directory, parsing
+        (and storing) only pages that are not cached yet.
+    rss_limit_mb:
+        RSS ceiling per process.  When exceeded the document caches are
+        dropped; if RSS is still above, `MemoryLimitExceeded` is raised.
+    recycle_pages:
+        Replace the pool once every worker has processed about this many
+        pages (pending chunks are drained first).
+    recycle_mb:
+        Replace the pool as soon as a worker reports an RSS above this.
+    max_in_flight:
+        Maximum pending chunks (default ``2 × workers``), so finished
+        results never pile up in the parent.
+    triage:
+        Pre-screen pages with `triage_page`; table-free pages yield an
+        empty result without running the preset sweep.
+    preset_stats:
+        JSON stats file of an `AdaptiveOrder`: presets run in its learned
+        order and every chunk adds its win statistics to the file.
+    """
+    open_kwargs = dict(open_kwargs or {})
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+
+    if pages is None:
+        with _open_source(path, open_kwargs, cache_dir) as pdf:
+            indices = list(range(len(pdf.pages)))
+    else:
+        indices = sorted(set(pages))
+    if not indices:
+        return
+
+    chunks = _chunked(indices, chunksize)
+
+    if max_workers == 0:
+        with _open_source(path, open_kwargs, cache_dir) as pdf:
+            for chunk in chunks:
+                yield from iter_pages(
+                    pdf, chunk, carry_forward=carry_forward, extract_text=extract_text,
+                    sticky=sticky, rss_limit_mb=rss_limit_mb, triage=triage,
+                    preset_stats=preset_stats and str(preset_stats),
+                )
+        return
+
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+    in_flight = max(max_in_flight or 2 * workers, 1)
+    page_budget = recycle_pages * workers if recycle_pages else None
+    task_args = (carry_forward, extract_text, sticky, rss_limit_mb, triage, preset_stats and str(preset_stats))
+    initargs = (str(path), open_kwargs, cache_dir and str(cache_dir))
+
+    todo = deque(chunks)
+    executor = None
+    try:
+        while todo:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs)
+            pending: deque = deque()
+            done_pages = 0
+            recycle = False
+            while pending or (todo and not recycle):
+                while todo and not recycle and len(pending) < in_flight:
+                    chunk = todo.popleft()
+                    pending.append(executor.submit(_run_chunk, chunk, *task_args))
+                    done_pages += len(chunk)
+                    if page_budget and done_pages >= page_budget:
+                        recycle = True
+
+                if ordered:
+                    fut = pending.popleft()
+                else:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    fut = next(f for f in pending if f in finished)
+                    pending.remove(fut)
+                results, worker_rss = fut.result()
+                if recycle_mb and worker_rss is not None and worker_rss > recycle_mb and not recycle:
+                    logger.info("worker RSS %.0f MiB > %.0f MiB: recycling pool", worker_rss, recycle_mb)
+                    recycle = True
+                yield from results
+
+            executor.shutdown(wait=True)
+            executor = None
+            if todo:
+                logger.debug("recycled process pool, %d chunks left", len(todo))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,203 @@
+"""
+Sticky-preset document session.
+
+Consecutive pages of one document nearly always win with the same preset
+and almost the same explicit lines.  `DocumentSession` wraps
+`search_best_table_settings`: on each page it first re-runs the previous
+winner only, and accepts it when
+
+* the score stays within ``score_tol`` (relative) of the previous page, and
+* the column structure of the widest table is unchanged (same number of
+  column boundaries, each within ``col_tol`` points).
+
+Only on a mismatch does it fall back to the full preset sweep.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from tablex.lines import extract_explicit_lines
+from tablex.scoring.cache import PageFeatureCache
+from tablex.scoring.search import (
+    SearchStats,
+    _resolve_preset,
+    _too_small,
+    score_tables,
+    search_best_table_settings,
+)
+from tablex.scoring.triage import DEFAULT_TRIAGE, TriageConfig, triage_page
+from tablex.utils.geometry import PageGeometry
+from tablex.utils.log import get_logger
+from tablex.utils.table_settings import iter_compiled_settings
+
+
+logger = get_logger(__name__)
+
+
+def column_xs(tables: List[Any]) -> List[float]:
+    """Column boundaries (cell x0s + right edge) of the widest table."""
+    if not tables:
+        return []
+    widest = max(tables, key=lambda t: (t.bbox[2] - t.bbox[0]))
+    xs = {cell[0] for cell in widest.cells}
+    xs.add(widest.bbox[2])
+    return sorted(xs)
+
+
+@dataclass(slots=True)
+class _Winner:
+    name: str
+    score: float
+    columns: List[float]
+    explicit_v: List[float]
+    explicit_h: List[float]
+
+
+class DocumentSession:
+    """Search pages of one document, trying the previous winner first."""
+
+    def __init__(
+        self,
+        score_tol: float = 0.25,
+        col_tol: float = 3.0,
+        debug: bool = False,
+        **search_kwargs: Any,
+    ) -> None:
+        self.score_tol = score_tol
+        self.col_tol = col_tol
+        self.debug = debug
+        self.search_kwargs = search_kwargs
+        self._presets = {p.name: p for p in iter_compiled_settings()}
+        self._prev: Optional[_Winner] = None
+        self.pages = 0
+        self.attempts = 0  # pages on which the sticky preset was tried
+        self.hits = 0  # ... and accepted
+        self.last_hit = False
+
+    # ------------------------------------------------------------------ #
+    @property
+    def hit_rate(self) -> float:
+        """Share of pages served by the sticky preset (0 when none tried)."""
+        return self.hits / self.pages if self.pages else 0.0
+
+    @property
+    def previous_preset(self) -> Optional[str]:
+        return self._prev.name if self._prev else None
+
+    def reset(self) -> None:
+        """Forget the previous winner (e.g. at a document boundary)."""
+        self._prev = None
+
+    # ------------------------------------------------------------------ #
+    def _columns_match(self, columns: List[float]) -> bool:
+        prev = self._prev.columns
+        return len(columns) == len(prev) and all(abs(a - b) <= self.col_tol for a, b in zip(columns, prev))
+
+    def _try_sticky(self, page, cache, explicit_lines, carry_v, carry_h):
+        prev = self._prev
+        resolved = _resolve_preset(
+            prev.name, self._presets[prev.name].settings, page,
+            explicit_lines[0], explicit_lines[1], carry_v, carry_h,
+        )
+        if resolved is None:
+            return None
+        cfg, used_v, used_h = resolved
+        tables = cache.find_tables(cfg)
+        if not tables or _too_small(tables, page) is not None:
+            return None
+
+        char_index = cache.char_index() if self.search_kwargs.get("geometry_scoring", True) else None
+        sc = score_tables(tables, page, char_index)
+        if abs(sc - prev.score) > self.score_tol * max(abs(prev.score), 1.0):
+            if self.debug:
+                logger.debug("[session] %s: score %.2f vs %.2f – fallback", prev.name, sc, prev.score)
+            return None
+        columns = column_xs(tables)
+        if not self._columns_match(columns):
+            if self.debug:
+                logger.debug("[session] %s: columns changed – fallback", prev.name)
+            return None
+
+        strat = (cfg["vertical_strategy"], cfg["horizontal_strategy"])
+        return (prev.name, strat, cfg, tables, used_v, used_h), sc, columns
+
+    def search(
+        self,
+        page,
+        first_page_explicit_v: Optional[List[float]] = None,
+        first_page_explicit_h: Optional[List[float]] = None,
+        explicit_lines: Optional[Tuple[List[float], List[float]]] = None,
+    ) -> Tuple[
+        Optional[str],
+        Tuple[Optional[str], Optional[str]],
+        Optional[Dict[str, Any]],
+        List[Any],
+        List[float],
+        List[float],
+    ]:
+        """Same contract as `search_best_table_settings` for one page.
+
+        Explicit lines default to the previous winner's, so the cross-page
+        fallback works without wiring ``first_page_explicit_v/_h`` by hand.
+        *explicit_lines* takes the page's precomputed `extract_explicit_lines`
+        output.
+        """
+        self.pages += 1
+        self.last_hit = False
+        carry_v = first_page_explicit_v
+        carry_h = first_page_explicit_h
+        if self._prev is not None:
+            carry_v = carry_v or self._prev.explicit_v or None
+            carry_h = carry_h or self._prev.explicit_h or None
+
+        cache = PageFeatureCache(page)
+        geometry = PageGeometry.from_page(page)
+        triage = self.search_kwargs.get("triage")
+        if triage:
+            verdict = triage_page(
+                page, triage if isinstance(triage, TriageConfig) else DEFAULT_TRIAGE,
+                geometry=geometry, char_index=cache.char_index(), carry_v=carry_v, carry_h=carry_h,
+            )
+            if not verdict.possible:
+                if self.debug:
+                    logger.debug("[session] Page %s: triaged as table-free", page.page_number)
+                self._prev = None
+                return None, (None, None), None, [], [], []
+        if explicit_lines is None:
+            explicit_lines = extract_explicit_lines(page, dump_rects_log=False, geometry=geometry)
+
+        if self._prev is not None:
+            self.attempts += 1
+            sticky = self._try_sticky(page, cache, explicit_lines, carry_v, carry_h)
+            if sticky is not None:
+                result, sc, columns = sticky
+                self.hits += 1
+                self.last_hit = True
+                self._remember(result, sc, columns)
+                if self.debug:
+                    logger.debug("[session] Page %s: reuse %s – score %.2f", page.page_number, result[0], sc)
+                return result
+
+        stats = SearchStats()
+        search_kwargs = {k: v for k, v in self.search_kwargs.items() if k != "triage"}  # already done
+        result = search_best_table_settings(
+            page, carry_v, carry_h,
+            debug=self.debug, cache=cache, stats=stats,
+            explicit_lines=explicit_lines, **search_kwargs,
+        )
+        if result[0] is None or stats.best_score is None or not result[3]:
+            self._prev = None
+        else:
+            self._remember(result, stats.best_score, column_xs(result[3]))
+        return result
+
+    def _remember(self, result, score: float, columns: List[float]) -> None:
+        name, _, _, _, ev, eh = result
+        prev = self._prev
+        self._prev = _Winner(
+            name=name,
+            score=score,
+            columns=columns,
+            explicit_v=list(ev) if len(ev) >= 2 else (prev.explicit_v if prev else []),
+            explicit_h=list(eh) if eh else (prev.explicit_h if prev else []),
+        )
@@ -0,0 +1,299 @@
+"""
+Multi-page table stitching.
+
+A table that runs over a page break comes back as one fragment per page,
+and every continuation page is searched from scratch.  `TableStitcher`
+walks a document page by page and
+
+* **reuses the grid** – when the previous page's last table reaches the
+  bottom of its page, the next page is first tried with that table's
+  column boundaries as explicit verticals (the page's horizontal rules,
+  plus a synthetic top line when the continuation lost its top border –
+  the case ``explicit-text-missingtop`` was written for).  The top table
+  is accepted when it starts near the top of the page and the page's own
+  vertical rules / words agree with the reused columns; anything below it
+  is searched as a separate region (`tablex.scoring.regions`).  Otherwise
+  the normal search runs, with explicit lines carried forward
+  automatically;
+* **merges fragments** – consecutive fragments with matching columns
+  become one `LogicalTable` with a per-fragment page / bbox / row map; a
+  header row repeated at the top of a continuation is dropped.
+
+`stitch_results` applies the merge step alone to any `PageResult` stream,
+e.g. the output of `extract_document`.
+
+>>> stitcher = TableStitcher()
+>>> for page in pdf.pages:
+...     stitcher.process(page)
+>>> tables = stitcher.finish()
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pdfplumber import utils
+
+from tablex.pipeline.document import PageResult, page_result
+from tablex.pipeline.session import column_xs
+from tablex.scoring import search_best_table_settings
+from tablex.scoring.cache import PageFeatureCache
+from tablex.scoring.regions import Region, search_regions
+from tablex.utils.log import get_logger
+
+
+logger = get_logger(__name__)
+
+CONTINUATION = "continuation"  # preset name of pages served by a reused grid
+
+# horizontal handling of a reused grid (text fallback as in explicit-text-missingtop)
+CONTINUATION_SETTINGS: Dict[str, Any] = {
+    "vertical_strategy": "explicit",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 5,
+    "intersection_tolerance": 3,
+    "join_tolerance": 8,
+    "text_x_tolerance": 3,
+    "text_y_tolerance": 6,
+    "min_words_horizontal": 2,
+}
+
+BBox = Tuple[float, float, float, float]
+
+
+@dataclass(slots=True)
+class Fragment:
+    """Where a slice of a `LogicalTable` came from: rows ``[row_start, row_end)``."""
+
+    page_number: int
+    table_index: int
+    bbox: BBox
+    row_start: int
+    row_end: int
+
+
+@dataclass(slots=True)
+class LogicalTable:
+    """One table, possibly spread over several pages."""
+
+    columns: List[float]
+    rows: List[List[Optional[str]]] = field(default_factory=list)
+    fragments: List[Fragment] = field(default_factory=list)
+
+    @property
+    def pages(self) -> List[int]:
+        return [f.page_number for f in self.fragments]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def columns_match(a: Sequence[float], b: Sequence[float], tol: float = 3.0) -> bool:
+    """Same number of column boundaries, each within *tol* points."""
+    return len(a) == len(b) and len(a) >= 2 and all(abs(x - y) <= tol for x, y in zip(a, b))
+
+
+# ------------------------------------------------------------------- #
+# 1.   Merging PageResults
+# ------------------------------------------------------------------- #
+
+class _Merger:
+    def __init__(self, col_tol: float, edge_ratio: float, drop_repeated_header: bool) -> None:
+        self.col_tol = col_tol
+        self.edge_ratio = edge_ratio
+        self.drop_repeated_header = drop_repeated_header
+        self.open: Optional[LogicalTable] = None  # may continue on the next page
+        self.open_page = -1
+
+    def _at_bottom(self, result: PageResult, bbox: BBox) -> bool:
+        H = result.page_height
+        return H is None or bbox[3] >= H * (1 - self.edge_ratio)
+
+    def _at_top(self, result: PageResult, bbox: BBox) -> bool:
+        H = result.page_height
+        return H is None or bbox[1] <= H * self.edge_ratio
+
+    def continues(self, result: PageResult, ti: int) -> bool:
+        """Does table *ti* (the topmost of *result*) continue the open table?"""
+        if self.open is None or result.page_number != self.open_page + 1:
+            return False
+        first = result.tables[ti]
+        return self._at_top(result, first.bbox) and columns_match(first.columns, self.open.columns, self.col_tol)
+
+    def _append(self, table: LogicalTable, result: PageResult, ti: int, continued: bool) -> None:
+        tr = result.tables[ti]
+        rows = tr.rows
+        if continued and self.drop_repeated_header and rows and table.rows and rows[0] == table.rows[0]:
+            rows = rows[1:]
+        start = len(table.rows)
+        table.rows.extend(rows)
+        table.fragments.append(Fragment(result.page_number, ti, tuple(tr.bbox), start, len(table.rows)))
+
+    def add(self, result: PageResult) -> List[LogicalTable]:
+        """Merge one page; returns the tables that can no longer grow."""
+        done: List[LogicalTable] = []
+        order = sorted(range(len(result.tables)), key=lambda i: result.tables[i].bbox[1])  # top to bottom
+        current = None
+        if order and self.continues(result, order[0]):
+            current = self.open
+            self._append(current, result, order.pop(0), continued=True)
+        elif self.open is not None:
+            done.append(self.open)
+        self.open = None
+        for ti in order:
+            if current is not None:
+                done.append(current)
+            current = LogicalTable(columns=list(result.tables[ti].columns))
+            self._append(current, result, ti, continued=False)
+        if current is not None:
+            if self._at_bottom(result, current.fragments[-1].bbox):
+                self.open, self.open_page = current, result.page_number
+            else:
+                done.append(current)
+        return done
+
+    def finish(self) -> List[LogicalTable]:
+        done = [self.open] if self.open is not None else []
+        self.open = None
+        return done
+
+
+def stitch_results(
+    results: Iterable[PageResult],
+    col_tol: float = 3.0,
+    edge_ratio: float = 0.25,
+    drop_repeated_header: bool = True,
+) -> Iterator[LogicalTable]:
+    """Merge the table fragments of consecutive `PageResult`s (in page order)."""
+    merger = _Merger(col_tol, edge_ratio, drop_repeated_header)
+    for result in results:
+        yield from merger.add(result)
+    yield from merger.finish()
+
+
+# ------------------------------------------------------------------- #
+# 2.   Grid reuse while searching
+# ------------------------------------------------------------------- #
+
+class TableStitcher:
+    """Search a document page by page, reusing grids across page breaks."""
+
+    def __init__(
+        self,
+        col_tol: float = 3.0,
+        edge_ratio: float = 0.25,
+        extract_text: bool = True,
+        drop_repeated_header: bool = True,
+        max_straddle: float = 0.1,
+        debug: bool = False,
+        **search_kwargs: Any,
+    ) -> None:
+        self.col_tol = col_tol
+        self.edge_ratio = edge_ratio
+        self.extract_text = extract_text
+        self.max_straddle = max_straddle  # share of words that may cross a reused column boundary
+        self.debug = debug
+        self.search_kwargs = search_kwargs
+        self._merger = _Merger(col_tol, edge_ratio, drop_repeated_header)
+        self._carry_v: Optional[List[float]] = None
+        self._carry_h: Optional[List[float]] = None
+        self.tables: List[LogicalTable] = []  # finished logical tables
+        self.pages = 0
+        self.reused = 0  # pages served by the previous grid
+
+    # -------------------------------------------------------------- #
+    def _grid_settings(self, page, columns: List[float]) -> Dict[str, Any]:
+        cfg = dict(CONTINUATION_SETTINGS, explicit_vertical_lines=list(columns))
+        x0, x1 = columns[0], columns[-1]
+        span = x1 - x0
+        h_edges = [
+            e for e in utils.filter_edges(page.edges, "h", min_length=span * 0.5)
+            if e["x0"] <= x0 + self.col_tol and e["x1"] >= x1 - self.col_tol
+        ]
+        if not h_edges:
+            cfg["horizontal_strategy"] = "text"
+            return cfg
+        first_rule = min(e["top"] for e in h_edges)
+        above = [c["top"] for c in page.chars if c["x0"] >= x0 and c["x1"] <= x1 and c["bottom"] <= first_rule
+                 and c["text"].strip()]
+        if above:  # the continuation lost its top border
+            cfg["explicit_horizontal_lines"] = [min(above) - 1]
+        return cfg
+
+    def _agrees(self, page, table, columns: List[float]) -> bool:
+        """The page's own rules and words inside *table* respect *columns*."""
+        x0, top, x1, bottom = table.bbox
+        inner = columns[1:-1]
+        v_rules = {
+            round(e["x0"]) for e in utils.filter_edges(page.edges, "v", min_length=(bottom - top) * 0.3)
+            if x0 - self.col_tol <= e["x0"] <= x1 + self.col_tol and e["top"] < bottom and e["bottom"] > top
+        }
+        if len(v_rules) >= 2 and any(min(abs(x - c) for c in columns) > self.col_tol for x in v_rules):
+            return False
+        words = [w for w in page.extract_words() if w["top"] >= top and w["bottom"] <= bottom]
+        if not words:
+            return False
+        straddle = sum(any(w["x0"] + self.col_tol < c < w["x1"] - self.col_tol for c in inner) for w in words)
+        return straddle <= self.max_straddle * len(words)
+
+    def _continue(self, page, columns: List[float]):
+        cfg = self._grid_settings(page, columns)
+        cache = PageFeatureCache(page)
+        tables = sorted(cache.find_tables(cfg), key=lambda t: t.bbox[1])
+        if not tables:
+            return None
+        first = tables[0]
+        if first.bbox[1] > page.height * self.edge_ratio:
+            return None
+        if not columns_match(column_xs([first]), columns, self.col_tol) or not self._agrees(page, first, columns):
+            if self.debug:
+                logger.debug("[stitch] Page %s: reused grid rejected", page.page_number)
+            return None
+
+        found = [first]
+        px0, _, px1, pbottom = page.bbox
+        if pbottom - first.bbox[3] > 20:  # search whatever follows the continuation
+            tail = Region((px0, first.bbox[3] + 1, px1, pbottom), "ruled")
+            try:
+                found += search_regions(page, [tail], **self.search_kwargs)[0].tables
+            except ValueError:  # nothing to crop
+                pass
+        strat = (cfg["vertical_strategy"], cfg["horizontal_strategy"])
+        return CONTINUATION, strat, cfg, found, list(columns), []
+
+    def process(self, page) -> PageResult:
+        """Search (or continue) one page and merge its tables."""
+        self.pages += 1
+        open_table = self._merger.open if self._merger.open_page == page.page_number - 1 else None
+        found = self._continue(page, open_table.columns) if open_table is not None else None
+        if found is not None:
+            self.reused += 1
+            if self.debug:
+                logger.debug("[stitch] Page %s: continues the table of page %s", page.page_number, page.page_number - 1)
+        else:
+            try:
+                found = search_best_table_settings(
+                    page, self._carry_v, self._carry_h, debug=self.debug, **self.search_kwargs,
+                )
+            except RuntimeWarning:  # “此页没有表格”
+                found = None, (None, None), None, [], [], []
+        result = page_result(page, found, self.extract_text, reused_preset=found[0] == CONTINUATION)
+        if len(result.explicit_v) >= 2:
+            self._carry_v = result.explicit_v
+        if result.explicit_h:
+            self._carry_h = result.explicit_h
+        self.tables.extend(self._merger.add(result))
+        return result
+
+    def finish(self) -> List[LogicalTable]:
+        """Close the document; returns every logical table in page order."""
+        self.tables.extend(self._merger.finish())
+        return self.tables
+
+
+def stitch_document(pages: Iterable[Any], **kwargs: Any) -> List[LogicalTable]:
+    """Logical tables of *pages* (e.g. ``pdf.pages``); see `TableStitcher`."""
+    stitcher = TableStitcher(**kwargs)
+    for page in pages:
+        stitcher.process(page)
+        page.close()
+    return stitcher.finish()
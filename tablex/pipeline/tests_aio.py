@@ -0,0 +1,91 @@
+import asyncio
+import pathlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pytest
+
+from tablex.pipeline import aextract_document, aiter_document, extract_document
+from tablex.testing import make_grid_pdf
+
+
+@pytest.fixture
+def grid_pdf(tmp_path):
+    return make_grid_pdf(tmp_path / "grid.pdf", n_pages=4)
+
+
+def test_aextract_document_matches_serial(grid_pdf):
+    serial = list(extract_document(grid_pdf, max_workers=0, chunksize=2))
+    results = asyncio.run(aextract_document(grid_pdf, max_workers=2, chunksize=2))
+    assert [r.to_dict() for r in results] == [r.to_dict() for r in serial]
+
+
+def test_aiter_document_thread_executor_unordered(grid_pdf):
+    async def run():
+        with ThreadPoolExecutor(2) as pool:
+            return [r.page_number async for r in aiter_document(
+                grid_pdf, pages=[0, 2, 3], executor=pool, chunksize=1, ordered=False,
+            )]
+
+    assert sorted(asyncio.run(run())) == [1, 3, 4]
+
+
+def test_aiter_document_releases_semaphore_on_early_exit(grid_pdf):
+    async def run():
+        sem = asyncio.Semaphore(2)
+        with ThreadPoolExecutor(2) as pool:
+            stream = aiter_document(grid_pdf, executor=pool, chunksize=1, semaphore=sem)
+            async for result in stream:
+                assert result.page_number == 1
+                break
+            await stream.aclose()
+        return sem._value
+
+    assert asyncio.run(run()) == 2
+
+
+def test_aiter_document_cancellation(grid_pdf):
+    async def run():
+        seen = []
+
+        async def consume():
+            async for result in aiter_document(grid_pdf, executor=pool, chunksize=1, max_in_flight=1):
+                seen.append(result.page_number)
+                await asyncio.sleep(10)
+
+        with ThreadPoolExecutor(1) as pool:
+            task = asyncio.create_task(consume())
+            while not seen:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        return seen
+
+    assert asyncio.run(run()) == [1]
+
+
+def test_aiter_document_foreign_executor_size_not_inspected(grid_pdf, monkeypatch):
+    import tablex.pipeline.aio as aio
+
+    class Counting(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, *args, **kwargs):
+            Counting.submitted += 1
+            return super().submit(*args, **kwargs)
+
+    async def run(**kwargs):
+        Counting.submitted = peak = consumed = 0
+        with Counting(1) as pool:  # _max_workers == 1 must not cap the window
+            async for _ in aiter_document(grid_pdf, executor=pool, chunksize=1, **kwargs):
+                consumed += 1
+                # chunks held when this one was yielded (the page count call is the extra submit)
+                peak = max(peak, Counting.submitted - consumed)
+        return peak
+
+    monkeypatch.setattr(aio.os, "cpu_count", lambda: 2)
+    assert asyncio.run(run()) == 4               # 2 × os.cpu_count()
+    assert asyncio.run(run(max_workers=1)) == 2  # 2 × max_workers
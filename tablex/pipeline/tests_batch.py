@@ -0,0 +1,122 @@
+import json
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pytest
+
+from tablex.cli import main
+from tablex.pipeline.batch import Checkpoint, discover_pdfs, plan_tasks, run_batch
+from tablex.testing import make_grid_pdf
+
+
+@pytest.fixture
+def pdf_dir(tmp_path):
+    d = tmp_path / "in"
+    (d / "sub").mkdir(parents=True)
+    make_grid_pdf(d / "a.pdf", n_pages=2)
+    make_grid_pdf(d / "b.pdf", n_pages=3)
+    make_grid_pdf(d / "sub" / "c.pdf", n_pages=1)
+    (d / "notes.txt").write_text("not a pdf")
+    return d
+
+
+def _lines(path):
+    return [json.loads(line) for line in pathlib.Path(path).read_text(encoding="utf-8").splitlines()]
+
+
+def test_discover_pdfs(pdf_dir, tmp_path):
+    assert [pathlib.Path(p).name for p in discover_pdfs([pdf_dir])] == ["a.pdf", "b.pdf"]
+    assert len(discover_pdfs([pdf_dir], recursive=True)) == 3
+    listing = tmp_path / "list.txt"
+    listing.write_text(f"# comment\n{pdf_dir / 'b.pdf'}\n\n{pdf_dir / 'b.pdf'}\n")
+    assert discover_pdfs([f"@{listing}"]) == [str(pdf_dir / "b.pdf")]
+
+
+def test_plan_tasks_packs_small_files(pdf_dir):
+    files = discover_pdfs([pdf_dir], recursive=True)
+    tasks, _ = plan_tasks(files)
+    assert len(tasks) == 1 and len(tasks[0]) == 3
+    tasks, _ = plan_tasks(files, pack_files=2)
+    assert [len(t) for t in tasks] == [2, 1]
+    tasks, _ = plan_tasks(files, pack_bytes=0, chunksize=2)  # every file is "large"
+    assert [(pathlib.Path(t[0].path).name, t[0].pages) for t in tasks] == [
+        ("a.pdf", (0, 1)), ("b.pdf", (0, 1)), ("b.pdf", (2,)), ("c.pdf", (0,)),
+    ]
+
+
+def test_run_batch_writes_jsonl_and_checkpoint(pdf_dir, tmp_path):
+    out = tmp_path / "out.jsonl"
+    stats = run_batch([pdf_dir], out, recursive=True, max_workers=0)
+    assert (stats.pages, stats.errors) == (6, 0)
+    recs = _lines(out)
+    assert sorted((pathlib.Path(r["file"]).name, r["page_number"]) for r in recs) == [
+        ("a.pdf", 1), ("a.pdf", 2), ("b.pdf", 1), ("b.pdf", 2), ("b.pdf", 3), ("c.pdf", 1),
+    ]
+    ckpt = Checkpoint(tmp_path / "out.jsonl.ckpt")
+    assert all(ckpt.is_complete(f) for f in discover_pdfs([pdf_dir], recursive=True))
+
+    again = run_batch([pdf_dir], out, recursive=True, max_workers=0)
+    assert (again.pages, again.skipped_files) == (0, 3)
+    assert len(_lines(out)) == 6
+
+
+def test_run_batch_resumes_partial_checkpoint(pdf_dir, tmp_path):
+    out = tmp_path / "out.jsonl"
+    b = str(pdf_dir / "b.pdf")
+    ckpt = Checkpoint(tmp_path / "out.jsonl.ckpt")
+    ckpt.record(b, [0], None)
+    with ckpt.path.open("a") as fh:
+        fh.write('{"file": "torn')  # killed mid-write
+    out.write_text("")
+
+    stats = run_batch([pdf_dir], out, max_workers=0, pack_bytes=0, chunksize=1)
+    assert stats.pages == 4
+    assert sorted((pathlib.Path(r["file"]).name, r["page_number"]) for r in _lines(out)) == [
+        ("a.pdf", 1), ("a.pdf", 2), ("b.pdf", 2), ("b.pdf", 3),
+    ]
+
+
+def test_run_batch_reports_errors(tmp_path):
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+    out = tmp_path / "out.jsonl"
+    stats = run_batch([bad], out, max_workers=0)
+    assert stats.errors == 1
+    assert "error" in _lines(out)[0]
+    assert not Checkpoint(tmp_path / "out.jsonl.ckpt").pages_done(str(bad))
+
+
+def test_cli_pool(pdf_dir, tmp_path):
+    out = tmp_path / "cli.jsonl"
+    assert main([str(pdf_dir), "-o", str(out), "-j", "2", "--pack-files", "1", "-q"]) == 0
+    assert len(_lines(out)) == 5
+    assert main([str(pdf_dir), "-o", str(out), "--restart", "-j", "0", "-q"]) == 0
+    assert len(_lines(out)) == 5
+
+
+def test_run_batch_table_free_file_is_not_an_error(tmp_path):
+    d = tmp_path / "in"
+    d.mkdir()
+    make_grid_pdf(d / "prose.pdf", n_pages=2, ruled=False, prose_lines=5)  # no rule or rect anywhere
+    make_grid_pdf(d / "grid.pdf", n_pages=1)
+    out = tmp_path / "out.jsonl"
+    stats = run_batch([d], out, max_workers=0)
+    assert (stats.pages, stats.errors) == (3, 0)
+    recs = [r for r in _lines(out) if pathlib.Path(r["file"]).name == "prose.pdf"]
+    assert [(r["page_number"], r["tables"]) for r in recs] == [(1, []), (2, [])]
+    assert Checkpoint(tmp_path / "out.jsonl.ckpt").is_complete(str(d / "prose.pdf"))
+    assert main([str(d), "-o", str(tmp_path / "cli.jsonl"), "-j", "0", "-q"]) == 0
+
+
+def test_run_batch_syncs_once_per_task(pdf_dir, tmp_path, monkeypatch):
+    import tablex.pipeline.batch as batch
+
+    synced = []
+    monkeypatch.setattr(batch.os, "fsync", synced.append)
+    stats = run_batch([pdf_dir], tmp_path / "out.jsonl", recursive=True, max_workers=0)
+    assert (stats.tasks, stats.pages) == (1, 6)  # three packed files
+    assert len(synced) == 2  # output once, checkpoint once
+    ckpt = Checkpoint(tmp_path / "out.jsonl.ckpt")
+    assert all(ckpt.is_complete(f) for f in discover_pdfs([pdf_dir], recursive=True))
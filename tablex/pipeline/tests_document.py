@@ -0,0 +1,119 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pytest
+
+from tablex.pipeline import PageResult, extract_document
+from tablex.testing import grid_ops, make_grid_pdf, prose_ops, write_pdf
+
+
+@pytest.fixture
+def grid_pdf(tmp_path):
+    return make_grid_pdf(tmp_path / "grid.pdf", n_pages=4)
+
+
+def test_extract_document_serial(grid_pdf):
+    results = list(extract_document(grid_pdf, max_workers=0, chunksize=2))
+    assert [r.page_number for r in results] == [1, 2, 3, 4]
+    assert all(isinstance(r, PageResult) for r in results)
+    first = results[0]
+    assert first.preset is not None
+    assert first.tables
+    assert any("p0r0c0" in (cell or "") for row in first.tables[0].rows for cell in row)
+
+
+def test_extract_document_pool_matches_serial(grid_pdf):
+    serial = list(extract_document(grid_pdf, max_workers=0, chunksize=4))
+    pooled = list(extract_document(grid_pdf, max_workers=2, chunksize=1))
+    assert [r.to_dict() for r in pooled] == [r.to_dict() for r in serial]
+
+
+def test_extract_document_unordered_and_subset(grid_pdf):
+    results = list(extract_document(grid_pdf, pages=[3, 1], max_workers=2, chunksize=1, ordered=False))
+    assert sorted(r.page_number for r in results) == [2, 4]
+
+
+def test_extract_document_rejects_bad_chunksize(grid_pdf):
+    with pytest.raises(ValueError):
+        list(extract_document(grid_pdf, chunksize=0))
+
+
+def test_iter_pages_closes_pages(grid_pdf):
+    import pdfplumber
+
+    from tablex.pipeline.document import iter_pages
+
+    with pdfplumber.open(grid_pdf) as pdf:
+        for result in iter_pages(pdf, [0, 1, 2]):
+            page = pdf.pages[result.page_number - 1]
+            assert "_objects" not in page.__dict__ and "_layout" not in page.__dict__
+
+
+def test_extract_document_rss_ceiling(grid_pdf):
+    from tablex.utils.memory import MemoryLimitExceeded
+
+    with pytest.raises(MemoryLimitExceeded):
+        list(extract_document(grid_pdf, max_workers=0, rss_limit_mb=1))
+    assert len(list(extract_document(grid_pdf, max_workers=0, rss_limit_mb=1 << 20))) == 4
+
+
+def test_rss_ceiling_off_without_current_rss(grid_pdf, monkeypatch):
+    from tablex.utils import memory
+
+    def no_proc(*args, **kwargs):
+        raise OSError("no /proc")
+
+    monkeypatch.setattr(memory, "open", no_proc, raising=False)
+    monkeypatch.setitem(sys.modules, "psutil", None)
+    assert memory.rss_mb() is None  # peak RSS would never drop below the ceiling again
+    assert len(list(extract_document(grid_pdf, max_workers=0, rss_limit_mb=1))) == 4
+
+
+def test_extract_document_recycles_workers(grid_pdf):
+    serial = list(extract_document(grid_pdf, max_workers=0, chunksize=1))
+    recycled = list(extract_document(grid_pdf, max_workers=2, chunksize=1, recycle_pages=1, max_in_flight=1))
+    assert [r.to_dict() for r in recycled] == [r.to_dict() for r in serial]
+    by_size = list(extract_document(grid_pdf, max_workers=2, chunksize=1, recycle_mb=1, ordered=False))
+    assert sorted(r.page_number for r in by_size) == [1, 2, 3, 4]
+
+
+def test_extract_document_triage_skips_prose(tmp_path):
+    prose = make_grid_pdf(tmp_path / "prose.pdf", n_pages=2, rows=0, prose_lines=20)
+    results = list(extract_document(prose, max_workers=0, triage=True, sticky=True))
+    assert [(r.page_number, r.preset, r.tables) for r in results] == [(1, None, []), (2, None, [])]
+
+
+@pytest.mark.parametrize("chunksize", [1, 3])
+@pytest.mark.parametrize("sticky", [False, True])
+def test_extract_document_table_free_pages(tmp_path, chunksize, sticky):
+    xs, ys = [72, 228, 384, 540], [640, 540, 440, 340]
+    mixed = write_pdf(tmp_path / "mixed.pdf", [grid_ops(xs, ys, "a"), prose_ops(20), grid_ops(xs, ys, "b")])
+    results = list(extract_document(mixed, max_workers=0, chunksize=chunksize, sticky=sticky))
+    assert [r.page_number for r in results] == [1, 2, 3]
+    assert results[1].preset is None and results[1].tables == []
+    assert results[0].tables and results[2].tables
+    # a rule-free document is all empty pages, not an error
+    text_only = make_grid_pdf(tmp_path / "text.pdf", n_pages=2, ruled=False, prose_lines=5)
+    assert [r.tables for r in extract_document(text_only, max_workers=0)] == [[], []]
+
+
+def _rules_only_ops(xs, ys, label):
+    """Text grid under long horizontal rules: no vertical lines, explicit_v comes from the carry."""
+    ops = grid_ops(xs, ys, label, ruled=False)
+    return ops + [f"{xs[0]} {y} m {xs[-1]} {y} l S" for y in ys] + ["72 700 6 6 re f"]
+
+
+def test_carry_independent_of_chunking(tmp_path):
+    xs, ys = [72, 228, 384, 540], [640, 540, 440, 340]
+    path = write_pdf(tmp_path / "carry.pdf", [
+        grid_ops(xs, ys, "a"), _rules_only_ops(xs, ys, "b"), _rules_only_ops(xs, ys, "c"), grid_ops(xs, ys, "d"),
+    ])
+    runs = [
+        [r.to_dict() for r in extract_document(path, max_workers=workers, chunksize=chunksize)]
+        for workers, chunksize in ((0, 1), (0, 4), (2, 1), (2, 2))
+    ]
+    assert all(run == runs[0] for run in runs[1:])
+    assert [r["preset"] for r in runs[0][1:3]] == ["explicit-explicit"] * 2  # page 1's columns carried twice
+    assert runs[0][2]["explicit_v"] == xs
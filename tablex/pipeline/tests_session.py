@@ -0,0 +1,42 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pdfplumber
+
+from tablex.pipeline import DocumentSession, extract_document
+from tablex.testing import make_grid_pdf
+from tablex.scoring import search_best_table_settings
+
+
+def test_session_reuses_preset_and_matches_full_search(tmp_path):
+    path = make_grid_pdf(tmp_path / "g.pdf", n_pages=4, rows=5, cols=4)
+    session = DocumentSession()
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            sticky = session.search(page)
+            full = search_best_table_settings(page, debug=False)
+            assert [t.cells for t in sticky[3]] == [t.cells for t in full[3]]
+    assert session.pages == 4
+    assert session.hits == 3
+    assert session.hit_rate == 0.75
+
+
+def test_session_falls_back_when_columns_change(tmp_path):
+    a = make_grid_pdf(tmp_path / "a.pdf", n_pages=1, rows=5, cols=4)
+    b = make_grid_pdf(tmp_path / "b.pdf", n_pages=1, rows=5, cols=2)
+    session = DocumentSession()
+    with pdfplumber.open(a) as pa, pdfplumber.open(b) as pb:
+        session.search(pa.pages[0])
+        result = session.search(pb.pages[0])
+    assert session.attempts == 1 and session.hits == 0
+    assert len({c[0] for c in result[3][0].cells}) == 2
+
+
+def test_extract_document_sticky_matches_plain(tmp_path):
+    path = make_grid_pdf(tmp_path / "g.pdf", n_pages=4)
+    plain = list(extract_document(path, max_workers=0, chunksize=4))
+    sticky = list(extract_document(path, max_workers=0, chunksize=4, sticky=True))
+    assert [r.tables for r in sticky] == [r.tables for r in plain]
+    assert [r.reused_preset for r in sticky] == [False, True, True, True]
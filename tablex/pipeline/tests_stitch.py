@@ -0,0 +1,76 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pdfplumber
+import pytest
+
+from tablex.pipeline import PageResult, TableResult
+from tablex.pipeline.stitch import CONTINUATION, TableStitcher, columns_match, stitch_document, stitch_results
+from tablex.testing import grid_ops, write_pdf
+
+
+XS = [72, 189, 306, 423, 540]
+
+
+@pytest.fixture
+def split_pdf(tmp_path):
+    """Page 1 ends in a grid at the bottom; page 2 continues it without its top rule."""
+    return write_pdf(tmp_path / "split.pdf", [
+        grid_ops(XS, [400, 340, 280, 220, 160, 100], "p0"),
+        grid_ops(XS, [770, 730, 690, 650, 610], "p1", top_rule=False),
+    ])
+
+
+def test_columns_match():
+    assert columns_match([72, 189, 540], [73.5, 188, 541])
+    assert not columns_match([72, 189, 540], [72, 250, 540])
+    assert not columns_match([72, 540], [72, 306, 540])
+
+
+def test_continuation_reuses_grid(split_pdf):
+    stitcher = TableStitcher()
+    with pdfplumber.open(split_pdf) as pdf:
+        results = [stitcher.process(page) for page in pdf.pages]
+    tables = stitcher.finish()
+    assert stitcher.reused == 1
+    assert results[0].preset != CONTINUATION and results[1].preset == CONTINUATION
+    assert len(tables) == 1
+    table = tables[0]
+    assert table.pages == [1, 2]
+    assert columns_match(table.columns, XS)
+    assert [r[0] for r in table.rows] == [f"p0r{r}c0" for r in range(5)] + [f"p1r{r}c0" for r in range(4)]
+    first, second = table.fragments
+    assert (first.row_start, first.row_end, second.row_start, second.row_end) == (0, 5, 5, 9)
+    assert second.bbox[1] < 40  # grid grew up to the synthetic top line
+
+
+def test_stitch_document_closes_pages(split_pdf):
+    with pdfplumber.open(split_pdf) as pdf:
+        tables = stitch_document(pdf.pages)
+    assert [t.pages for t in tables] == [[1, 2]]
+
+
+def _result(page, *tables, H=800.0):
+    return PageResult(
+        page_number=page, preset="lines-lines", strategy=("lines", "lines"), settings={},
+        tables=[TableResult(bbox=b, rows=rows, columns=cols) for b, rows, cols in tables],
+        explicit_v=[], explicit_h=[], page_height=H,
+    )
+
+
+def test_stitch_results_merges_and_splits():
+    cols = [10.0, 50.0, 90.0]
+    header = ["a", "b"]
+    results = [
+        _result(1, ((10, 100, 90, 200), [["x", "y"]], cols), ((10, 500, 90, 790), [header, ["1", "2"]], cols)),
+        _result(2, ((10, 20, 90, 300), [header, ["3", "4"]], cols)),  # repeated header dropped
+        _result(3, ((10, 20, 90, 300), [["5", "6"]], cols)),  # previous table ended mid-page
+        _result(4, ((10, 20, 90, 790), [["7", "8"]], [10.0, 70.0, 90.0])),
+        _result(5, ((10, 20, 90, 300), [["9", "0"]], [10.0, 30.0, 90.0])),  # other columns
+    ]
+    tables = list(stitch_results(results))
+    assert [t.pages for t in tables] == [[1], [1, 2], [3], [4], [5]]
+    assert tables[1].rows == [header, ["1", "2"], ["3", "4"]]
+    assert [(f.table_index, f.row_start, f.row_end) for f in tables[1].fragments] == [(1, 0, 2), (0, 2, 3)]
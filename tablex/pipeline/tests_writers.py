@@ -0,0 +1,66 @@
+import csv
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pytest
+
+from tablex.pipeline import CsvTableWriter, PageResult, TableResult, extract_document, open_writer
+from tablex.testing import make_grid_pdf
+
+
+def _page(n, rows):
+    table = TableResult(bbox=(10.0, 20.0, 110.0, 220.0), rows=rows)
+    return PageResult(n, "preset_a", ("lines", "lines"), {}, [table], [], [])
+
+
+def test_csv_writer_streams_document(tmp_path):
+    pdf = make_grid_pdf(tmp_path / "grid.pdf", n_pages=2, rows=3, cols=2)
+    out = tmp_path / "tables.csv"
+    with open_writer(out) as writer:
+        assert isinstance(writer, CsvTableWriter)
+        n = writer.write_all(extract_document(pdf, max_workers=0))
+    rows = list(csv.reader(out.open(encoding="utf-8")))
+    assert rows[0] == ["page_number", "table_index", "row_index", "preset", "x0", "top", "x1", "bottom", "cells"]
+    assert len(rows) == n + 1 == 7
+    assert rows[1][:3] == ["1", "0", "0"] and rows[-1][:3] == ["2", "0", "2"]
+    assert "p1r2c1" in rows[-1][8:]
+
+
+def test_csv_writer_append_and_none_cells(tmp_path):
+    out = tmp_path / "t.csv"
+    with CsvTableWriter(out) as writer:
+        writer.write(_page(1, [["a", None]]))
+    with CsvTableWriter(out, append=True) as writer:
+        writer.write(_page(2, [["b"]]))
+    rows = list(csv.reader(out.open(encoding="utf-8")))
+    assert [r[0] for r in rows] == ["page_number", "1", "2"]
+    assert rows[1][8:] == ["a", ""]
+
+
+def test_open_writer_rejects_unknown(tmp_path):
+    with pytest.raises(ValueError):
+        open_writer(tmp_path / "t.xlsx")
+    with pytest.raises(ValueError):
+        open_writer(tmp_path / "t.csv", format="xlsx")
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_arrow_writers_batch(tmp_path, suffix):
+    pa = pytest.importorskip("pyarrow")
+    out = tmp_path / f"t{suffix}"
+    with open_writer(out, batch_rows=2) as writer:
+        for n in range(1, 4):
+            writer.write(_page(n, [["x", None], ["y", "z"]]))
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        meta = pq.ParquetFile(out).metadata
+        assert meta.num_row_groups == 3
+        table = pq.read_table(out)
+    else:
+        table = pa.ipc.open_file(out).read_all()
+    assert table.num_rows == 6
+    assert table.column("cells").to_pylist()[0] == ["x", None]
+    assert table.column("page_number").to_pylist() == [1, 1, 2, 2, 3, 3]
@@ -0,0 +1,217 @@
+"""
+Streaming table writers.
+
+Writers consume `PageResult` objects one page at a time (e.g. straight
+from `extract_document`) and append one output row per table row, so
+memory stays flat however long the document is:
+
+>>> with open_writer("tables.parquet") as writer:
+...     writer.write_all(extract_document("statement.pdf"))
+
+Every row carries ``page_number``, ``table_index``, ``row_index``,
+``preset`` and the table bbox (``x0``, ``top``, ``x1``, ``bottom``) next to
+its cells.  CSV rows put the cells in the trailing columns (rows may
+differ in width); Parquet and Arrow store them in one ``list<string>``
+``cells`` column.
+
+`ParquetTableWriter` / `ArrowTableWriter` need ``pyarrow`` (``pip install
+tablex[arrow]``), imported on first use.  They buffer at most
+``batch_rows`` rows before writing a row group / record batch.
+"""
+
+import csv
+import pathlib
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from tablex.pipeline.document import PageResult
+
+
+COLUMNS = ("page_number", "table_index", "row_index", "preset", "x0", "top", "x1", "bottom")
+DEFAULT_BATCH_ROWS = 10_000
+
+
+def iter_rows(result: PageResult) -> Iterator[Tuple[Any, ...]]:
+    """``(*COLUMNS, cells)`` for every row of every table of one page."""
+    for ti, table in enumerate(result.tables):
+        x0, top, x1, bottom = table.bbox
+        for ri, cells in enumerate(table.rows):
+            yield result.page_number, ti, ri, result.preset, x0, top, x1, bottom, cells
+
+
+class TableWriter:
+    """Base class: ``write(result)`` per page, ``close()`` at the end."""
+
+    def __init__(self, path) -> None:
+        self.path = pathlib.Path(path)
+        self.rows_written = 0
+        self.closed = False
+
+    def write(self, result: PageResult) -> int:
+        """Append the rows of one page; returns the number of rows."""
+        raise NotImplementedError
+
+    def write_all(self, results: Iterable[PageResult]) -> int:
+        before = self.rows_written
+        for result in results:
+            self.write(result)
+        return self.rows_written - before
+
+    def close(self) -> None:
+        self.closed = True
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class CsvTableWriter(TableWriter):
+    """CSV with a header row; cells follow the metadata columns."""
+
+    def __init__(self, path, append: bool = False, **fmtparams: Any) -> None:
+        super().__init__(path)
+        header = not (append and self.path.exists() and self.path.stat().st_size)
+        self._fh = self.path.open("a" if append else "w", newline="", encoding="utf-8")
+        self._csv = csv.writer(self._fh, **fmtparams)
+        if header:
+            self._csv.writerow((*COLUMNS, "cells"))
+
+    def write(self, result: PageResult) -> int:
+        n = 0
+        for *meta, cells in iter_rows(result):
+            self._csv.writerow((*meta, *("" if c is None else c for c in cells)))
+            n += 1
+        self._fh.flush()
+        self.rows_written += n
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._fh.close()
+        super().close()
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:  # pragma: no cover – depends on the environment
+        raise ImportError("Parquet / Arrow writers need pyarrow: pip install tablex[arrow]") from exc
+    return pyarrow
+
+
+def arrow_schema():
+    pa = _pyarrow()
+    return pa.schema([
+        ("page_number", pa.int32()),
+        ("table_index", pa.int32()),
+        ("row_index", pa.int32()),
+        ("preset", pa.string()),
+        ("x0", pa.float64()),
+        ("top", pa.float64()),
+        ("x1", pa.float64()),
+        ("bottom", pa.float64()),
+        ("cells", pa.list_(pa.string())),
+    ])
+
+
+class _ArrowBatchWriter(TableWriter):
+    """Buffers column lists and flushes them as one record batch."""
+
+    def __init__(self, path, batch_rows: int = DEFAULT_BATCH_ROWS) -> None:
+        super().__init__(path)
+        self._pa = _pyarrow()
+        self.schema = arrow_schema()
+        self.batch_rows = batch_rows
+        self._columns: List[List[Any]] = [[] for _ in self.schema.names]
+        self._sink = self._open_sink()
+
+    def _open_sink(self):
+        raise NotImplementedError
+
+    def _write_batch(self, batch) -> None:
+        raise NotImplementedError
+
+    def write(self, result: PageResult) -> int:
+        n = 0
+        for row in iter_rows(result):
+            for col, value in zip(self._columns, row):
+                col.append(value)
+            n += 1
+        self.rows_written += n
+        if len(self._columns[0]) >= self.batch_rows:
+            self.flush()
+        return n
+
+    def flush(self) -> None:
+        if not self._columns[0]:
+            return
+        batch = self._pa.RecordBatch.from_arrays(
+            [self._pa.array(col, type=f.type) for col, f in zip(self._columns, self.schema)],
+            schema=self.schema,
+        )
+        self._write_batch(batch)
+        self._columns = [[] for _ in self.schema.names]
+
+    def close(self) -> None:
+        if not self.closed:
+            self.flush()
+            self._sink.close()
+        super().close()
+
+
+class ParquetTableWriter(_ArrowBatchWriter):
+    """One Parquet row group per ``batch_rows`` rows."""
+
+    def __init__(self, path, batch_rows: int = DEFAULT_BATCH_ROWS, compression: str = "zstd") -> None:
+        self.compression = compression
+        super().__init__(path, batch_rows)
+
+    def _open_sink(self):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(str(self.path), self.schema, compression=self.compression)
+
+    def _write_batch(self, batch) -> None:
+        self._sink.write_batch(batch)
+
+
+class ArrowTableWriter(_ArrowBatchWriter):
+    """Arrow IPC file (``stream=False``) or stream format."""
+
+    def __init__(self, path, batch_rows: int = DEFAULT_BATCH_ROWS, stream: bool = False) -> None:
+        self.stream = stream
+        super().__init__(path, batch_rows)
+
+    def _open_sink(self):
+        ipc = self._pa.ipc
+        return (ipc.new_stream if self.stream else ipc.new_file)(str(self.path), self.schema)
+
+    def _write_batch(self, batch) -> None:
+        self._sink.write_batch(batch)
+
+
+_SUFFIXES = {
+    ".csv": CsvTableWriter,
+    ".parquet": ParquetTableWriter,
+    ".pq": ParquetTableWriter,
+    ".arrow": ArrowTableWriter,
+    ".feather": ArrowTableWriter,
+    ".ipc": ArrowTableWriter,
+}
+FORMATS = {"csv": CsvTableWriter, "parquet": ParquetTableWriter, "arrow": ArrowTableWriter}
+
+
+def open_writer(path, format: Optional[str] = None, **kwargs: Any) -> TableWriter:
+    """Writer for *format* (``csv`` / ``parquet`` / ``arrow``), or chosen by suffix."""
+    if format is not None:
+        try:
+            cls = FORMATS[format.lower()]
+        except KeyError:
+            raise ValueError(f"unknown table format: {format!r}") from None
+    else:
+        suffix = pathlib.Path(path).suffix.lower()
+        if suffix not in _SUFFIXES:
+            raise ValueError(f"cannot infer table format from {path!r}")
+        cls = _SUFFIXES[suffix]
+    return cls(path, **kwargs)
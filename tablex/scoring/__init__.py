@@ -1,8 +1,33 @@
-"""Table scoring and search utilities."""
+"""Table scoring and search utilities.
 
-from .search import search_best_table_settings, score_tables
+Names are resolved lazily (PEP 562), so importing one scoring module does
+not load the predictor, adaptive order or region search.
+"""
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "search_best_table_settings",
-    "score_tables",
-]
+from tablex.utils.lazy import attach
+
+
+_LAZY = {
+    "AdaptiveOrder": ".adaptive",
+    "PageFeatureCache": ".cache",
+    "PresetPredictor": ".predict",
+    "Region": ".regions",
+    "RegionResult": ".regions",
+    "SearchStats": ".search",
+    "find_regions": ".regions",
+    "search_best_table_settings": ".search",
+    "score_tables": ".search",
+    "search_regions": ".regions",
+}
+
+__all__ = list(_LAZY)
+__getattr__, __dir__ = attach(__name__, _LAZY)
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .adaptive import AdaptiveOrder
+    from .cache import PageFeatureCache
+    from .predict import PresetPredictor
+    from .regions import Region, RegionResult, find_regions, search_regions
+    from .search import SearchStats, search_best_table_settings, score_tables
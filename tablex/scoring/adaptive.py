@@ -0,0 +1,214 @@
+"""
+Adaptive preset order learned from our own documents.
+
+`iter_compiled_settings` yields presets in the hand-written priority order
+of `tablex.utils.table_settings`.  `AdaptiveOrder` records, per preset,
+how often it ran, how often it won, its scores and the time spent in
+``find_tables``, persists that in a small JSON stats file, and reorders
+the presets with a UCB1 bandit policy:
+
+    index = win_rate + exploration · sqrt(ln(pages) / runs)
+
+Presets that never ran come first (in priority order), so a fresh stats
+file reproduces the default order; ties are broken by mean cost, then
+priority.  With ``skip_after=n`` presets that ran *n* times without ever
+winning are left out.  On a share ``epsilon`` of pages the default order
+is used without skipping, so every preset keeps being re-evaluated.
+
+The order alone only changes what runs first: `search_best_table_settings`
+breaks score ties by priority, so exhaustive and ``bounded=True,
+exact=True`` searches return the same pick.  The gain comes with early
+exits – ``skip_after``, the predictor's ``top_k`` and ``bounded=True``
+(whose estimate only prunes behind a strong current best) – which stop
+sooner when the usual winner is tried first:
+
+>>> order = AdaptiveOrder.open("preset_stats.json")
+>>> search_best_table_settings(page, bounded=True, order=order)
+>>> order.save()
+
+Saving merges this process's increments into the file under a lock, so
+pool workers can share one stats file.
+"""
+
+import json
+import math
+import os
+import pathlib
+import random
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from tablex.utils.log import get_logger
+from tablex.utils.table_settings import iter_compiled_settings
+
+try:  # POSIX advisory lock for concurrent savers
+    import fcntl
+except ImportError:  # pragma: no cover – Windows
+    fcntl = None
+
+
+logger = get_logger(__name__)
+
+STATS_VERSION = 1
+
+
+@dataclass(slots=True)
+class PresetRecord:
+    runs: int = 0
+    wins: int = 0
+    score_sum: float = 0.0
+    cost_sum: float = 0.0  # seconds spent in find_tables
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.runs if self.runs else 0.0
+
+    @property
+    def mean_cost(self) -> float:
+        return self.cost_sum / self.runs if self.runs else 0.0
+
+    def add(self, other: "PresetRecord") -> None:
+        self.runs += other.runs
+        self.wins += other.wins
+        self.score_sum += other.score_sum
+        self.cost_sum += other.cost_sum
+
+
+def _priority() -> Dict[str, int]:
+    return {p.name: i for i, p in enumerate(iter_compiled_settings())}
+
+
+class AdaptiveOrder:
+    """Bandit ordering of presets with persisted win statistics."""
+
+    def __init__(
+        self,
+        path=None,
+        *,
+        exploration: float = 0.5,
+        epsilon: float = 0.05,
+        skip_after: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.path = pathlib.Path(path) if path is not None else None
+        self.exploration = exploration
+        self.epsilon = epsilon
+        self.skip_after = skip_after
+        self.records: Dict[str, PresetRecord] = {}
+        self.pages = 0
+        self.explored = 0  # pages that used the default order
+        self._delta: Dict[str, PresetRecord] = {}
+        self._delta_pages = 0
+        self._rng = random.Random(seed)
+        self._priority = _priority()
+
+    @classmethod
+    def open(cls, path, **kwargs: Any) -> "AdaptiveOrder":
+        """Order backed by the stats file *path* (loaded when it exists)."""
+        order = cls(path, **kwargs)
+        if order.path.exists():
+            order._merge(order._read(order.path))
+        return order
+
+    # -------------------------------------------------------------- #
+    # policy
+    # -------------------------------------------------------------- #
+
+    def _index(self, name: str) -> float:
+        rec = self.records.get(name)
+        if rec is None or not rec.runs:
+            return math.inf
+        bonus = self.exploration * math.sqrt(math.log(max(self.pages, 1)) / rec.runs)
+        return rec.win_rate + bonus
+
+    def order(self, names: Sequence[str]) -> List[str]:
+        """*names* reordered (and possibly thinned) for the next page."""
+        default = sorted(names, key=lambda n: self._priority.get(n, len(self._priority)))
+        if self.epsilon and self._rng.random() < self.epsilon:
+            self.explored += 1
+            return default
+        keep = default
+        if self.skip_after:
+            keep = [n for n in default if not self._exhausted(n)] or default
+        return sorted(keep, key=self._key)
+
+    def _key(self, name: str):
+        rec = self.records.get(name)
+        return -self._index(name), rec.mean_cost if rec else 0.0, self._priority.get(name, len(self._priority))
+
+    def _exhausted(self, name: str) -> bool:
+        rec = self.records.get(name)
+        return rec is not None and rec.runs >= self.skip_after and rec.wins == 0
+
+    def record(self, evaluated: Iterable[Tuple[str, Optional[float], float]], winner: Optional[str]) -> None:
+        """Account one page: ``(preset, score or None, find_tables seconds)`` per run preset."""
+        self.pages += 1
+        self._delta_pages += 1
+        for name, score, cost in evaluated:
+            upd = PresetRecord(1, int(name == winner), score or 0.0, cost)
+            self.records.setdefault(name, PresetRecord()).add(upd)
+            self._delta.setdefault(name, PresetRecord()).add(upd)
+
+    # -------------------------------------------------------------- #
+    # persistence
+    # -------------------------------------------------------------- #
+
+    @staticmethod
+    def _read(path: pathlib.Path) -> Tuple[int, Dict[str, PresetRecord]]:
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("ignoring unreadable preset stats %s: %s", path, exc)
+            return 0, {}
+        if doc.get("version") != STATS_VERSION:
+            logger.warning("ignoring preset stats %s of version %s", path, doc.get("version"))
+            return 0, {}
+        return int(doc.get("pages", 0)), {n: PresetRecord(**r) for n, r in doc.get("presets", {}).items()}
+
+    def _merge(self, loaded: Tuple[int, Dict[str, PresetRecord]]) -> None:
+        pages, records = loaded
+        self.pages += pages
+        for name, rec in records.items():
+            self.records.setdefault(name, PresetRecord()).add(rec)
+
+    @contextmanager
+    def _locked(self, path: pathlib.Path):
+        if fcntl is None:
+            yield
+            return
+        with open(path.with_name(path.name + ".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def save(self, path=None) -> None:
+        """Add this process's new records to the stats file (atomic replace)."""
+        path = pathlib.Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("no stats file given")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked(path):
+            pages, records = self._read(path) if path.exists() else (0, {})
+            for name, rec in self._delta.items():
+                records.setdefault(name, PresetRecord()).add(rec)
+            pages += self._delta_pages
+            doc = {
+                "version": STATS_VERSION,
+                "pages": pages,
+                "presets": {n: asdict(r) for n, r in sorted(records.items())},
+            }
+            tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(doc, indent=1), encoding="utf-8")
+            os.replace(tmp, path)
+        self._delta.clear()
+        self._delta_pages = 0
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-preset statistics in the current policy order."""
+        return [
+            {"preset": n, **asdict(r), "win_rate": round(r.win_rate, 4), "mean_cost": r.mean_cost}
+            for n in sorted(self.records, key=self._key) for r in [self.records[n]]
+        ]
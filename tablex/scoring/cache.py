@@ -0,0 +1,215 @@
+"""
+Per-page feature cache for ``find_tables``.
+
+`search_best_table_settings` runs ``page.find_tables`` for every preset in
+`TABLE_SETTINGS_VARIANTS`.  Most presets share intermediate results: the
+same extracted words (same ``text_*`` tolerances), the same base edges,
+the same snapped/joined edges.  `PageFeatureCache` mirrors
+``pdfplumber.table.TableFinder`` stage by stage and memoises every stage
+under a key built only from the settings that stage depends on:
+
+==================  ===================================================
+stage               key
+==================  ===================================================
+words               text settings (``text_*`` keys)
+chars               – (one `CharIndex` per page, for geometry scoring)
+base edges          strategy (+ prefilter length or words & min_words)
+merged edges        v/h base keys + explicit lines + snap/join tolerances
+filtered edges      merged key + ``edge_min_length``
+tables              filtered key + intersection tolerances
+==================  ===================================================
+
+The last stage builds tables with the sweep-line engine of
+`tablex.scoring.grid` instead of pdfplumber's all-pairs intersection
+test.  Tables are byte-for-byte what ``page.find_tables(settings)``
+returns.
+"""
+
+from collections import Counter
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from pdfplumber import utils
+from pdfplumber.table import Table, TableSettings, merge_edges, words_to_edges_h, words_to_edges_v
+
+from tablex.scoring.grid import grid_tables
+from tablex.utils.char_index import CharIndex
+from tablex.utils.table_settings import resolve_table_settings
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn settings values (lists / dicts) into hashable keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class PageFeatureCache:
+    """Memoise words / edges / tables of one page across table settings."""
+
+    def __init__(self, page) -> None:
+        self.page = page
+        self._store: Dict[Tuple[str, Hashable], Any] = {}
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+
+    # ------------------------------------------------------------------ #
+    def _memo(self, stage: str, key: Hashable, build):
+        full_key = (stage, key)
+        if full_key in self._store:
+            self.hits[stage] += 1
+            return self._store[full_key]
+        self.misses[stage] += 1
+        value = self._store[full_key] = build()
+        return value
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    # ------------------------------------------------------------------ #
+    # Stage 1 – words
+    # ------------------------------------------------------------------ #
+    def words(self, text_settings: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        text_settings = text_settings or {}
+        return self._memo(
+            "words",
+            _freeze(text_settings),
+            lambda: self.page.extract_words(**text_settings),
+        )
+
+    def char_index(self) -> CharIndex:
+        """Midpoint index of ``page.chars`` used for geometry scoring."""
+        return self._memo("chars", None, lambda: CharIndex.from_page(self.page))
+
+    # ------------------------------------------------------------------ #
+    # Stage 2 – base edges per orientation
+    # ------------------------------------------------------------------ #
+    def _base_key(self, orientation: str, settings: TableSettings) -> Hashable:
+        strategy = getattr(settings, orientation + "_strategy")
+        if strategy in ("lines", "lines_strict"):
+            return strategy, settings.edge_min_length_prefilter
+        if strategy == "text":
+            min_words = settings.min_words_vertical if orientation == "vertical" else settings.min_words_horizontal
+            return strategy, _freeze(settings.text_settings), min_words
+        return (strategy,)
+
+    def base_edges(self, orientation: str, settings: TableSettings) -> List[Dict[str, Any]]:
+        strategy = getattr(settings, orientation + "_strategy")
+        o = orientation[0]
+
+        def build():
+            if strategy == "lines":
+                return utils.filter_edges(self.page.edges, o, min_length=settings.edge_min_length_prefilter)
+            if strategy == "lines_strict":
+                return utils.filter_edges(
+                    self.page.edges, o, edge_type="line", min_length=settings.edge_min_length_prefilter,
+                )
+            if strategy == "text":
+                words = self.words(settings.text_settings)
+                if o == "v":
+                    return words_to_edges_v(words, word_threshold=settings.min_words_vertical)
+                return words_to_edges_h(words, word_threshold=settings.min_words_horizontal)
+            return []
+
+        return self._memo("base_" + o, self._base_key(orientation, settings), build)
+
+    def _explicit_edges(self, orientation: str, settings: TableSettings) -> List[Dict[str, Any]]:
+        o = orientation[0]
+        bbox = self.page.bbox
+        out = []
+        for desc in getattr(settings, "explicit_" + orientation + "_lines") or []:
+            if isinstance(desc, dict):
+                out.extend(e for e in utils.obj_to_edges(desc) if e["orientation"] == o)
+            elif o == "v":
+                out.append({
+                    "x0": desc, "x1": desc, "top": bbox[1], "bottom": bbox[3],
+                    "height": bbox[3] - bbox[1], "orientation": "v",
+                })
+            else:
+                out.append({
+                    "x0": bbox[0], "x1": bbox[2], "width": bbox[2] - bbox[0],
+                    "top": desc, "bottom": desc, "orientation": "h",
+                })
+        return out
+
+    # ------------------------------------------------------------------ #
+    # Stage 3/4 – merged (snapped + joined) and length-filtered edges
+    # ------------------------------------------------------------------ #
+    def _merged_key(self, settings: TableSettings) -> Hashable:
+        return (
+            self._base_key("vertical", settings),
+            _freeze(settings.explicit_vertical_lines or []),
+            self._base_key("horizontal", settings),
+            _freeze(settings.explicit_horizontal_lines or []),
+            settings.snap_x_tolerance,
+            settings.snap_y_tolerance,
+            settings.join_x_tolerance,
+            settings.join_y_tolerance,
+        )
+
+    def merged_edges(self, settings: TableSettings) -> List[Dict[str, Any]]:
+        def build():
+            v = self.base_edges("vertical", settings) + self._explicit_edges("vertical", settings)
+            h = self.base_edges("horizontal", settings) + self._explicit_edges("horizontal", settings)
+            return merge_edges(
+                list(v) + list(h),
+                snap_x_tolerance=settings.snap_x_tolerance,
+                snap_y_tolerance=settings.snap_y_tolerance,
+                join_x_tolerance=settings.join_x_tolerance,
+                join_y_tolerance=settings.join_y_tolerance,
+            )
+
+        return self._memo("merged", self._merged_key(settings), build)
+
+    def edges(self, settings: TableSettings) -> List[Dict[str, Any]]:
+        key = (self._merged_key(settings), settings.edge_min_length)
+        return self._memo(
+            "edges", key,
+            lambda: utils.filter_edges(self.merged_edges(settings), min_length=settings.edge_min_length),
+        )
+
+    # ------------------------------------------------------------------ #
+    # Stage 5 – tables
+    # ------------------------------------------------------------------ #
+    def table_key(self, settings: TableSettings) -> Hashable:
+        return (
+            self._merged_key(settings),
+            settings.edge_min_length,
+            settings.intersection_x_tolerance,
+            settings.intersection_y_tolerance,
+        )
+
+    def canonical_key(self, table_settings: Any = None) -> Hashable:
+        """Key that is equal for settings yielding the same tables on *this* page.
+
+        Like `table_key` it ignores settings a strategy does not read; on top
+        of that every setting with < 2 edges in an orientation collapses to
+        ``("empty",)`` since no cell can be formed.
+        """
+        settings = resolve_table_settings(table_settings)
+        n_v = len(self.base_edges("vertical", settings)) + len(self._explicit_edges("vertical", settings))
+        n_h = len(self.base_edges("horizontal", settings)) + len(self._explicit_edges("horizontal", settings))
+        if n_v < 2 or n_h < 2:
+            return ("empty",)
+        return self.table_key(settings)
+
+    def find_tables(self, table_settings: Any = None) -> List[Table]:
+        """Drop-in replacement for ``page.find_tables(table_settings)``."""
+        settings = resolve_table_settings(table_settings)
+        for orientation in ("vertical", "horizontal"):
+            if getattr(settings, orientation + "_strategy") == "explicit":
+                lines = getattr(settings, "explicit_" + orientation + "_lines")
+                if len(lines or []) < 2:
+                    raise ValueError(
+                        f"If {orientation}_strategy == 'explicit', "
+                        f"explicit_{orientation}_lines must be specified as a "
+                        f"list/tuple of two or more floats/ints."
+                    )
+
+        def build():
+            return grid_tables(
+                self.page, self.edges(settings), settings.intersection_x_tolerance, settings.intersection_y_tolerance,
+            )
+
+        return list(self._memo("tables", self.table_key(settings), build))
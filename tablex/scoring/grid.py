@@ -0,0 +1,186 @@
+"""
+Intersection grid engine for ``find_tables``.
+
+After snapping and joining, pdfplumber turns edges into tables in three
+steps – `edges_to_intersections`, `intersections_to_cells` and
+`cells_to_tables` – each of which compares everything with everything:
+every vertical edge against every horizontal one, every point against
+the rest of the sorted point list, every cell against the remaining
+cells.  On pages with thousands of tiny cell borders that dominates a
+``lines`` / ``explicit`` preset.
+
+The functions below return exactly what the pdfplumber ones do (same
+intersections with the same edge lists, same cells in the same order,
+same cell groups), in roughly O(n log n):
+
+* **intersections** – sweep over x.  A horizontal edge is active while
+  ``x0 - x_tol <= x <= x1 + x_tol``; active edges are kept as positions
+  in the ``(top, x0)``-sorted edge list, so the edges crossing a vertical
+  edge are one bisected slice;
+* **cells** – points are bucketed per column and per row, so the
+  candidates below / right of a point are a slice instead of a scan, and
+  edge connectivity is a set-disjointness test on precomputed bbox sets;
+* **tables** – cells sharing a corner are grouped by union-find; within a
+  group pdfplumber's pass order is replayed so cells keep its order.
+
+`grid_tables` chains them and builds ``pdfplumber.table.Table`` objects,
+so `score_tables` and ``extract`` work on the result unchanged.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from pdfplumber import utils
+from pdfplumber.table import Table
+
+
+Point = Tuple[float, float]
+BBox = Tuple[float, float, float, float]
+
+_EPS = 1e-9  # slack for the bisected ranges; the exact test follows
+
+
+def edges_to_intersections(
+    edges: Sequence[Dict[str, Any]], x_tolerance: float = 1, y_tolerance: float = 1,
+) -> Dict[Point, Dict[str, List[Dict[str, Any]]]]:
+    """Sweep-line drop-in for ``pdfplumber.table.edges_to_intersections``."""
+    v_edges = sorted((e for e in edges if e["orientation"] == "v"), key=itemgetter("x0", "top"))
+    h_edges = sorted((e for e in edges if e["orientation"] == "h"), key=itemgetter("top", "x0"))
+    tops = [h["top"] for h in h_edges]
+    starts = sorted(range(len(h_edges)), key=lambda i: h_edges[i]["x0"] - x_tolerance)
+    ends: List[Tuple[float, int]] = []  # heap of (x1 + x_tol, position)
+    active: List[int] = []  # positions into h_edges, sorted
+    nxt = 0
+    intersections: Dict[Point, Dict[str, List[Dict[str, Any]]]] = {}
+    for v in v_edges:
+        x = v["x0"]
+        while nxt < len(starts) and x >= h_edges[starts[nxt]]["x0"] - x_tolerance:
+            i = starts[nxt]
+            active.insert(bisect_left(active, i), i)
+            heapq.heappush(ends, (h_edges[i]["x1"] + x_tolerance, i))
+            nxt += 1
+        while ends and not x <= ends[0][0]:
+            _, i = heapq.heappop(ends)
+            del active[bisect_left(active, i)]
+        if not active:
+            continue
+        lo = bisect_left(tops, v["top"] - y_tolerance - _EPS)
+        hi = bisect_right(tops, v["bottom"] + y_tolerance + _EPS)
+        for i in active[bisect_left(active, lo):bisect_left(active, hi)]:
+            h = h_edges[i]
+            if v["top"] <= h["top"] + y_tolerance and v["bottom"] >= h["top"] - y_tolerance:
+                vertex = (x, h["top"])
+                if vertex not in intersections:
+                    intersections[vertex] = {"v": [], "h": []}
+                intersections[vertex]["v"].append(v)
+                intersections[vertex]["h"].append(h)
+    return intersections
+
+
+def intersections_to_cells(intersections: Dict[Point, Dict[str, List[Dict[str, Any]]]]) -> List[BBox]:
+    """Bucketed drop-in for ``pdfplumber.table.intersections_to_cells``."""
+    points = sorted(intersections)
+    v_sets: Dict[Point, FrozenSet[BBox]] = {}
+    h_sets: Dict[Point, FrozenSet[BBox]] = {}
+    for pt in points:
+        v_sets[pt] = frozenset(map(utils.obj_to_bbox, intersections[pt]["v"]))
+        h_sets[pt] = frozenset(map(utils.obj_to_bbox, intersections[pt]["h"]))
+
+    def connects(p1: Point, p2: Point) -> bool:
+        if p1[0] == p2[0] and not v_sets[p1].isdisjoint(v_sets[p2]):
+            return True
+        return p1[1] == p2[1] and not h_sets[p1].isdisjoint(h_sets[p2])
+
+    # points sorted by (x, y): a column is a contiguous run, rows are x-ordered
+    columns: Dict[float, List[Point]] = defaultdict(list)
+    rows: Dict[float, List[Point]] = defaultdict(list)
+    for pt in points:
+        columns[pt[0]].append(pt)
+        rows[pt[1]].append(pt)
+
+    cells: List[BBox] = []
+    for pt in points:
+        column, row = columns[pt[0]], rows[pt[1]]
+        below = column[bisect_right(column, pt):]
+        right = row[bisect_right(row, pt):]
+        cell = _smallest_cell(pt, below, right, v_sets, connects)
+        if cell is not None:
+            cells.append(cell)
+    return cells
+
+
+def _smallest_cell(pt: Point, below, right, corners, connects) -> Optional[BBox]:
+    for below_pt in below:
+        if not connects(pt, below_pt):
+            continue
+        for right_pt in right:
+            if not connects(pt, right_pt):
+                continue
+            bottom_right = (right_pt[0], below_pt[1])
+            if bottom_right in corners and connects(bottom_right, right_pt) and connects(bottom_right, below_pt):
+                return pt[0], pt[1], bottom_right[0], bottom_right[1]
+    return None
+
+
+def _corners(cell: BBox) -> Tuple[Point, Point, Point, Point]:
+    x0, top, x1, bottom = cell
+    return (x0, top), (x0, bottom), (x1, top), (x1, bottom)
+
+
+def cells_to_tables(cells: Sequence[BBox]) -> List[List[BBox]]:
+    """Union-find drop-in for ``pdfplumber.table.cells_to_tables``."""
+    parent = list(range(len(cells)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner: Dict[Point, int] = {}
+    for i, cell in enumerate(cells):
+        for corner in _corners(cell):
+            j = owner.setdefault(corner, i)
+            ri, rj = find(i), find(j)
+            if ri != rj:
+                parent[max(ri, rj)] = min(ri, rj)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for i in range(len(cells)):
+        groups[find(i)].append(i)
+
+    tables = []
+    for members in groups.values():  # keyed by first member → pdfplumber's group order
+        tables.append(_replay(cells, members))
+    _sorted = sorted(tables, key=lambda t: min((c[1], c[0]) for c in t))
+    return [t for t in _sorted if len(t) > 1]
+
+
+def _replay(cells: Sequence[BBox], members: List[int]) -> List[BBox]:
+    """Cell order of pdfplumber's repeated passes, restricted to one group."""
+    first = cells[members[0]]
+    group = [first]
+    corners = set(_corners(first))
+    pending = members[1:]
+    while pending:
+        rest = []
+        for i in pending:
+            cell = _corners(cells[i])
+            if any(c in corners for c in cell):
+                corners.update(cell)
+                group.append(cells[i])
+            else:
+                rest.append(i)
+        if len(rest) == len(pending):  # pragma: no cover – a group is corner-connected
+            break
+        pending = rest
+    return group
+
+
+def grid_tables(page, edges: Sequence[Dict[str, Any]], x_tolerance: float = 3, y_tolerance: float = 3) -> List[Table]:
+    """Tables of *page* from merged, length-filtered *edges*."""
+    cells = intersections_to_cells(edges_to_intersections(edges, x_tolerance, y_tolerance))
+    return [Table(page, group) for group in cells_to_tables(cells)]
@@ -0,0 +1,274 @@
+"""
+Preset predictor: rank presets from cheap page features.
+
+Most pages of one corpus are won by a handful of presets.  `page_features`
+summarises a page in a few numbers (explicit v / h line counts, the
+`has_large_table` verdict, the line / rect / curve mix, char density and
+size); `PresetPredictor` is a nearest-centroid model over them – one
+standardised centroid per winning preset, stored as plain JSON and
+evaluated with NumPy.  ``search_best_table_settings(..., predictor=model,
+top_k=k)`` then runs only the *k* nearest presets (falling back to the
+rest when none of them yields a table).
+
+Training works from exhaustive-search logs (one JSON line per page with
+its features and winning preset)::
+
+    python -m tablex.scoring.predict log corpus/ -o search.jsonl
+    python -m tablex.scoring.predict train search.jsonl -o presets.json
+    python -m tablex.scoring.predict report presets.json held_out.jsonl
+
+``report`` gives the top-k recall – the share of table pages whose
+exhaustive winner is among the *k* predicted presets.  When it is, the
+restricted search returns exactly the exhaustive pick (presets keep their
+priority order, so ties resolve the same way).
+"""
+
+import argparse
+import json
+import math
+import pathlib
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tablex.lines import extract_explicit_lines
+from tablex.utils.char_index import CharIndex
+from tablex.utils.geometry import PageGeometry
+from tablex.utils.large_table import has_large_table
+from tablex.utils.log import get_logger
+from tablex.utils.table_settings import iter_compiled_settings
+
+
+logger = get_logger(__name__)
+
+MODEL_VERSION = 1
+
+FEATURES: Tuple[str, ...] = (
+    "explicit_v",  # explicit vertical line count
+    "explicit_h",  # explicit horizontal line count
+    "large_table",  # has_large_table verdict (0 / 1)
+    "line_share",  # share of lines among lines + rects + curves
+    "rect_share",
+    "curve_share",
+    "char_density",  # chars per 10⁴ pt² of page
+    "log_primitives",  # log1p(lines + rects + curves + chars)
+)
+
+
+def page_features(
+    page,
+    explicit_lines: Optional[Tuple[Sequence[float], Sequence[float]]] = None,
+    *,
+    geometry: Optional[PageGeometry] = None,
+    char_index: Optional[CharIndex] = None,
+) -> np.ndarray:
+    """`FEATURES` vector of *page*; pass what the search already computed."""
+    g = geometry if geometry is not None else PageGeometry.from_page(page)
+    if explicit_lines is None:
+        try:
+            explicit_lines = extract_explicit_lines(page, dump_rects_log=False, geometry=g)
+        except RuntimeWarning:  # “此页没有表格”
+            explicit_lines = ([], [])
+    n_chars = len(char_index) if char_index is not None else len(page.chars)
+    n = max(len(g.kind), 1)
+    area = max(page.width * page.height, 1.0)
+    return np.array([
+        len(explicit_lines[0]),
+        len(explicit_lines[1]),
+        float(has_large_table(page, geometry=g)),
+        g.lines.sum() / n,
+        g.rects.sum() / n,
+        g.curves.sum() / n,
+        n_chars / area * 1e4,
+        math.log1p(len(g.kind) + n_chars),
+    ], dtype=float)
+
+
+@dataclass(slots=True)
+class PresetPredictor:
+    """Nearest-centroid ranking of presets in standardised feature space."""
+
+    presets: List[str]
+    centroids: np.ndarray  # (len(presets), len(FEATURES))
+    mean: np.ndarray
+    scale: np.ndarray
+    counts: List[int] = field(default_factory=list)  # training pages per preset
+    features: Tuple[str, ...] = FEATURES
+
+    @classmethod
+    def fit(cls, X: np.ndarray, winners: Sequence[str]) -> "PresetPredictor":
+        X = np.asarray(X, dtype=float).reshape(len(winners), -1)
+        if not len(X):
+            raise ValueError("no training pages with a winning preset")
+        mean = X.mean(axis=0)
+        scale = X.std(axis=0)
+        scale[scale == 0] = 1.0
+        Z = (X - mean) / scale
+        winners = np.asarray(winners)
+        order = [p.name for p in iter_compiled_settings()]
+        presets = sorted(set(winners.tolist()), key=lambda p: order.index(p) if p in order else len(order))
+        centroids = np.stack([Z[winners == p].mean(axis=0) for p in presets])
+        counts = [int((winners == p).sum()) for p in presets]
+        return cls(presets, centroids, mean, scale, counts)
+
+    def rank(self, features: np.ndarray) -> List[str]:
+        """Every preset, nearest centroid first; presets never seen winning last."""
+        z = (np.asarray(features, dtype=float) - self.mean) / self.scale
+        dist = np.linalg.norm(self.centroids - z, axis=1)
+        # ties (e.g. identical centroids) → more frequent winner first
+        ranked = [self.presets[i] for i in np.lexsort((-np.asarray(self.counts), dist))]
+        seen = set(ranked)
+        return ranked + [p.name for p in iter_compiled_settings() if p.name not in seen]
+
+    def top_k(self, features: np.ndarray, k: int) -> List[str]:
+        return self.rank(features)[:k]
+
+    # -------------------------------------------------------------- #
+    # plain-JSON persistence
+    # -------------------------------------------------------------- #
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": MODEL_VERSION,
+            "model": "nearest-centroid",
+            "features": list(self.features),
+            "mean": self.mean.tolist(),
+            "scale": self.scale.tolist(),
+            "presets": list(self.presets),
+            "centroids": self.centroids.tolist(),
+            "counts": list(self.counts),
+        }
+
+    @classmethod
+    def from_dict(cls, doc: Dict[str, Any]) -> "PresetPredictor":
+        if doc.get("version") != MODEL_VERSION or tuple(doc["features"]) != FEATURES:
+            raise ValueError("preset model was trained on a different feature set; retrain it")
+        return cls(
+            list(doc["presets"]),
+            np.asarray(doc["centroids"], dtype=float).reshape(len(doc["presets"]), len(FEATURES)),
+            np.asarray(doc["mean"], dtype=float),
+            np.asarray(doc["scale"], dtype=float),
+            list(doc.get("counts", [])),
+        )
+
+    def save(self, path) -> None:
+        pathlib.Path(path).write_text(json.dumps(self.to_dict(), indent=1), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path) -> "PresetPredictor":
+        return cls.from_dict(json.loads(pathlib.Path(path).read_text(encoding="utf-8")))
+
+
+# ------------------------------------------------------------------- #
+# Logs, training and recall
+# ------------------------------------------------------------------- #
+
+def log_page(page) -> Dict[str, Any]:
+    """Exhaustive-search log record: features and winning preset (``None``: no table)."""
+    from tablex.scoring.search import search_best_table_settings
+
+    g = PageGeometry.from_page(page)
+    feats = page_features(page, geometry=g)
+    try:
+        name, _, _, tables, _, _ = search_best_table_settings(page, debug=False)
+    except RuntimeWarning:
+        name, tables = None, []
+    winner = name if tables else None
+    return {"page": page.page_number, "features": feats.tolist(), "winner": winner}
+
+
+def read_logs(paths: Iterable) -> Tuple[np.ndarray, List[Optional[str]]]:
+    """(features, winners) of every log line, in file order."""
+    X, y = [], []
+    for path in paths:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                rec = json.loads(line)
+                if "features" not in rec:  # error lines of the `log` command
+                    continue
+                X.append(rec["features"])
+                y.append(rec["winner"])
+    return np.asarray(X, dtype=float).reshape(len(X), len(FEATURES)), y
+
+
+def train(X: np.ndarray, winners: Sequence[Optional[str]]) -> PresetPredictor:
+    """Fit on the pages that have a winner (table-free pages carry no label)."""
+    keep = np.array([w is not None for w in winners], dtype=bool)
+    return PresetPredictor.fit(np.asarray(X)[keep], [w for w in winners if w is not None])
+
+
+def recall_report(model: PresetPredictor, X: np.ndarray, winners: Sequence[Optional[str]], max_k: int = 5) -> Dict[str, Any]:
+    """Top-k recall of *model* for k = 1 … *max_k* against logged winners."""
+    positions = []
+    for feats, winner in zip(X, winners):
+        if winner is None:
+            continue
+        ranked = model.rank(feats)
+        positions.append(ranked.index(winner) if winner in ranked else len(ranked))
+    pos = np.asarray(positions)
+    n = len(pos)
+    n_presets = sum(1 for _ in iter_compiled_settings())
+    return {
+        "pages": len(winners),
+        "table_pages": n,
+        "presets": n_presets,
+        "recall": {str(k): round(float((pos < k).mean()), 4) if n else 0.0 for k in range(1, max_k + 1)},
+        "k_for_full_recall": int(pos.max()) + 1 if n else 0,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tablex.scoring.predict", description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_log = sub.add_parser("log", help="run the exhaustive search and log features + winner per page")
+    p_log.add_argument("inputs", nargs="+", help="PDF files, directories or @list files")
+    p_log.add_argument("-o", "--output", required=True, help="JSONL log")
+    p_log.add_argument("-r", "--recursive", action="store_true")
+
+    p_train = sub.add_parser("train", help="fit the preset model from search logs")
+    p_train.add_argument("logs", nargs="+")
+    p_train.add_argument("-o", "--output", required=True, help="model JSON")
+
+    p_report = sub.add_parser("report", help="top-k recall of a model against search logs")
+    p_report.add_argument("model")
+    p_report.add_argument("logs", nargs="+")
+    p_report.add_argument("-k", "--max-k", type=int, default=5)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "log":
+        import pdfplumber
+
+        from tablex.pipeline.batch import discover_pdfs
+
+        with open(args.output, "w", encoding="utf-8") as out:
+            for path in discover_pdfs(args.inputs, recursive=args.recursive):
+                try:
+                    with pdfplumber.open(path) as pdf:
+                        for page in pdf.pages:
+                            out.write(json.dumps({"file": path, **log_page(page)}) + "\n")
+                            page.close()
+                except Exception as exc:
+                    logger.warning("%s: %s", path, exc)
+                    out.write(json.dumps({"file": path, "error": f"{type(exc).__name__}: {exc}"}) + "\n")
+        return 0
+
+    if args.command == "train":
+        X, y = read_logs(args.logs)
+        model = train(X, y)
+        model.save(args.output)
+        print(f"{len(model.presets)} presets from {sum(model.counts)} table pages -> {args.output}", file=sys.stderr)
+        return 0
+
+    X, y = read_logs(args.logs)
+    print(json.dumps(recall_report(PresetPredictor.load(args.model), X, y, args.max_k), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
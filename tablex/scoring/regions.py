@@ -0,0 +1,230 @@
+"""
+Region decomposition for the settings search.
+
+`search_best_table_settings` lets one preset win for the whole page, so a
+page with a ruled grid *and* a borderless summary table gets a compromise.
+`find_regions` splits the page first:
+
+* **ruled** regions – axis-aligned segments and rect sides are grouped
+  into connected components with union-find (two primitives connect when
+  their bboxes, grown by ``tol``, touch); components with ≥ 2 vertical and
+  ≥ 2 horizontal members become regions;
+* **text** regions – full-width bands between / around the ruled regions
+  that still contain characters (borderless tables for the ``text``
+  strategies).
+
+`search_regions` then runs `search_best_table_settings` on
+``page.crop(bbox)`` of every region, independently and optionally on a
+thread pool.  Explicit lines are detected once on the whole page (the
+heuristics are page-relative) and handed to each region, filtered to its
+bbox.  Tables keep page coordinates, as with any pdfplumber crop.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from tablex.lines import extract_explicit_lines
+from tablex.scoring.search import search_best_table_settings
+from tablex.utils.char_index import CharIndex
+from tablex.utils.geometry import KIND_RECT, ORIENT_H, ORIENT_V, PageGeometry
+from tablex.utils.log import get_logger
+
+
+logger = get_logger(__name__)
+
+BBox = Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True, slots=True)
+class Region:
+    bbox: BBox  # (x0, top, x1, bottom)
+    kind: str  # "ruled" | "text"
+    n_edges: int = 0
+
+
+@dataclass(slots=True)
+class RegionResult:
+    """`search_best_table_settings` outcome for one region."""
+
+    region: Region
+    preset: Optional[str]
+    strategy: Tuple[Optional[str], Optional[str]]
+    settings: Optional[Dict[str, Any]]
+    tables: List[Any] = field(default_factory=list)
+    explicit_v: List[float] = field(default_factory=list)
+    explicit_h: List[float] = field(default_factory=list)
+
+
+# ------------------------------------------------------------------- #
+# 1.   Union-find over edge primitives
+# ------------------------------------------------------------------- #
+
+def _find(parent: np.ndarray, i: int) -> int:
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    while parent[i] != root:  # path compression
+        parent[i], i = root, parent[i]
+    return root
+
+
+def connected_components(boxes: np.ndarray, tol: float = 3.0) -> np.ndarray:
+    """Component label per ``(x0, top, x1, bottom)`` row; touching boxes share one."""
+    n = len(boxes)
+    parent = np.arange(n)
+    if n < 2:
+        return parent
+    order = np.argsort(boxes[:, 0], kind="stable")
+    b = boxes[order]
+    x0, top, x1, bottom = b.T
+    ends = np.searchsorted(x0, x1 + tol, side="right")
+    for i in range(n):
+        hi = ends[i]
+        if hi <= i + 1:
+            continue
+        j = np.arange(i + 1, hi)
+        j = j[(top[j] <= bottom[i] + tol) & (bottom[j] >= top[i] - tol)]
+        if not len(j):
+            continue
+        ri = _find(parent, i)
+        for k in j.tolist():
+            rk = _find(parent, k)
+            if rk != ri:
+                parent[rk] = ri
+    labels = np.fromiter((_find(parent, i) for i in range(n)), dtype=np.intp, count=n)
+    out = np.empty(n, dtype=np.intp)
+    out[order] = labels
+    return out
+
+
+def _edge_primitives(g: PageGeometry, thin: float = 2.0):
+    """Boxes of axis-aligned primitives plus vertical / horizontal flags."""
+    rect = g.kind == KIND_RECT
+    keep = rect | (g.orientation == ORIENT_H) | (g.orientation == ORIENT_V)
+    dx, dy = g.x1 - g.x0, g.bottom - g.top
+    is_v = np.where(rect, (dx <= thin) | (dy > thin), g.orientation == ORIENT_V)
+    is_h = np.where(rect, (dy <= thin) | (dx > thin), g.orientation == ORIENT_H)
+    boxes = np.column_stack([g.x0, g.top, g.x1, g.bottom])
+    return boxes[keep], is_v[keep], is_h[keep]
+
+
+# ------------------------------------------------------------------- #
+# 2.   Regions
+# ------------------------------------------------------------------- #
+
+def find_regions(
+    page,
+    geometry: Optional[PageGeometry] = None,
+    char_index: Optional[CharIndex] = None,
+    *,
+    tol: float = 3.0,
+    min_size: float = 10.0,
+    min_chars: int = 8,
+    pad: float = 2.0,
+) -> List[Region]:
+    """Ruled regions (edge components) and text bands of *page*, top to bottom."""
+    g = geometry if geometry is not None else PageGeometry.from_page(page)
+    px0, ptop, px1, pbottom = page.bbox
+
+    boxes, is_v, is_h = _edge_primitives(g)
+    ruled: List[Region] = []
+    if len(boxes):
+        labels = connected_components(boxes, tol)
+        for label in np.unique(labels):
+            members = labels == label
+            if is_v[members].sum() < 2 or is_h[members].sum() < 2:
+                continue
+            b = boxes[members]
+            x0, top = b[:, 0].min(), b[:, 1].min()
+            x1, bottom = b[:, 2].max(), b[:, 3].max()
+            if x1 - x0 < min_size or bottom - top < min_size:
+                continue
+            bbox = (max(x0 - pad, px0), max(top - pad, ptop), min(x1 + pad, px1), min(bottom + pad, pbottom))
+            ruled.append(Region(tuple(float(v) for v in bbox), "ruled", int(members.sum())))
+    ruled.sort(key=lambda r: (r.bbox[1], r.bbox[0]))
+
+    # text bands: vertical gaps not covered by any ruled region
+    idx = char_index if char_index is not None else CharIndex.from_page(page)
+    visible = idx.v_mid[~idx.blank]
+    covered = sorted((r.bbox[1], r.bbox[3]) for r in ruled)
+    bands, cursor = [], ptop
+    for top, bottom in covered:
+        if top > cursor:
+            bands.append((cursor, top))
+        cursor = max(cursor, bottom)
+    if cursor < pbottom:
+        bands.append((cursor, pbottom))
+
+    text: List[Region] = []
+    for top, bottom in bands:
+        inside = visible[(visible >= top) & (visible < bottom)]
+        if len(inside) < min_chars or bottom - top < min_size:
+            continue
+        text.append(Region((float(px0), float(top), float(px1), float(bottom)), "text"))
+
+    return sorted(ruled + text, key=lambda r: (r.bbox[1], r.bbox[0]))
+
+
+# ------------------------------------------------------------------- #
+# 3.   Per-region search
+# ------------------------------------------------------------------- #
+
+def _page_explicit_lines(page, geometry: PageGeometry) -> Tuple[List[float], List[float]]:
+    try:
+        return extract_explicit_lines(page, dump_rects_log=False, geometry=geometry)
+    except RuntimeWarning:  # “此页没有表格”: no page-level lines to share
+        return [], []
+
+
+def _region_lines(page, crop, region: Region, explicit_v, explicit_h_img, tol: float):
+    """Page-level explicit lines inside *region*, in the crop's conventions."""
+    x0, top, x1, bottom = region.bbox
+    v = [x for x in explicit_v if x0 - tol <= x <= x1 + tol]
+    # the ``H - y0`` values are top-based; `_resolve_preset` maps them with
+    # ``page.height - y``, so rebase on the crop height to keep that mapping
+    h_img = [crop.height - page.height + y for y in explicit_h_img if top - tol <= y <= bottom + tol]
+    return v, h_img
+
+
+def search_regions(
+    page,
+    regions: Optional[List[Region]] = None,
+    *,
+    max_workers: Optional[int] = None,
+    tol: float = 3.0,
+    **search_kwargs: Any,
+) -> List[RegionResult]:
+    """Run `search_best_table_settings` on every region crop of *page*.
+
+    *regions* defaults to `find_regions`.  ``max_workers > 1`` searches the
+    regions on a thread pool (the page objects are parsed up front, crops
+    only filter them).  *search_kwargs* go to every per-region search.
+    """
+    geometry = PageGeometry.from_page(page)
+    if regions is None:
+        regions = find_regions(page, geometry, tol=tol)
+    explicit_v, explicit_h_img = _page_explicit_lines(page, geometry)
+    search_kwargs.setdefault("debug", False)
+
+    def run(region: Region) -> RegionResult:
+        crop = page.crop(region.bbox)
+        lines = ([], []) if region.kind == "text" else _region_lines(
+            page, crop, region, explicit_v, explicit_h_img, tol,
+        )
+        try:
+            name, strat, cfg, tables, ev, eh = search_best_table_settings(
+                crop, explicit_lines=lines, **search_kwargs,
+            )
+        except RuntimeWarning:
+            name, strat, cfg, tables, ev, eh = None, (None, None), None, [], [], []
+        logger.debug("region %s %s -> %s (%d tables)", region.kind, region.bbox, name, len(tables))
+        return RegionResult(region, name, strat, cfg, tables, list(ev), list(eh))
+
+    if max_workers and max_workers > 1 and len(regions) > 1:
+        page.objects  # parse once before the threads share the page
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(regions))) as pool:
+            return list(pool.map(run, regions))
+    return [run(region) for region in regions]
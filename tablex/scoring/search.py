@@ -14,18 +14,47 @@ Key changes
    from a `CONFIG` dict so they stay in sync with build_explicit_lines.
 3. **Auto‑filter of small tables** – candidate settings producing only
    “小表” (< area or width ratio) are discarded early.
-4. **Graceful fallback** – still iterates over `iter_table_settings()` so
+4. **Graceful fallback** – still iterates over every preset (`iter_compiled_settings()`) so
    new presets from _Case Optimized_ are naturally tested.
 5. **API unchanged** – signatures & return types are **100 % backward
    compatible** with legacy code.
+6. **Bounded search** – optional pruning (``bounded=True``) with a score
+   estimate from the snapped grid stops once no remaining preset can beat
+   the current best (``exact=True``: provable bounds only); counters are
+   reported through `SearchStats`.
+7. **Deduplication** – presets are compiled once (no per‑page deepcopy);
+   equivalent effective settings and identical table grids are run /
+   scored only once.
+8. **Triage** – optional pre‑screen (``triage=True``, see
+   `tablex.scoring.triage`) returns early on pages where no preset can
+   produce a table.
+9. **Preset prediction** – with a trained `PresetPredictor` only the
+   ``top_k`` presets it ranks first are run (see `tablex.scoring.predict`).
+10. **Adaptive order** – an `AdaptiveOrder` reorders (and may thin) the
+    presets from persisted win statistics (see `tablex.scoring.adaptive`);
+    score ties still go to the higher‑priority preset.
 """
 
-import copy
-from typing import Any, Dict, List, Optional, Tuple
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
 
 from tablex.lines import explicit as _extractor  # noqa: E402
-from tablex.utils.table_settings import iter_table_settings  # updated list
+from tablex.scoring.adaptive import AdaptiveOrder
+from tablex.scoring.cache import PageFeatureCache
+from tablex.scoring.predict import PresetPredictor, page_features
+from tablex.scoring.triage import DEFAULT_TRIAGE, TriageConfig, triage_page
+from tablex.utils.char_index import CharIndex
+from tablex.utils.geometry import PageGeometry
+from tablex.utils.log import get_logger
+from tablex.utils.table_settings import iter_compiled_settings  # updated list
+
 
+logger = get_logger(__name__)
 
 # NB: keep a local reference, avoids re‑import cost per page
 extract_explicit_lines = _extractor.extract_explicit_lines
@@ -38,13 +67,43 @@ CONFIG: Dict[str, float] = {
     "WIDTH_RATIO": 0.30,  # same as CFG["WIDTH_RATIO"]
 }
 
+TEXT_WEIGHT = 0.05  # score per char of cell text
+
 
-def _single_table_score(tbl, page) -> float:
-    """Compute a quality score for one pdfplumber Table object."""
+# Text volume of a ``None`` cell: ``len(str(None))``.
+_NONE_CELL_CHARS = 4
+
+
+def _extract_stats(tbl) -> Tuple[int, int, int]:
+    """(rows, cols, text chars) from full ``Table.extract()`` output."""
     rows = tbl.extract()
     n_rows = len(rows)
     n_cols = max((len(r) for r in rows), default=0)
+    text_amt = sum(len(str(c)) for r in rows for c in r)
+    return n_rows, n_cols, text_amt
+
+
+def _geometry_stats(tbl, char_index: CharIndex) -> Tuple[int, int, int]:
+    """(rows, cols, text chars) from cell geometry and a page `CharIndex`.
+
+    Rows / cols are exactly those of ``Table.extract()``.  The text amount
+    comes from `CharIndex.text_lengths`; ``extract_text`` additionally
+    inserts one separator per line break or un-spaced word gap and
+    collapses runs of blank chars, so the count can differ by that many
+    characters per cell.
+    """
+    rows = tbl.rows
+    n_rows = len(rows)
+    n_cols = max((len(r.cells) for r in rows), default=0)
+    cells = [c for r in rows for c in r.cells]
+    boxes = [c for c in cells if c is not None]
+    text_amt = int(char_index.text_lengths(boxes).sum()) + _NONE_CELL_CHARS * (len(cells) - len(boxes))
+    return n_rows, n_cols, text_amt
+
 
+def _table_score(n_rows: int, n_cols: int, bbox, text_amt: float, page_w: float, page_h: float,
+                 penalty: bool = True) -> float:
+    """`_single_table_score` from its statistics; ``penalty=False`` drops the oversize term."""
     # Structural score – encourage 3‑col grids specifically
     struct_score = n_rows * n_cols * 1.0
     if n_cols == 3:
@@ -53,8 +112,7 @@ def _single_table_score(tbl, page) -> float:
         struct_score += 30.0  # still a plus, but lower
 
     # Geometry score – based on width / area relative to page
-    page_w, page_h = page.width, page.height
-    x0, top, x1, bottom = tbl.bbox  # type: ignore
+    x0, top, x1, bottom = bbox
     width_ratio = (x1 - x0) / page_w
     area_ratio = ((x1 - x0) * (bottom - top)) / (page_w * page_h)
 
@@ -65,23 +123,279 @@ def _single_table_score(tbl, page) -> float:
         geo_score += area_ratio * 100
 
     # Text density (light weight – avoids biasing very dense paragraphs)
-    text_amt = sum(len(str(c)) for r in rows for c in r)
-    text_score = text_amt * 0.05
+    text_score = text_amt * TEXT_WEIGHT
 
     # Oversize penalty (≥ 8×8 is usually mis‑detection of paragraphs)
-    oversize = max(n_rows - 8, 0) + max(n_cols - 8, 0)
-    penalty = oversize * 15.0
+    oversize = max(n_rows - 8, 0) + max(n_cols - 8, 0) if penalty else 0
+    return struct_score + geo_score + text_score - oversize * 15.0
+
+
+def _single_table_score(tbl, page, char_index: Optional[CharIndex] = None) -> float:
+    """Compute a quality score for one pdfplumber Table object.
+
+    With *char_index* the text term comes from `_geometry_stats` (no text
+    extraction); otherwise ``tbl.extract()`` is used.
+    """
+    if char_index is None:
+        n_rows, n_cols, text_amt = _extract_stats(tbl)
+    else:
+        n_rows, n_cols, text_amt = _geometry_stats(tbl, char_index)
+    return _table_score(n_rows, n_cols, tbl.bbox, text_amt, page.width, page.height)
 
-    return struct_score + geo_score + text_score - penalty
 
+def score_tables(tables: List[Any], page, char_index: Optional[CharIndex] = None) -> float:
+    """Aggregate score for a list of tables on *one* page.
 
-def score_tables(tables: List[Any], page) -> float:
-    """Aggregate score for a list of tables on *one* page."""
-    return round(sum(_single_table_score(tbl, page) for tbl in tables), 2)
+    Pass a `CharIndex` of *page* to score from geometry only.  Structure
+    and geometry terms are identical to the ``extract()`` path; the text
+    term differs by at most ``TEXT_WEIGHT`` (0.05) per separator that
+    ``extract_text`` inserts or collapses (line breaks inside a cell,
+    word gaps without a space char, repeated blanks), plus rounding.
+    """
+    return round(sum(_single_table_score(tbl, page, char_index) for tbl in tables), 2)
 
 
 # ------------------------------------------------------------------- #
-# 2.   Search best settings for *one* page
+# 2.   Preset resolution & evaluation helpers
+# ------------------------------------------------------------------- #
+
+@dataclass(slots=True)
+class SearchStats:
+    """Counters filled by `search_best_table_settings` when passed in."""
+
+    presets: int = 0  # presets that survived explicit‑line resolution
+    find_tables_calls: int = 0
+    skipped_bound: int = 0  # find_tables calls avoided by the upper bound
+    dedup_settings: int = 0  # presets whose canonical settings were already run
+    dedup_grids: int = 0  # results whose table grid was already scored
+    best_score: Optional[float] = None  # score of the returned pick
+    triage: Optional[str] = None  # triage verdict reason, when triage ran
+    # pass a list to collect (preset, score or None for “小表”, table bboxes)
+    # of every evaluated preset, e.g. for `tablex.utils.overlay`
+    candidates: Optional[List[Tuple[str, Optional[float], List[Any]]]] = None
+    predicted: Optional[List[str]] = None  # shortlist of the preset predictor
+    skipped_predicted: int = 0  # presets not run thanks to the predictor
+    predict_fallback: bool = False  # shortlist found no table, the rest ran
+    skipped_adaptive: int = 0  # presets left out by the adaptive order
+
+
+def _resolve_preset(
+    name: str,
+    base_cfg: Mapping[str, Any],
+    page,
+    explicit_v: List[float],
+    explicit_h_img: List[float],
+    first_page_explicit_v: Optional[List[float]],
+    first_page_explicit_h: Optional[List[float]],
+    debug: bool = False,
+) -> Optional[Tuple[Dict[str, Any], List[float], List[float]]]:
+    """Inject explicit lines into a preset; ``None`` when it cannot run."""
+    cfg = dict(base_cfg)  # compiled presets are immutable, values are scalars
+    used_v: List[float] = []
+    used_h: List[float] = []
+
+    # Inject explicit verticals if required/available
+    if cfg["vertical_strategy"] == "explicit":
+        if len(explicit_v) >= 2:
+            used_v = explicit_v.copy()
+        elif first_page_explicit_v and len(first_page_explicit_v) >= 2:
+            used_v = first_page_explicit_v.copy()
+        else:
+            if debug:
+                logger.debug("[skip] %s: need explicit_v but not found", name)
+            return None  # cannot satisfy explicit requirement
+        cfg["explicit_vertical_lines"] = used_v
+
+    # Inject explicit horizontals (img‑coords → pdf‑coords)
+    if cfg["horizontal_strategy"] == "explicit":
+        if explicit_h_img:
+            used_h = [page.height - y for y in explicit_h_img]
+        elif first_page_explicit_h:
+            used_h = first_page_explicit_h.copy()
+        else:
+            # downgrade to text when horizontals are missing
+            cfg["horizontal_strategy"] = "text"
+            cfg.setdefault("text_x_tolerance", 3)
+            cfg.setdefault("text_y_tolerance", 12)
+            cfg.setdefault("min_words_horizontal", 4)
+        cfg["explicit_horizontal_lines"] = used_h
+
+    return cfg, used_v, used_h
+
+
+def _too_small(tables: List[Any], page) -> Optional[Tuple[float, float]]:
+    """(width_ratio, area_ratio) of the widest table when every table is “小表”."""
+    if not tables:
+        return None
+    biggest = max(tables, key=lambda t: (t.bbox[2] - t.bbox[0]))
+    x0, top, x1, bottom = biggest.bbox  # type: ignore
+    width_ratio = (x1 - x0) / page.width
+    area_ratio = ((x1 - x0) * (bottom - top)) / (page.width * page.height)
+    if width_ratio < CONFIG["WIDTH_RATIO"] and area_ratio < CONFIG["AREA_RATIO"]:
+        return width_ratio, area_ratio
+    return None
+
+
+# preset priority (position in the hand‑written list) – breaks score ties
+_PRIORITY: Dict[str, int] = {p.name: i for i, p in enumerate(iter_compiled_settings())}
+
+
+def _grid_key(tables: List[Any]) -> Hashable:
+    """Hashable identity of a find_tables result (cells of every table)."""
+    return tuple(tuple(tbl.cells) for tbl in tables)
+
+
+# ------------------------------------------------------------------- #
+# 3.   Upper bounds for the bounded search
+# ------------------------------------------------------------------- #
+
+class _BoundSignals:
+    """Cheap page signals used to bound `score_tables`."""
+
+    def __init__(self, page, char_index: CharIndex) -> None:
+        self.W, self.H = page.width, page.height
+        self.char_index = char_index
+        edges = page.edges
+        self.h_edges = np.asarray(
+            [(e["x0"], e["top"], e["x1"], e["bottom"], e["width"]) for e in edges if e["orientation"] == "h"],
+            dtype=float,
+        ).reshape(-1, 5)
+        self.v_edges = np.asarray(
+            [(e["x0"], e["top"], e["x1"], e["bottom"], e["height"]) for e in edges if e["orientation"] == "v"],
+            dtype=float,
+        ).reshape(-1, 5)
+        chars = page.chars
+        self.chars = np.asarray(
+            [(c["x0"], c["top"], c["x1"], c["bottom"]) for c in chars], dtype=float,
+        ).reshape(-1, 4)
+        # text lines: distinct rounded char tops; widest line in chars
+        self.char_tops = np.round(self.chars[:, 1])
+        tops, per_top = np.unique(self.char_tops, return_counts=True)
+        self.text_cols = int(per_top.max()) if len(tops) else 0
+
+    def lines(self, orientation: str, prefilter: float) -> np.ndarray:
+        arr = self.h_edges if orientation == "h" else self.v_edges
+        return arr[arr[:, 4] >= prefilter]
+
+
+def _n_clusters(values: np.ndarray, tolerance: float) -> int:
+    """Number of positions left after snapping *values* within *tolerance*."""
+    if not len(values):
+        return 0
+    values = np.sort(values)
+    return int(np.count_nonzero(np.diff(values) > tolerance)) + 1
+
+
+def _bands(intervals: np.ndarray, tolerance: float) -> List[Tuple[float, float]]:
+    """Merge ``(top, bottom)`` intervals that overlap (within *tolerance*)."""
+    out: List[List[float]] = []
+    for top, bottom in intervals[np.argsort(intervals[:, 0])]:
+        if out and top <= out[-1][1] + tolerance:
+            out[-1][1] = max(out[-1][1], bottom)
+        else:
+            out.append([top, bottom])
+    return [(top, bottom) for top, bottom in out]
+
+
+def _provable_bound(cfg: Dict[str, Any], sig: _BoundSignals) -> float:
+    """0 when *cfg* provably cannot form a single cell on the page, else ``inf``."""
+    prefilter = cfg.get("edge_min_length_prefilter", 1)
+    for orientation, key, explicit_key in (("v", "vertical_strategy", "explicit_vertical_lines"),
+                                           ("h", "horizontal_strategy", "explicit_horizontal_lines")):
+        strategy = cfg[key]
+        n_explicit = len(set(cfg.get(explicit_key) or []))
+        if strategy in ("lines", "lines_strict"):
+            edges = sig.lines(orientation, prefilter)
+            pos = edges[:, 0] if orientation == "v" else edges[:, 1]
+            n = len(np.unique(pos)) + n_explicit
+        elif strategy == "text":
+            n = 2 if len(sig.chars) else n_explicit
+        else:  # explicit
+            n = n_explicit
+        if n < 2:
+            return 0.0
+    return math.inf
+
+
+def _preset_upper_bound(cfg: Dict[str, Any], sig: _BoundSignals, exact: bool = False) -> float:
+    """Upper bound on ``score_tables`` for one resolved preset.
+
+    ``exact=True`` only returns a finite bound (0) when the preset provably
+    cannot produce any table: an orientation with fewer than two distinct
+    edge positions (``lines``: prefiltered edges + explicit lines;
+    ``explicit``: the explicit lines) or a ``text`` orientation on a page
+    without chars.
+
+    Otherwise it is an *estimate* built from the snapped grid.  Vertical
+    ``lines`` edges whose spans overlap form one band per possible table;
+    every band is scored like a table spanning all its distinct (snapped)
+    positions – ``(nv - 1) × (nh - 1)`` cells, the bbox of those positions
+    and every char inside – and the bands are summed.  The oversize
+    penalty is only kept for bands whose rules all cross the whole band
+    (necessarily one table); elsewhere smaller sub-tables may avoid it.  ``text`` orientations count one line per text row (plus
+    one) and three per char of the widest text row (left, right, centre).
+    For a clean ruled grid the estimate equals the actual score, so equal
+    or weaker presets behind it are skipped.
+    """
+    bound = _provable_bound(cfg, sig)
+    if exact or bound == 0.0:
+        return bound
+
+    prefilter = cfg.get("edge_min_length_prefilter", 1)
+    snap_x = cfg.get("snap_x_tolerance", cfg.get("snap_tolerance", 3))
+    snap_y = cfg.get("snap_y_tolerance", cfg.get("snap_tolerance", 3))
+    v_strategy, h_strategy = cfg["vertical_strategy"], cfg["horizontal_strategy"]
+    explicit_v = np.asarray(cfg.get("explicit_vertical_lines") or [], dtype=float)
+    explicit_h = np.asarray(cfg.get("explicit_horizontal_lines") or [], dtype=float)
+    v_edges = sig.lines("v", prefilter) if v_strategy in ("lines", "lines_strict") else np.empty((0, 5))
+    h_edges = sig.lines("h", prefilter) if h_strategy in ("lines", "lines_strict") else np.empty((0, 5))
+
+    if len(v_edges) and not len(explicit_v) and v_strategy != "text":
+        bands = _bands(v_edges[:, [1, 3]], snap_y)
+    else:  # explicit / text verticals run across the whole page
+        bands = [(0.0, sig.H)]
+
+    total = 0.0
+    for top, bottom in bands:
+        # vertical positions and x extent
+        v_in = v_edges[(v_edges[:, 3] >= top - snap_y) & (v_edges[:, 1] <= bottom + snap_y)]
+        xs = np.concatenate([v_in[:, 0], explicit_v])
+        n_v = _n_clusters(xs, snap_x)
+        x_lo, x_hi = (xs.min(), xs.max()) if len(xs) else (sig.W, 0.0)
+        if v_strategy == "text" and len(sig.chars):
+            n_v += (sig.text_cols + 1) * 3
+            x_lo, x_hi = min(x_lo, sig.chars[:, 0].min()), max(x_hi, sig.chars[:, 2].max())
+
+        # horizontal positions and y extent inside the band
+        def within(y):
+            return (y >= top - snap_y) & (y <= bottom + snap_y)
+
+        h_in = h_edges[within(h_edges[:, 1])]
+        ys = np.concatenate([h_in[:, 1], explicit_h[within(explicit_h)]])
+        n_h = _n_clusters(ys, snap_y)
+        y_lo, y_hi = (ys.min(), ys.max()) if len(ys) else (sig.H, 0.0)
+        if h_strategy == "text":
+            in_band = within(sig.chars[:, 1])
+            if in_band.any():
+                n_h += len(np.unique(sig.char_tops[in_band])) + 1
+                y_lo, y_hi = min(y_lo, sig.chars[in_band, 1].min()), max(y_hi, sig.chars[in_band, 3].max())
+
+        if n_v < 2 or n_h < 2:
+            continue
+        # every rule crossing the whole band: a single table, which pays the oversize penalty
+        closed = (
+            v_strategy != "text" and h_strategy != "text"
+            and bool(np.all((v_in[:, 1] <= y_lo + snap_y) & (v_in[:, 3] >= y_hi - snap_y)))
+            and bool(np.all((h_in[:, 0] <= x_lo + snap_x) & (h_in[:, 2] >= x_hi - snap_x)))
+        )
+        bbox = (x_lo, y_lo, x_hi, y_hi)
+        text_amt = int(sig.char_index.text_lengths([bbox])[0])
+        total += _table_score(n_h - 1, n_v - 1, bbox, text_amt, sig.W, sig.H, penalty=closed)
+    return round(total, 2)
+
+
+# ------------------------------------------------------------------- #
+# 4.   Search best settings for *one* page
 # ------------------------------------------------------------------- #
 
 def search_best_table_settings(
@@ -89,6 +403,18 @@ def search_best_table_settings(
     first_page_explicit_v: Optional[List[float]] = None,
     first_page_explicit_h: Optional[List[float]] = None,
     debug: bool = 1,
+    cache: Optional[PageFeatureCache] = None,
+    *,
+    bounded: bool = False,
+    exact: bool = False,
+    dedupe: bool = True,
+    stats: Optional[SearchStats] = None,
+    explicit_lines: Optional[Tuple[List[float], List[float]]] = None,
+    geometry_scoring: bool = True,
+    triage: Union[bool, TriageConfig, None] = None,
+    predictor: Optional[PresetPredictor] = None,
+    top_k: Optional[int] = None,
+    order: Optional[AdaptiveOrder] = None,
 ) -> Tuple[
     Optional[str],
     Tuple[Optional[str], Optional[str]],
@@ -99,78 +425,207 @@ def search_best_table_settings(
 ]:
     """Try all preset table settings & returns the best‑scoring one.
 
+    Words and edges shared between presets are computed once through a
+    `PageFeatureCache` (pass *cache* to reuse one across calls on the
+    same page).
+
+    With ``bounded=True`` every preset gets a cheap estimate of its best
+    score from the snapped grid (see `_preset_upper_bound`); presets that
+    cannot beat the current best are skipped and the search stops as soon
+    as no remaining preset can.  The estimate is not a proof – text
+    presets or odd grids can beat it – so ``exact=True`` keeps only
+    provable bounds, and the pick is always the exhaustive one.  Pass a
+    `SearchStats` as *stats* to see how many ``find_tables`` calls were
+    skipped.
+
+    With ``dedupe=True`` (default) presets whose canonical settings (see
+    `PageFeatureCache.canonical_key`) were already evaluated are skipped,
+    and identical table grids are scored only once; neither can change
+    the pick since a later preset must score strictly higher to win.
+
+    *debug* enables the per‑preset trace on the ``tablex.scoring.search``
+    logger (level DEBUG); nothing is formatted unless that level is on.
+
+    *explicit_lines* takes a precomputed ``(explicit_v, explicit_h_img)``
+    pair from `extract_explicit_lines` so callers that already ran it do
+    not pay twice.
+
+    With ``geometry_scoring=True`` (default) candidates are scored from
+    cell geometry and a page `CharIndex` (see `score_tables`) without
+    extracting any cell text; callers extract text of the winner only.
+
+    With *triage* (``True`` or a `TriageConfig`) the page is pre‑screened
+    by `triage_page` first; pages marked “no table possible” return the
+    empty result right away (``stats.triage == "no-table"``) without
+    explicit‑line extraction or any ``find_tables`` call.
+
+    With a *predictor* and *top_k* only the ``top_k`` presets the
+    `PresetPredictor` ranks first are run, in their usual priority order
+    (``stats.predicted``); the remaining presets run only when none of
+    them yields a table.
+
+    With an *order* (`AdaptiveOrder`) presets run in its bandit order and
+    the page's runs, scores and ``find_tables`` times are recorded into it;
+    call ``order.save()`` to persist them.
+
     Returns
     -------
     (preset_name, (v_strategy, h_strategy), cfg_dict,
      tables, explicit_v, explicit_h_img)
     """
+    if stats is None:
+        stats = SearchStats()
+    debug = bool(debug) and logger.isEnabledFor(logging.DEBUG)
+
     # ––––– 1. pre‑analyse explicit lines once –––––
-    explicit_v, explicit_h_img = extract_explicit_lines(page, dump_rects_log=False)
+    if cache is None:
+        cache = PageFeatureCache(page)
+    geometry = PageGeometry.from_page(page) if (explicit_lines is None or triage) else None
+    if triage:
+        verdict = triage_page(
+            page, triage if isinstance(triage, TriageConfig) else DEFAULT_TRIAGE,
+            geometry=geometry, char_index=cache.char_index(),
+            carry_v=first_page_explicit_v, carry_h=first_page_explicit_h,
+        )
+        stats.triage = verdict.reason
+        if not verdict.possible:
+            if debug:
+                logger.debug("[triage] Page %s: no table possible (%s)", page.page_number, verdict)
+            return None, (None, None), None, [], [], []
+    if explicit_lines is None:
+        explicit_lines = extract_explicit_lines(page, dump_rects_log=False, geometry=geometry)
+    explicit_v, explicit_h_img = explicit_lines
+    shortlist = None
+    if predictor is not None and top_k:
+        features = page_features(page, explicit_lines, geometry=geometry, char_index=cache.char_index())
+        shortlist = set(predictor.top_k(features, top_k))
+        stats.predicted = sorted(shortlist)
+    char_index = cache.char_index() if geometry_scoring else None
     if debug:
-        print(
-            f"[search] Page {page.page_number}: explicit_v={len(explicit_v)}, explicit_h_img={len(explicit_h_img)}"
+        logger.debug(
+            "[search] Page %s: explicit_v=%d, explicit_h_img=%d", page.page_number, len(explicit_v), len(explicit_h_img),
         )
 
-    best: Tuple[str, Tuple[str, str], Dict[str, Any], List[Any], List[float], List[float], float] | None = None
-
-    # ––––– 2. enumerate presets –––––
-    for name, base_cfg in iter_table_settings():
-
-        cfg = copy.deepcopy(base_cfg)  # avoid mutating global presets
-        used_v: List[float] = []
-        used_h: List[float] = []
+    # ––––– 2. resolve presets (and their bounds) up front –––––
+    candidates = []
+    for preset in iter_compiled_settings():
+        name = preset.name
+        resolved = _resolve_preset(
+            name, preset.settings, page, explicit_v, explicit_h_img,
+            first_page_explicit_v, first_page_explicit_h, debug=debug,
+        )
+        if resolved is not None:
+            candidates.append((name,) + resolved)
+    if order is not None:
+        by_name = {c[0]: c for c in candidates}
+        ordered = order.order(list(by_name))
+        stats.skipped_adaptive += len(candidates) - len(ordered)
+        candidates = [by_name[n] for n in ordered]
+    n_first = len(candidates)
+    if shortlist is not None:
+        # shortlisted presets first (priority order kept), the rest as fallback
+        first = [c for c in candidates if c[0] in shortlist]
+        n_first = len(first)
+        candidates = first + [c for c in candidates if c[0] not in shortlist]
+    stats.presets += len(candidates)
+
+    bounds: List[float] = []
+    remaining: List[float] = []
+    if bounded and candidates:
+        sig = _BoundSignals(page, cache.char_index())
+        bounds = [_preset_upper_bound(cfg, sig, exact=exact) for _, cfg, _, _ in candidates]
+        # suffix max: best score any remaining preset could still reach
+        remaining = bounds.copy()
+        first_prio = [_PRIORITY[c[0]] for c in candidates]  # suffix min: a tie could still win
+        for i in range(len(remaining) - 2, -1, -1):
+            remaining[i] = max(remaining[i], remaining[i + 1])
+            first_prio[i] = min(first_prio[i], first_prio[i + 1])
 
-        # Inject explicit verticals if required/available
-        if cfg["vertical_strategy"] == "explicit":
-            if len(explicit_v) >= 2:
-                used_v = explicit_v.copy()
-            elif first_page_explicit_v and len(first_page_explicit_v) >= 2:
-                used_v = first_page_explicit_v.copy()
-            else:
+    best: Tuple[str, Tuple[str, str], Dict[str, Any], List[Any], List[float], List[float], float] | None = None
+    seen_settings: Dict[Hashable, str] = {}  # canonical key → preset that ran it
+    ran_as: Dict[str, str] = {}  # renamed best → evaluated preset that produced it
+    grid_scores: Dict[Hashable, Optional[float]] = {}  # None → “小表”
+    evaluated: List[Tuple[str, Optional[float], float]] = []  # for *order*
+
+    # ––––– 3. enumerate presets –––––
+    for ix, (name, cfg, used_v, used_h) in enumerate(candidates):
+
+        if ix == n_first:
+            if best is not None and best[3]:
+                stats.skipped_predicted += len(candidates) - ix
+                break
+            stats.predict_fallback = True
+
+        if bounds and best is not None:
+            best_prio = _PRIORITY[best[0]]
+            if remaining[ix] < best[-1] or (remaining[ix] == best[-1] and first_prio[ix] > best_prio):
+                stats.skipped_bound += len(candidates) - ix
                 if debug:
-                    print(f"[skip] {name}: need explicit_v but not found")
-                continue  # cannot satisfy explicit requirement
-            cfg["explicit_vertical_lines"] = used_v
-
-        # Inject explicit horizontals (img‑coords → pdf‑coords)
-        if cfg["horizontal_strategy"] == "explicit":
-            if explicit_h_img:
-                used_h = [page.height - y for y in explicit_h_img]
-            elif first_page_explicit_h:
-                used_h = first_page_explicit_h.copy()
-            else:
-                # downgrade to text when horizontals are missing
-                cfg["horizontal_strategy"] = "text"
-                cfg.setdefault("text_x_tolerance", 3)
-                cfg.setdefault("text_y_tolerance", 12)
-                cfg.setdefault("min_words_horizontal", 4)
-            cfg["explicit_horizontal_lines"] = used_h
-
-        # ––– 3. run detection –––
-        tables = page.find_tables(table_settings=cfg)
-
-        # filter out pages that only yield small tables
-        if tables:
-            biggest = max(tables, key=lambda t: (t.bbox[2] - t.bbox[0]))
-            x0, top, x1, bottom = biggest.bbox  # type: ignore
-            width_ratio = (x1 - x0) / page.width
-            area_ratio = ((x1 - x0) * (bottom - top)) / (page.width * page.height)
-            if width_ratio < CONFIG["WIDTH_RATIO"] and area_ratio < CONFIG["AREA_RATIO"]:
+                    logger.debug("[bound] stop at %s: remaining ≤ %.2f ≤ best %.2f", name, remaining[ix], best[-1])
+                break
+            if bounds[ix] < best[-1] or (bounds[ix] == best[-1] and _PRIORITY[name] > best_prio):
+                stats.skipped_bound += 1
                 if debug:
-                    print(f"[skip] {name}: all tables too small (w={width_ratio:.2f}, a={area_ratio:.2f})")
+                    logger.debug("[bound] %s: bound %.2f ≤ best %.2f", name, bounds[ix], best[-1])
                 continue
 
-        sc = score_tables(tables, page)
+        if dedupe:
+            key = cache.canonical_key(cfg)
+            if key in seen_settings:
+                stats.dedup_settings += 1
+                if debug:
+                    logger.debug("[dedup] %s: same effective settings as an earlier preset", name)
+                if best is not None and best[0] == seen_settings[key] and _PRIORITY[name] < _PRIORITY[best[0]]:
+                    # reordered presets: the same result belongs to the higher‑priority name
+                    ran_as[name] = ran_as.get(best[0], best[0])
+                    best = (name, (cfg["vertical_strategy"], cfg["horizontal_strategy"]), cfg) + best[3:]
+                    seen_settings[key] = name
+                continue
+            seen_settings[key] = name
+
+        # ––– run detection –––
+        t0 = time.perf_counter()
+        tables = cache.find_tables(cfg)
+        cost = time.perf_counter() - t0
+        stats.find_tables_calls += 1
+
+        grid = _grid_key(tables) if dedupe else None
+        if grid is not None and grid in grid_scores:
+            stats.dedup_grids += 1
+            sc = grid_scores[grid]
+        else:
+            # filter out pages that only yield small tables
+            small = _too_small(tables, page)
+            if small is not None:
+                if debug:
+                    logger.debug("[skip] %s: all tables too small (w=%.2f, a=%.2f)", name, small[0], small[1])
+                sc = None
+            else:
+                sc = score_tables(tables, page, char_index)
+            if grid is not None:
+                grid_scores[grid] = sc
+        if stats.candidates is not None:
+            stats.candidates.append((name, sc, [t.bbox for t in tables]))
+        if order is not None:
+            evaluated.append((name, sc, cost))
+        if sc is None:
+            continue
         if debug:
-            print(f"[score] {name:25s} -> {sc:7.2f}  (v={cfg['vertical_strategy']}, h={cfg['horizontal_strategy']})")
+            logger.debug(
+                "[score] %-25s -> %7.2f  (v=%s, h=%s)", name, sc, cfg["vertical_strategy"], cfg["horizontal_strategy"],
+            )
 
-        if best is None or sc > best[-1]:
+        if best is None or sc > best[-1] or (sc == best[-1] and _PRIORITY[name] < _PRIORITY[best[0]]):
             best = (name, (cfg["vertical_strategy"], cfg["horizontal_strategy"]), cfg, tables, used_v, used_h, sc)
 
+    if order is not None:
+        # the win goes to the preset that ran, not the higher-priority alias it was renamed to
+        order.record(evaluated, ran_as.get(best[0], best[0]) if best is not None and best[3] else None)
     if best is None:  # no tables at all
         return None, (None, None), None, [], [], []
 
     name, strat, cfg, tables, ev, eh, sc = best
+    stats.best_score = sc
     if debug:
-        print(f"[best] {name} – score {sc:.2f}  strategy={strat}")
+        logger.debug("[best] %s – score %.2f  strategy=%s", name, sc, strat)
     return name, strat, cfg, tables, ev, eh
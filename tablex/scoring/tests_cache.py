@@ -0,0 +1,58 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pdfplumber
+import pytest
+
+from tablex.testing import make_grid_pdf
+from tablex.scoring import PageFeatureCache
+from tablex.utils.table_settings import iter_table_settings
+
+
+def _resolved_presets():
+    for name, cfg in iter_table_settings():
+        cfg = dict(cfg)
+        if cfg["vertical_strategy"] == "explicit":
+            cfg["explicit_vertical_lines"] = [72, 228, 384, 540]
+        if cfg["horizontal_strategy"] == "explicit":
+            cfg["explicit_horizontal_lines"] = [152, 352, 552]
+        yield name, cfg
+
+
+@pytest.mark.parametrize("ruled", [True, False])
+def test_cache_matches_find_tables(tmp_path, ruled):
+    path = make_grid_pdf(tmp_path / "t.pdf", n_pages=1, rows=5, cols=3, ruled=ruled, prose_lines=4)
+    with pdfplumber.open(path) as pdf:
+        page = pdf.pages[0]
+        cache = PageFeatureCache(page)
+        for name, cfg in _resolved_presets():
+            expected = [t.cells for t in page.find_tables(cfg)]
+            assert [t.cells for t in cache.find_tables(cfg)] == expected, name
+        # text presets with the same tolerances share one word extraction
+        assert cache.misses["words"] < sum(1 for _, c in _resolved_presets() if "text" in c.values())
+        assert cache.hits["base_v"] > 0
+
+
+def test_cache_rejects_short_explicit_lines(tmp_path):
+    path = make_grid_pdf(tmp_path / "t.pdf", n_pages=1)
+    with pdfplumber.open(path) as pdf:
+        cache = PageFeatureCache(pdf.pages[0])
+        with pytest.raises(ValueError):
+            cache.find_tables({"vertical_strategy": "explicit", "explicit_vertical_lines": [1]})
+
+
+def test_nested_text_settings_key_is_dropped(tmp_path):
+    from pdfplumber.utils.text import WordExtractor
+
+    import tablex  # noqa: F401 – no longer patches pdfplumber on import
+
+    assert not hasattr(WordExtractor, "_orig_init")
+    path = make_grid_pdf(tmp_path / "t.pdf", n_pages=1, ruled=False)
+    cfg = {"vertical_strategy": "text", "horizontal_strategy": "text", "text_settings": {"x_tolerance": 3}}
+    with pdfplumber.open(path) as pdf:
+        page = pdf.pages[0]
+        with pytest.raises(TypeError):
+            page.find_tables(cfg)
+        assert PageFeatureCache(page).find_tables(cfg)
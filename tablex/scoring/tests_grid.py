@@ -0,0 +1,64 @@
+import pathlib
+import random
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pytest
+from pdfplumber import table as pt
+
+from tablex.bench import make_page
+from tablex.scoring import PageFeatureCache
+from tablex.scoring.grid import cells_to_tables, edges_to_intersections, grid_tables, intersections_to_cells
+
+
+def _edge(o, a, b, c):
+    if o == "v":
+        return {"orientation": "v", "x0": a, "x1": a, "top": b, "bottom": c, "height": c - b}
+    return {"orientation": "h", "x0": b, "x1": c, "top": a, "bottom": a, "width": c - b}
+
+
+def _random_edges(seed, n=120):
+    rnd = random.Random(seed)
+    snap = lambda v: round(v / 5) * 5 + rnd.choice([0, 0, 0, 0.5, 1.5])  # noqa: E731
+    edges = []
+    for _ in range(n):
+        o = rnd.choice("vh")
+        a = snap(rnd.uniform(0, 300))
+        b = snap(rnd.uniform(0, 250))
+        edges.append(_edge(o, a, b, b + snap(rnd.uniform(5, 120))))
+    return edges
+
+
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("tol", [0, 1, 3])
+def test_matches_pdfplumber_on_random_edges(seed, tol):
+    edges = _random_edges(seed)
+    expected = pt.edges_to_intersections(edges, tol, tol)
+    got = edges_to_intersections(edges, tol, tol)
+    assert list(got) == list(expected)
+    assert all(got[k]["v"] == expected[k]["v"] and got[k]["h"] == expected[k]["h"] for k in expected)
+    cells = pt.intersections_to_cells(expected)
+    assert intersections_to_cells(got) == cells
+    assert cells_to_tables(cells) == pt.cells_to_tables(cells)
+
+
+def test_cells_to_tables_keeps_group_order():
+    # two grids whose cells interleave in the input list
+    a = [(0, 0, 1, 1), (1, 0, 2, 1), (0, 1, 1, 2)]
+    b = [(10, 0, 11, 1), (11, 0, 12, 1)]
+    cells = [a[0], b[0], a[2], b[1], a[1], (50, 50, 51, 51)]
+    assert cells_to_tables(cells) == pt.cells_to_tables(cells)
+
+
+@pytest.mark.parametrize("kind", ["grid", "dashed", "noise"])
+def test_cache_tables_match_find_tables(kind):
+    page = make_page(kind, 2_000)
+    cache = PageFeatureCache(page)
+    for cfg in ({}, {"snap_tolerance": 5, "join_tolerance": 8, "intersection_tolerance": 5}):
+        expected = page.find_tables(cfg)
+        got = cache.find_tables(cfg)
+        assert [t.cells for t in got] == [t.cells for t in expected]
+        assert [t.bbox for t in grid_tables(page, cache.edges(pt.TableSettings.resolve(cfg)))] == [
+            t.bbox for t in expected
+        ]
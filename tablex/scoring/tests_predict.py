@@ -0,0 +1,72 @@
+import json
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import numpy as np
+import pytest
+
+from tablex.bench import make_page
+from tablex.scoring import SearchStats, search_best_table_settings
+from tablex.scoring.predict import FEATURES, PresetPredictor, log_page, main, page_features, recall_report, train
+
+
+KINDS = ("grid", "dashed", "noise", "prose")
+
+
+@pytest.fixture(scope="module")
+def logs():
+    return [log_page(make_page(kind, 300, seed=seed)) for kind in KINDS for seed in range(2)]
+
+
+def test_features_shape():
+    feats = page_features(make_page("grid", 300))
+    assert feats.shape == (len(FEATURES),)
+    assert feats[FEATURES.index("large_table")] in (0.0, 1.0)
+    assert feats[FEATURES.index("explicit_v")] >= 2
+
+
+def test_train_rank_and_json(logs):
+    X = np.array([r["features"] for r in logs])
+    y = [r["winner"] for r in logs]
+    model = train(X, y)
+    assert sum(model.counts) == sum(w is not None for w in y)
+    ranked = model.rank(X[0])
+    assert ranked[0] == y[0] and len(ranked) == len(set(ranked))
+    back = PresetPredictor.from_dict(json.loads(json.dumps(model.to_dict())))
+    assert back.rank(X[-1]) == model.rank(X[-1])
+    report = recall_report(model, X, y, max_k=2)
+    assert report["table_pages"] == 6 and report["recall"]["1"] == 1.0
+
+
+def test_search_runs_top_k_only(logs):
+    model = train(np.array([r["features"] for r in logs]), [r["winner"] for r in logs])
+    page = make_page("noise", 300, seed=5)
+    stats = SearchStats()
+    expected = search_best_table_settings(page, debug=False)
+    got = search_best_table_settings(page, debug=False, stats=stats, predictor=model, top_k=1)
+    assert got[0] == expected[0] and [t.bbox for t in got[3]] == [t.bbox for t in expected[3]]
+    assert stats.predicted == [expected[0]] and stats.find_tables_calls == 1
+    assert stats.skipped_predicted > 0 and not stats.predict_fallback
+
+
+def test_search_falls_back_without_table(logs):
+    model = train(np.array([r["features"] for r in logs]), [r["winner"] for r in logs])
+    page = make_page("dashed", 300)  # text-text finds nothing on it
+    stats = SearchStats()
+    nowhere = PresetPredictor(["text-text"], np.zeros((1, len(FEATURES))), model.mean, model.scale, [1])
+    got = search_best_table_settings(page, debug=False, stats=stats, predictor=nowhere, top_k=1)
+    assert stats.predict_fallback and got[0] == search_best_table_settings(page, debug=False)[0]
+
+
+def test_cli_train_and_report(logs, tmp_path, capsys):
+    log = tmp_path / "search.jsonl"
+    log.write_text("".join(json.dumps(r) + "\n" for r in logs) + '{"file": "x.pdf", "error": "boom"}\n')
+    model = tmp_path / "presets.json"
+    assert main(["train", str(log), "-o", str(model)]) == 0
+    assert PresetPredictor.load(model).presets
+    capsys.readouterr()
+    assert main(["report", str(model), str(log), "-k", "3"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["pages"] == len(logs) and set(report["recall"]) == {"1", "2", "3"}
@@ -0,0 +1,81 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import numpy as np
+
+from tablex.bench import make_page
+from tablex.lines import extract_explicit_lines
+from tablex.scoring import search_best_table_settings
+from tablex.scoring.regions import _region_lines, connected_components, find_regions, search_regions
+from tablex.utils.pages import PrimitivePage, make_chars, make_line
+
+
+W, H = 612.0, 792.0
+XS = [72.0, 222.0, 372.0, 540.0]
+YS = [72.0 + 46 * i for i in range(6)]
+
+
+def _mixed_page() -> PrimitivePage:
+    """Ruled grid on top, borderless five-column table below."""
+    lines = [make_line(XS[0], y, XS[-1], y, H) for y in YS] + [make_line(x, YS[0], x, YS[-1], H) for x in XS]
+    chars = []
+    for r in range(len(YS) - 1):
+        for c in range(len(XS) - 1):
+            chars += make_chars(f"g{r}c{c}", XS[c] + 3, YS[r] + 4, H, size=8.0)
+    for r in range(8):
+        for c, x in enumerate([72, 170, 270, 370, 470]):
+            chars += make_chars(f"item{r}" if c == 0 else f"{r * c}.00", x, 400 + r * 16, H, size=9.0)
+    return PrimitivePage(W, H, lines=lines, chars=chars)
+
+
+def test_connected_components():
+    boxes = np.array([
+        [0, 0, 10, 1],  # ┐ touching
+        [10, 0, 11, 10],  # ┘
+        [50, 50, 60, 51],  # alone
+        [12.5, 5, 20, 6],  # within tol of the second
+    ], dtype=float)
+    labels = connected_components(boxes, tol=2.0)
+    assert labels[0] == labels[1] == labels[3] != labels[2]
+
+
+def test_find_regions_splits_ruled_and_text():
+    ruled, text = find_regions(_mixed_page())
+    assert ruled.kind == "ruled" and ruled.n_edges == len(XS) + len(YS)
+    assert ruled.bbox[0] <= XS[0] and ruled.bbox[3] >= YS[-1]
+    assert text.kind == "text" and text.bbox[1] >= ruled.bbox[3]
+    assert [r.kind for r in find_regions(make_page("dashed", 800))] == ["ruled"]
+
+
+def test_search_regions_picks_preset_per_region():
+    page = _mixed_page()
+    whole = search_best_table_settings(page, debug=False)
+    results = search_regions(page)
+    assert [r.region.kind for r in results] == ["ruled", "text"]
+    grid, text = results
+    assert grid.strategy == ("lines", "lines") and grid.tables[0].bbox == whole[3][0].bbox
+    assert text.strategy == ("text", "text") and text.tables
+    assert text.tables[0].bbox[1] >= 400  # page coordinates, as any crop
+    parallel = search_regions(page, max_workers=2)
+    assert [(r.preset, [t.bbox for t in r.tables]) for r in parallel] == [
+        (r.preset, [t.bbox for t in r.tables]) for r in results
+    ]
+
+
+def test_region_lines_keep_preset_mapping():
+    page = _mixed_page()
+    region = find_regions(page)[0]
+    crop = page.crop(region.bbox)
+    ev, eh = extract_explicit_lines(page, dump_rects_log=False)
+    v, h = _region_lines(page, crop, region, ev, eh, 3.0)
+    assert v == XS
+    assert [crop.height - y for y in h] == [page.height - y for y in eh]
+
+
+def test_primitive_page_crop():
+    page = _mixed_page()
+    crop = page.crop((0, 350, W, H))
+    assert (crop.width, crop.height) == (W, H - 350) and crop.bbox == (0, 350, W, H)
+    assert not crop.lines and all(c["top"] >= 350 for c in crop.chars)
@@ -0,0 +1,137 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+from types import SimpleNamespace
+
+import pdfplumber
+import pytest
+
+from tablex.bench.stubs import make_page
+from tablex.scoring import PageFeatureCache, SearchStats, score_tables, search_best_table_settings
+from tablex.scoring.search import TEXT_WEIGHT, _BoundSignals, _preset_upper_bound
+from tablex.testing import make_grid_pdf
+from tablex.utils.char_index import CharIndex
+from tablex.utils.pages import PrimitivePage, make_chars, make_line
+from tablex.utils.table_settings import iter_compiled_settings
+
+
+@pytest.fixture
+def grid_page(tmp_path):
+    path = make_grid_pdf(tmp_path / "g.pdf", n_pages=1, rows=5, cols=4)
+    with pdfplumber.open(path) as pdf:
+        yield pdf.pages[0]
+
+
+def _one_rule_page() -> PrimitivePage:
+    """Horizontal rules and a single vertical rule: no lines-lines cell is possible."""
+    W, H = 612.0, 792.0
+    ys = [100 + 40 * i for i in range(7)]
+    lines = [make_line(72, y, 540, y, H) for y in ys] + [make_line(72, ys[0], 72, ys[-1], H)]
+    chars = [
+        ch for r, y in enumerate(ys[:-1]) for c, x in enumerate((80, 240, 400))
+        for ch in make_chars(f"r{r}c{c}", x, y + 12, H)
+    ]
+    return PrimitivePage(W, H, lines=lines, chars=chars)
+
+
+@pytest.mark.parametrize("kind", ["grid", "stub-grid", "one-rule"])
+@pytest.mark.parametrize("exact", [False, True])
+def test_bounded_search_same_pick_fewer_calls(grid_page, kind, exact):
+    page = {"grid": grid_page, "stub-grid": make_page("grid", 600), "one-rule": _one_rule_page()}[kind]
+    full_stats, bounded_stats = SearchStats(), SearchStats()
+    full = search_best_table_settings(page, debug=False, stats=full_stats)
+    bounded = search_best_table_settings(page, debug=False, bounded=True, exact=exact, stats=bounded_stats)
+    assert bounded[0] == full[0]
+    assert [t.cells for t in bounded[3]] == [t.cells for t in full[3]]
+    if kind == "one-rule":  # provably empty presets, dedupe alone runs them once too
+        assert bounded_stats.skipped_bound > 0
+    elif not exact:
+        assert bounded_stats.skipped_bound > 0
+        assert bounded_stats.find_tables_calls < full_stats.find_tables_calls
+    for st in (full_stats, bounded_stats):
+        assert st.find_tables_calls + st.dedup_settings + st.skipped_bound == st.presets
+
+
+def test_clean_grid_stops_after_first_preset(grid_page):
+    # the estimate of a closed grid equals its score, so ties behind it are skipped
+    stats = SearchStats(candidates=[])
+    search_best_table_settings(grid_page, debug=False, bounded=True, stats=stats)
+    assert stats.candidates[0][0] == "lines-lines-strong"
+    assert stats.find_tables_calls <= 2
+
+
+def _multi_table_page() -> PrimitivePage:
+    """One 8-row ruled table above three 2-row tables."""
+    W, H = 612.0, 792.0
+    lines, chars = [], []
+
+    def grid(top, rows, row_h=20.0, cols=3, x0=72.0, x1=540.0):
+        xs = [x0 + (x1 - x0) * i / cols for i in range(cols + 1)]
+        ys = [top + row_h * i for i in range(rows + 1)]
+        lines.extend(make_line(x0, y, x1, y, H) for y in ys)
+        lines.extend(make_line(x, ys[0], x, ys[-1], H) for x in xs)
+        for r in range(rows):
+            for c in range(cols):
+                chars.extend(make_chars(f"t{top:.0f}r{r}c{c}", xs[c] + 4, ys[r] + 5, H, size=8.0))
+
+    grid(60, 8, row_h=28.0)
+    for top in (340, 450, 560):
+        grid(top, 2)
+    return PrimitivePage(W, H, lines=lines, chars=chars)
+
+
+def test_bounded_matches_exhaustive_on_several_tables():
+    # one band per table: four small tables outscore one page-wide grid
+    page = _multi_table_page()
+    stats = SearchStats()
+    full = search_best_table_settings(page, debug=False)
+    bounded = search_best_table_settings(page, debug=False, bounded=True, stats=stats)
+    assert len(full[3]) == 4
+    assert stats.skipped_bound > 0
+    assert bounded[0] == full[0]
+    assert [t.cells for t in bounded[3]] == [t.cells for t in full[3]]
+    assert stats.find_tables_calls + stats.dedup_settings + stats.skipped_bound == stats.presets
+
+
+def test_dedupe_keeps_pick_and_skips_duplicates(grid_page):
+    plain_stats, dedup_stats = SearchStats(), SearchStats()
+    plain = search_best_table_settings(grid_page, debug=False, dedupe=False, stats=plain_stats)
+    dedup = search_best_table_settings(grid_page, debug=False, stats=dedup_stats)
+    assert dedup[:3] == plain[:3]
+    assert [t.cells for t in dedup[3]] == [t.cells for t in plain[3]]
+    assert plain_stats.find_tables_calls == plain_stats.presets
+    assert dedup_stats.dedup_settings + dedup_stats.dedup_grids > 0
+    assert dedup_stats.find_tables_calls < plain_stats.find_tables_calls
+
+
+def test_bound_zero_without_edges():
+    page = SimpleNamespace(width=612.0, height=792.0, edges=[], chars=[])
+    sig = _BoundSignals(page, CharIndex.from_chars([]))
+    cfg = {"vertical_strategy": "lines", "horizontal_strategy": "lines"}
+    assert _preset_upper_bound(cfg, sig) == 0.0
+    cfg = {"vertical_strategy": "explicit", "horizontal_strategy": "lines", "explicit_vertical_lines": [1, 2, 3]}
+    assert _preset_upper_bound(cfg, sig) == 0.0
+
+
+def test_geometry_score_within_tolerance(tmp_path):
+    path = make_grid_pdf(tmp_path / "p.pdf", n_pages=1, rows=6, cols=5, prose_lines=10)
+    with pdfplumber.open(path) as pdf:
+        page = pdf.pages[0]
+        cache = PageFeatureCache(page)
+        index = cache.char_index()
+        for preset in iter_compiled_settings():
+            cfg = preset.as_dict()
+            if "explicit" in (cfg["vertical_strategy"], cfg["horizontal_strategy"]):
+                continue
+            tables = cache.find_tables(cfg)
+            line_breaks = sum(str(c).count("\n") for t in tables for r in t.extract() for c in r)
+            exact, approx = score_tables(tables, page), score_tables(tables, page, index)
+            assert abs(exact - approx) <= TEXT_WEIGHT * line_breaks + 0.01
+
+
+def test_geometry_scoring_same_pick(grid_page):
+    geo = search_best_table_settings(grid_page, debug=False)
+    ext = search_best_table_settings(grid_page, debug=False, geometry_scoring=False)
+    assert geo[:3] == ext[:3]
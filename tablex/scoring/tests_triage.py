@@ -0,0 +1,48 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pytest
+
+from tablex.bench import make_page
+from tablex.scoring import SearchStats, search_best_table_settings
+from tablex.scoring.triage import TriageConfig, triage_page
+
+
+@pytest.mark.parametrize("kind,reason", [
+    ("grid", "rules"),
+    ("dashed", "rules"),
+    ("ruled", "text-grid"),
+    ("prose", "no-table"),
+])
+def test_triage_verdicts(kind, reason):
+    verdict = triage_page(make_page(kind, 800))
+    assert verdict.reason == reason
+    assert verdict.possible is (reason != "no-table")
+
+
+def test_triage_recall_knobs():
+    page = make_page("ruled", 800)
+    assert not triage_page(page, TriageConfig(min_gapped_lines=10_000)).possible
+    prose = make_page("prose", 800)
+    assert triage_page(prose, TriageConfig(keep_carry=True), carry_v=[72.0, 300.0]).reason == "carry"
+    assert not triage_page(prose, carry_v=[72.0, 300.0]).possible
+
+
+def test_search_returns_early_on_prose():
+    page = make_page("prose", 800)
+    with pytest.raises(RuntimeWarning):  # unchanged without triage
+        search_best_table_settings(page, debug=False)
+    stats = SearchStats()
+    assert search_best_table_settings(page, debug=False, triage=True, stats=stats) == (
+        None, (None, None), None, [], [], [],
+    )
+    assert stats.triage == "no-table" and stats.find_tables_calls == 0
+
+
+def test_search_with_triage_keeps_tables():
+    page = make_page("grid", 800)
+    assert search_best_table_settings(page, debug=False, triage=True)[0] == search_best_table_settings(
+        page, debug=False,
+    )[0]
@@ -0,0 +1,125 @@
+"""
+Table-free page pre-screen.
+
+`triage_page` decides from cheap signals whether any preset of
+`search_best_table_settings` can possibly return a table, so prose pages
+skip explicit-line extraction and the whole ``find_tables`` sweep.  It
+reuses the `PageGeometry` and `CharIndex` the search builds anyway.
+
+A page stays a candidate when any of these holds:
+
+* **carry** – only with ``keep_carry=True``: explicit lines were carried
+  over from the previous page (the ``explicit`` presets can lay them over
+  any page, but the pipeline carries lines onto nearly every page);
+* **rules** – segments / rect sides give ≥ 2 distinct vertical positions
+  spanning a table-sized width (the “小表” filter of the search), with
+  ≥ 2 horizontal positions or text rows to pair them with;
+* **text-grid** – at least ``min_gapped_lines`` text lines contain a gap
+  wider than ``gap_factor`` typical char advances (column-aligned text for
+  the ``text`` strategies).
+
+Everything else is marked “no table possible”.  `TriageConfig` trades
+skips for recall: smaller ``span_ratio`` / ``min_gapped_lines`` /
+``gap_factor`` keep more pages.  ``python -m tablex.bench --triage``
+reports the false-negative rate against the full search.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from tablex.utils.char_index import CharIndex
+from tablex.utils.geometry import KIND_RECT, ORIENT_H, ORIENT_V, PageGeometry
+
+
+@dataclass(frozen=True, slots=True)
+class TriageConfig:
+    """Thresholds of `triage_page` (lower values → higher recall)."""
+
+    min_edge_len: float = 3.0  # shorter segments / rect sides are ignored
+    span_ratio: float = 0.30  # width a ruled table must reach (× page width) ...
+    area_ratio: float = 0.12  # ... or area (× page area), as in the search
+    min_gapped_lines: int = 3
+    gap_factor: float = 4.0  # gap (× median char advance) that separates columns
+    position_tol: float = 1.0  # positions closer than this count once
+    keep_carry: bool = False  # keep every page that received carried lines
+
+
+DEFAULT_TRIAGE = TriageConfig()
+
+
+@dataclass(frozen=True, slots=True)
+class Triage:
+    """Verdict plus the signals it was based on."""
+
+    possible: bool
+    reason: str  # "carry" | "rules" | "text-grid" | "no-table"
+    v_positions: int = 0
+    h_positions: int = 0
+    gapped_lines: int = 0
+
+
+def _distinct(values: np.ndarray, tol: float) -> np.ndarray:
+    return np.unique(np.round(values / tol)) * tol if len(values) else values
+
+
+def _rule_positions(g: PageGeometry, cfg: TriageConfig):
+    """Distinct x of vertical and y of horizontal edges (rect sides included)."""
+    seg = g.kind != KIND_RECT
+    rect = ~seg
+    tall = rect & (g.bottom - g.top >= cfg.min_edge_len)
+    wide = rect & (g.dx >= cfg.min_edge_len)
+    long_seg = seg & (g.length >= cfg.min_edge_len)
+    xs = np.concatenate([g.x0[long_seg & (g.orientation == ORIENT_V)], g.x0[tall], g.x1[tall]])
+    ys = np.concatenate([g.top[long_seg & (g.orientation == ORIENT_H)], g.top[wide], g.bottom[wide]])
+    return _distinct(xs, cfg.position_tol), _distinct(ys, cfg.position_tol)
+
+
+def gapped_lines(char_index: CharIndex, gap_factor: float = 4.0) -> int:
+    """Number of text lines with a gap wider than *gap_factor* char advances."""
+    visible = ~char_index.blank
+    if visible.sum() < 2:
+        return 0
+    line = np.round(char_index.v_mid[visible])
+    x = char_index.h_mid[visible]
+    order = np.lexsort((x, line))
+    line, x = line[order], x[order]
+    step = np.diff(x)
+    same = np.diff(line) == 0
+    advances = step[same & (step > 0)]
+    if not len(advances):
+        return 0
+    wide = same & (step > gap_factor * float(np.median(advances)))
+    return len(np.unique(line[1:][wide]))
+
+
+def triage_page(
+    page,
+    config: TriageConfig = DEFAULT_TRIAGE,
+    *,
+    geometry: Optional[PageGeometry] = None,
+    char_index: Optional[CharIndex] = None,
+    carry_v: Optional[List[float]] = None,
+    carry_h: Optional[List[float]] = None,
+) -> Triage:
+    """Can any preset find a table on *page*?  See the module docstring."""
+    if config.keep_carry and ((carry_v and len(carry_v) >= 2) or (carry_h and len(carry_h) >= 2)):
+        return Triage(True, "carry")
+
+    g = geometry if geometry is not None else PageGeometry.from_page(page)
+    idx = char_index if char_index is not None else CharIndex.from_page(page)
+    W, H = page.width, page.height
+
+    xs, ys = _rule_positions(g, config)
+    if len(xs) >= 2:
+        v_span = float(xs[-1] - xs[0])
+        h_span = float(ys[-1] - ys[0]) if len(ys) >= 2 else H
+        big = v_span >= config.span_ratio * W or v_span * h_span >= config.area_ratio * W * H
+        if big and (len(ys) >= 2 or len(idx)):
+            return Triage(True, "rules", len(xs), len(ys))
+
+    n_gapped = gapped_lines(idx, config.gap_factor)
+    if n_gapped >= config.min_gapped_lines:
+        return Triage(True, "text-grid", len(xs), len(ys), n_gapped)
+    return Triage(False, "no-table", len(xs), len(ys), n_gapped)
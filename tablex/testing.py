@@ -0,0 +1,108 @@
+"""
+Minimal PDF writers shared by the test modules.
+
+`write_pdf` serialises one content stream per page (Helvetica as ``/F1``)
+into a valid PDF without any PDF library; `grid_ops` / `prose_ops` build
+the usual page contents and `make_grid_pdf` writes the standard ruled /
+text-only grid document.
+"""
+
+import pathlib
+from typing import Iterable, List, Optional, Sequence
+
+W, H = 612, 792
+
+
+def write_pdf(path, pages: Iterable[Sequence[str]], width: float = W, height: float = H) -> pathlib.Path:
+    """Write a PDF with one page per content-operator list in *pages*."""
+    objects: List[Optional[bytes]] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # pages tree, filled below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for ops in pages:
+        stream = "\n".join(ops).encode()
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_ref = len(objects)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_ref} 0 R >>".encode()
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    path = pathlib.Path(path)
+    path.write_bytes(bytes(out))
+    return path
+
+
+def grid_ops(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    label: str = "",
+    ruled: bool = True,
+    top_rule: bool = True,
+    text_dy: float = 20,
+) -> List[str]:
+    """Content operators of a grid over PDF coordinates *xs* × *ys* (*ys* top to bottom).
+
+    Every cell holds ``{label}r{row}c{col}``; ``ruled=False`` leaves out the
+    rules, ``top_rule=False`` only the first horizontal one.
+    """
+    ops = ["0 0 0 RG 1 w"]
+    if ruled:
+        ops += [f"{xs[0]} {y} m {xs[-1]} {y} l S" for i, y in enumerate(ys) if i or top_rule]
+        ops += [f"{x} {ys[0]} m {x} {ys[-1]} l S" for x in xs]
+    for r in range(len(ys) - 1):
+        for c in range(len(xs) - 1):
+            ops.append(f"BT /F1 10 Tf {xs[c] + 6:.2f} {ys[r] - text_dy:.2f} Td ({label}r{r}c{c}) Tj ET")
+    return ops
+
+
+def prose_ops(n_lines: int, label: str = "", top: float = 740) -> List[str]:
+    """*n_lines* of running text starting at PDF y *top*."""
+    return [
+        f"BT /F1 10 Tf 72 {top - 14 * i} Td (Prose line {i} {label}with some words.) Tj ET"
+        for i in range(n_lines)
+    ]
+
+
+def make_grid_pdf(
+    path,
+    n_pages: int = 3,
+    rows: int = 4,
+    cols: int = 3,
+    ruled: bool = True,
+    prose_lines: int = 0,
+) -> pathlib.Path:
+    """Write a minimal PDF whose pages each hold one ``rows × cols`` grid.
+
+    ``ruled=False`` leaves out the grid lines (text-only table); ``rows=0``
+    together with *prose_lines* produces a plain prose page.
+    """
+    x_left, x_right, y_top, y_bottom = 72, 540, 640, 240
+    xs = [x_left + (x_right - x_left) * i / max(cols, 1) for i in range(cols + 1)]
+    ys = [y_top - (y_top - y_bottom) * i / max(rows, 1) for i in range(rows + 1)]
+    pages = []
+    for p in range(n_pages):
+        ops = ["0 0 0 RG 1 w"]
+        if ruled and rows:
+            ops += [f"{x_left} {y} m {x_right} {y} l S" for y in ys]
+            ops += [f"{x} {y_top} m {x} {y_bottom} l S" for x in xs]
+        ops += prose_ops(prose_lines, f"of page {p} ")
+        if rows:
+            ops += grid_ops(xs, ys, f"p{p}", ruled=False)[1:]
+        pages.append(ops)
+    return write_pdf(path, pages)
@@ -1,20 +1,98 @@
-from typing import List
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
 
+import numpy as np
 
-def cluster(coords: List[float], cluster_tol: float = 8.0) -> List[float]:
+
+def _as_array(coords: Iterable[float]) -> np.ndarray:
+    if isinstance(coords, np.ndarray):
+        return coords.astype(float, copy=False).ravel()
+    if not isinstance(coords, (list, tuple)):
+        coords = list(coords)
+    return np.asarray(coords, dtype=float).ravel()
+
+
+def cluster(coords: Iterable[float], cluster_tol: float = 8.0) -> List[float]:
     """
     聚类：将相近坐标归并成一个值（取均值）。如 x=[10, 11, 12, 50]，tol=5 -> 聚为两个中心点
+
+    排序后相邻差值 > cluster_tol 处断开分组，每组用 reduceat 求均值。
     """
-    if not coords:
+    arr = _as_array(coords)
+    if not arr.size:
         return []
-    coords = sorted(coords)
-    clusters = []
-    group = [coords[0]]
-    for c in coords[1:]:
-        if abs(c - group[-1]) <= cluster_tol:
-            group.append(c)
-        else:
-            clusters.append(sum(group) / len(group))
-            group = [c]
-    clusters.append(sum(group) / len(group))
-    return clusters
+    arr = np.sort(arr)
+    starts = np.flatnonzero(np.diff(arr) > cluster_tol) + 1
+    starts = np.concatenate(([0], starts))
+    counts = np.diff(np.append(starts, arr.size))
+    return (np.add.reduceat(arr, starts) / counts).tolist()
+
+
+def cluster_segments(
+    coords: Iterable[float],
+    segment_ids: Iterable[Any],
+    cluster_tol: Union[float, Sequence[float], np.ndarray] = 8.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    分段批量聚类：每个 segment（如页码）独立聚类，但整体只做一次向量化计算。
+
+    参数
+    ----
+    coords:
+        所有坐标（可来自多页）。
+    segment_ids:
+        与 coords 等长的分段标签（页码、方向等，可排序即可）。
+    cluster_tol:
+        标量容差，或与 coords 等长的逐点容差（取每组后一个点的容差判断断开）。
+
+    返回
+    ----
+    (centroids, centroid_segments)：按 (segment, centroid) 升序排列。
+    """
+    arr = _as_array(coords)
+    seg = np.asarray(list(segment_ids) if not isinstance(segment_ids, np.ndarray) else segment_ids).ravel()
+    if arr.size != seg.size:
+        raise ValueError("coords and segment_ids must have the same length")
+    if not arr.size:
+        return np.empty(0, dtype=float), seg[:0]
+
+    order = np.lexsort((arr, seg))
+    arr, seg = arr[order], seg[order]
+    tol = np.asarray(cluster_tol, dtype=float)
+    if tol.ndim:
+        tol = tol.ravel()[order][1:]
+
+    breaks = (np.diff(arr) > tol) | (seg[1:] != seg[:-1])
+    starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+    counts = np.diff(np.append(starts, arr.size))
+    return np.add.reduceat(arr, starts) / counts, seg[starts]
+
+
+def cluster_batch(
+    coords: Iterable[float],
+    page_ids: Iterable[Any],
+    cluster_tol: Union[float, Sequence[float], np.ndarray] = 8.0,
+) -> Dict[Any, List[float]]:
+    """多页坐标一次聚类，返回 {page_id: 聚类中心列表}（与逐页 `cluster` 结果一致）"""
+    centroids, segs = cluster_segments(coords, page_ids, cluster_tol)
+    result: Dict[Any, List[float]] = {}
+    if not centroids.size:
+        return result
+    bounds = np.flatnonzero(segs[1:] != segs[:-1]) + 1
+    for part, part_segs in zip(np.split(centroids, bounds), np.split(segs, bounds)):
+        result[part_segs[0].item()] = part.tolist()
+    return result
+
+
+def cluster_lists(
+    groups: Sequence[Iterable[float]],
+    cluster_tol: Union[float, Sequence[float]] = 8.0,
+) -> List[List[float]]:
+    """对多组坐标（如竖线/横线）各自聚类，只做一次向量化计算；容差可逐组指定"""
+    arrays = [_as_array(g) for g in groups]
+    sizes = [a.size for a in arrays]
+    ids = np.repeat(np.arange(len(arrays)), sizes)
+    tol = np.asarray(cluster_tol, dtype=float)
+    if tol.ndim:
+        tol = np.repeat(tol, sizes)
+    merged = cluster_batch(np.concatenate(arrays) if arrays else [], ids, tol)
+    return [merged.get(i, []) for i in range(len(arrays))]
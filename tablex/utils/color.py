@@ -1,15 +1,157 @@
-from typing import Any, List, Tuple, Union
+"""
+Color classification.
+
+pdfplumber reports colors as a bare number (old versions), ``None``, or a
+tuple whose length gives the color space: 1 = grey, 3 = RGB, 4 = CMYK.
+Pattern colors contain a name (``("P0",)`` or ``(0.2, "P1")``).
+
+`ColorArray` normalises a whole sequence of such colors to one
+``(n, 3)`` RGB array in a single pass (one conversion per distinct color)
+and classifies all of them with NumPy.  Grey, RGB and CMYK are handled
+explicitly; ``None``, pattern and unknown colors never match any class.
+The per-item helpers below are thin wrappers around it.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+
+# color space codes
+SPACE_NONE = 0
+SPACE_GREY = 1
+SPACE_RGB = 2
+SPACE_CMYK = 3
+SPACE_OTHER = 4  # pattern / unsupported
+
+_LUMA = np.array([0.2126, 0.7152, 0.0722])  # WCAG relative luminance
+
+
+def _is_number(v: Any) -> bool:
+    return isinstance(v, (int, float, np.number)) and not isinstance(v, bool)
+
+
+def _components(rows: List[Any], n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """``(ok, values)``: *rows* of length *n* as floats, ``ok=False`` for non-numeric rows."""
+    try:
+        return np.ones(len(rows), dtype=bool), np.asarray(rows, dtype=float).reshape(-1, n)
+    except (TypeError, ValueError):  # pattern names among the rows
+        ok = np.fromiter((all(_is_number(c) for c in row) for row in rows), dtype=bool, count=len(rows))
+        values = np.full((len(rows), n), math.nan)
+        if ok.any():
+            values[ok] = np.asarray([row for row, good in zip(rows, ok) if good], dtype=float)
+        return ok, values
+
+
+def _to_rgb(n: int, values: np.ndarray) -> np.ndarray:
+    if n == 1:
+        return np.repeat(values, 3, axis=1)
+    if n == 3:
+        return values
+    white = 1 - values[:, 3:4]  # CMYK
+    return (1 - values[:, :3]) * white
+
+
+_SPACES = {1: SPACE_GREY, 3: SPACE_RGB, 4: SPACE_CMYK}
+
+
+@dataclass(frozen=True, slots=True)
+class ColorArray:
+    """Colors of many primitives as ``space`` codes plus an RGB array.
+
+    ``rgb`` is NaN for `SPACE_NONE` / `SPACE_OTHER` rows.
+    """
+
+    space: np.ndarray
+    rgb: np.ndarray
+
+    @classmethod
+    def from_colors(cls, colors: Iterable[Any]) -> "ColorArray":
+        # distinct colors first: a page rarely uses more than a handful
+        seen: Dict[Any, int] = {}
+        uniq: List[Any] = []
+        index: List[int] = []
+        for color in colors:
+            key = tuple(color) if isinstance(color, list) else color
+            try:
+                ix = seen.get(key)
+            except TypeError:  # unhashable pattern payload
+                ix = None
+                key = None
+            if ix is None:
+                ix = len(uniq)
+                uniq.append(color)
+                if key is not None:
+                    seen[key] = ix
+            index.append(ix)
+
+        space = np.full(len(uniq), SPACE_OTHER, dtype=np.int8)
+        rgb = np.full((len(uniq), 3), math.nan)
+        buckets: Dict[int, Tuple[List[int], List[Any]]] = {n: ([], []) for n in _SPACES}
+        for i, color in enumerate(uniq):
+            if color is None:
+                space[i] = SPACE_NONE
+            elif _is_number(color):
+                buckets[1][0].append(i)
+                buckets[1][1].append((color,))
+            elif isinstance(color, (tuple, list)) and len(color) in _SPACES:
+                buckets[len(color)][0].append(i)
+                buckets[len(color)][1].append(color)
+        for n, (pos, rows) in buckets.items():
+            if not pos:
+                continue
+            ok, values = _components(rows, n)
+            pos = np.asarray(pos, dtype=np.intp)[ok]
+            space[pos] = _SPACES[n]
+            rgb[pos] = _to_rgb(n, values[ok])
+
+        idx = np.asarray(index, dtype=np.intp)
+        return cls(space=space[idx], rgb=rgb[idx])
+
+    def __len__(self) -> int:
+        return len(self.space)
+
+    @property
+    def known(self) -> np.ndarray:
+        return (self.space == SPACE_GREY) | (self.space == SPACE_RGB) | (self.space == SPACE_CMYK)
+
+    @property
+    def luminance(self) -> np.ndarray:
+        """WCAG luminance; grey values are used as-is."""
+        lum = self.rgb @ _LUMA
+        grey = self.space == SPACE_GREY
+        lum[grey] = self.rgb[grey, 0]
+        return lum
+
+    def near_black(self, threshold: float = 0.2) -> np.ndarray:
+        """Every channel below *threshold*."""
+        return self.known & (self.rgb < threshold).all(axis=1)
+
+    def dark(self, lum_thresh: float = 0.45) -> np.ndarray:
+        """Luminance below *lum_thresh*."""
+        return self.known & (self.luminance < lum_thresh)
+
+    def dark_greyscale(self, lum_thresh: float = 0.45, grey_tol: float = 0.05) -> np.ndarray:
+        """Dark, with all channels within *grey_tol* of each other."""
+        spread = self.rgb.max(axis=1) - self.rgb.min(axis=1)
+        return self.dark(lum_thresh) & (spread <= grey_tol)
+
+    def white(self, thr: float = 0.9) -> np.ndarray:
+        """Every channel at or above *thr*."""
+        return self.known & (self.rgb >= thr).all(axis=1)
+
+
+def _one(color: Any) -> ColorArray:
+    return ColorArray.from_colors((color,))
 
 
 def is_near_black(color: Union[float, int, Tuple[float, ...], List[float]], threshold: float = 0.2) -> bool:
     """
-    判断颜色是否接近黑色：支持灰度值或 RGB 元组。默认阈值为 0.2。
+    判断颜色是否接近黑色：支持灰度、RGB 与 CMYK。默认阈值为 0.2。
     """
-    if isinstance(color, (int, float)):
-        return color < threshold
-    if isinstance(color, (tuple, list)) and len(color) >= 3:
-        return all(c < threshold for c in color[:3])
-    return False
+    return bool(_one(color).near_black(threshold)[0])
 
 
 def is_dark_color(
@@ -19,15 +161,9 @@ def is_dark_color(
     """
     判断颜色是否为“深色边框”：
         • 灰度值：直接比较
-        • RGB：使用相对亮度 (WCAG) 公式
+        • RGB / CMYK（先换算为 RGB）：使用相对亮度 (WCAG) 公式
     """
-    if isinstance(color, (int, float)):
-        return color < lum_thresh
-    if isinstance(color, (tuple, list)) and len(color) >= 3:
-        r, g, b = color[:3]
-        luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
-        return luminance < lum_thresh
-    return False
+    return bool(_one(color).dark(lum_thresh)[0])
 
 
 def is_dark_and_greyscale_like(
@@ -40,25 +176,13 @@ def is_dark_and_greyscale_like(
     Parameters
     ----------
     color:
-        Either a grayscale value or RGB tuple in the range ``[0, 1]``.
+        A grayscale value, or a grey / RGB / CMYK tuple in the range ``[0, 1]``.
     lum_thresh:
         Maximum luminance considered dark.
     grey_tol:
         Allowed channel deviation to still be treated as greyscale.
     """
-    if isinstance(color, (int, float)):
-        return color < lum_thresh
-
-    if isinstance(color, (tuple, list)) and len(color) >= 3:
-        r, g, b = color[:3]
-
-        if max(abs(r - g), abs(g - b), abs(b - r)) > grey_tol:
-            return False
-
-        luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
-        return luminance < lum_thresh
-
-    return False
+    return bool(_one(color).dark_greyscale(lum_thresh, grey_tol)[0])
 
 
 def _is_white(color: Any, thr: float = 0.9) -> bool:
@@ -66,20 +190,14 @@ def _is_white(color: Any, thr: float = 0.9) -> bool:
     判断颜色是否接近白色。
 
     pdfplumber 的颜色表示可能是：
-      • 0-1 之间的灰度值（float / int）
-      • RGB 三元组 (r, g, b)，每个分量 0-1
-      • None（极少出现，表示使用当前绘图颜色），此处统一视为“非白”
+      • 0-1 之间的灰度值（float / int）或 1 元组
+      • RGB 三元组 (r, g, b) / CMYK 四元组，每个分量 0-1
+      • None 或图案颜色，此处统一视为“非白”
     参数
     ----
     color : Any
         pdfplumber 提取到的颜色对象
     thr : float
-        判断“接近白色”的阈值，默认 0.95
+        判断“接近白色”的阈值，默认 0.9
     """
-    if color is None:
-        return False
-    if isinstance(color, (int, float)):
-        return color >= thr
-    if isinstance(color, (list, tuple)):
-        return all(c >= thr for c in color)
-    return False
+    return bool(_one(color).white(thr)[0])
@@ -1,7 +1,5 @@
 from typing import List
 
-from PIL import ImageDraw, ImageFont
-
 
 def draw_lines_on_page(page, v_lines: List[float], h_lines: List[float], color: str = "blue", stroke_width: int = 2):
     im = page.to_image(resolution=150)
@@ -17,6 +15,8 @@ def draw_lines_on_page_plus(
     page, v_lines: List[float], h_lines: List[float],
     stroke_width: int = 2, text_color: str = "red",
 ):
+    from PIL import ImageDraw, ImageFont  # 只在真正绘图时导入 PIL
+
     im = page.to_image()
     pil_img = im.original.copy()  # 原始 PIL 图像
     drawer = ImageDraw.Draw(pil_img)
@@ -0,0 +1,165 @@
+"""
+Columnar page geometry snapshot.
+
+`PageGeometry` walks ``page.lines``, ``page.rects`` and ``page.curves``
+exactly once and stores every primitive as a row of NumPy arrays, so the
+line-analysis routines in `tablex.lines.explicit` and
+`tablex.utils.large_table` can work with array slices instead of
+re-scanning the dict lists on every call.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+from tablex.utils.color import ColorArray
+
+
+# source kind
+KIND_LINE = 0
+KIND_RECT = 1
+KIND_CURVE = 2
+
+# orientation (with ORIENTATION_TOL)
+ORIENT_OTHER = 0
+ORIENT_H = 1
+ORIENT_V = 2
+
+ORIENTATION_TOL = 2.0
+
+_FIELDS = ("x0", "x1", "y0", "y1", "top", "bottom")
+
+
+def _edge_color(obj: Any, kind: int) -> Any:
+    """Color used for edge checks: curves use stroking color, others prefer fill."""
+    if kind == KIND_CURVE:
+        return obj.get("stroking_color", 0.0)
+    return obj.get("non_stroking_color") or obj.get("stroking_color", 0.0)
+
+
+@dataclass(frozen=True, slots=True)
+class PageGeometry:
+    """One-pass array snapshot of the vector primitives of a page.
+
+    Attributes
+    ----------
+    width, height:
+        Page size.
+    kind:
+        Source kind per primitive (`KIND_LINE`, `KIND_RECT`, `KIND_CURVE`).
+    x0, x1, y0, y1, top, bottom:
+        Raw pdfplumber coordinates.
+    length:
+        Euclidean length of the bbox diagonal, ``hypot(dx, dy)``.
+    orientation:
+        `ORIENT_H` / `ORIENT_V` / `ORIENT_OTHER` using `ORIENTATION_TOL`.
+    edge_dark, edge_white:
+        Color class of the edge color (see `_edge_color`).
+    fill_dark:
+        Color class of ``non_stroking_color`` (default black), as used by
+        the rect filter in `extract_lines_from_page_rects`.
+    edge_colors:
+        Raw edge color objects, for debugging / ``get_horizon_edges``.
+    """
+
+    width: float
+    height: float
+    kind: np.ndarray
+    x0: np.ndarray
+    x1: np.ndarray
+    y0: np.ndarray
+    y1: np.ndarray
+    top: np.ndarray
+    bottom: np.ndarray
+    length: np.ndarray
+    orientation: np.ndarray
+    edge_dark: np.ndarray
+    edge_white: np.ndarray
+    fill_dark: np.ndarray
+    edge_colors: Tuple[Any, ...]
+
+    @classmethod
+    def from_page(
+        cls,
+        page,
+        *,
+        lines: Optional[Iterable[Any]] = None,
+        rects: Optional[Iterable[Any]] = None,
+        curves: Optional[Iterable[Any]] = None,
+    ) -> "PageGeometry":
+        """Build the snapshot; *lines/rects/curves* override the page primitives."""
+        if lines is None and rects is None and curves is None:
+            prebuilt = getattr(page, "page_geometry", None)  # e.g. a cached page
+            if prebuilt is not None:
+                return prebuilt
+        groups = (
+            (KIND_LINE, list(page.lines if lines is None else lines)),
+            (KIND_RECT, list(page.rects if rects is None else rects)),
+            (KIND_CURVE, list(getattr(page, "curves", []) if curves is None else curves)),
+        )
+
+        kinds, coords, colors, fills = [], [], [], []
+        for kind, objs in groups:
+            kinds.append(np.full(len(objs), kind, dtype=np.int8))
+            coords.extend([o[f] for f in _FIELDS] for o in objs)
+            for o in objs:
+                colors.append(_edge_color(o, kind))
+                fills.append(o.get("non_stroking_color", 0.0))
+
+        arr = np.asarray(coords, dtype=float).reshape(-1, len(_FIELDS))
+        x0, x1, y0, y1, top, bottom = arr.T
+        dx, dy = x1 - x0, y1 - y0
+
+        orientation = np.full(len(arr), ORIENT_OTHER, dtype=np.int8)
+        orientation[np.abs(dy) <= ORIENTATION_TOL] = ORIENT_H
+        orientation[(np.abs(dx) <= ORIENTATION_TOL) & (orientation == ORIENT_OTHER)] = ORIENT_V
+
+        edge = ColorArray.from_colors(colors)
+        fill = ColorArray.from_colors(fills)
+        return cls(
+            width=page.width,
+            height=page.height,
+            kind=np.concatenate(kinds),
+            x0=x0,
+            x1=x1,
+            y0=y0,
+            y1=y1,
+            top=top,
+            bottom=bottom,
+            length=np.hypot(dx, dy),
+            orientation=orientation,
+            edge_dark=edge.dark_greyscale(),
+            edge_white=edge.white(),
+            fill_dark=fill.dark_greyscale(),
+            edge_colors=tuple(colors),
+        )
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    @property
+    def dx(self) -> np.ndarray:
+        return self.x1 - self.x0
+
+    @property
+    def dy(self) -> np.ndarray:
+        return self.y1 - self.y0
+
+    @property
+    def lines(self) -> np.ndarray:
+        """Boolean mask of primitives that came from ``page.lines``."""
+        return self.kind == KIND_LINE
+
+    @property
+    def rects(self) -> np.ndarray:
+        return self.kind == KIND_RECT
+
+    @property
+    def curves(self) -> np.ndarray:
+        return self.kind == KIND_CURVE
+
+
+def ensure_geometry(page, geometry: Optional[PageGeometry] = None) -> PageGeometry:
+    """Return *geometry* or build it from *page* when missing."""
+    return geometry if geometry is not None else PageGeometry.from_page(page)
@@ -1,13 +1,16 @@
-import heapq
+import logging
 from dataclasses import dataclass
-from typing import Any, List, Tuple
+from typing import Any, List, Optional, Tuple
 
-from tablex.utils.cluster import cluster
-from tablex.utils.color import _is_white, is_dark_and_greyscale_like
+import numpy as np
+
+from tablex.utils.cluster import cluster, cluster_lists
 from tablex.utils.debug import draw_lines_on_page_plus  # noqa
+from tablex.utils.geometry import PageGeometry, ensure_geometry
+from tablex.utils.log import TRACE, get_logger
 
 
-DEBUG = 0
+logger = get_logger(__name__)
 
 
 def div(a: float, b: float = 1.0) -> float:
@@ -15,6 +18,11 @@ def div(a: float, b: float = 1.0) -> float:
     return round(a / b, 5) if b != 0 else 0.0
 
 
+def _div(arr: np.ndarray) -> np.ndarray:
+    """数组版 div（b=1）"""
+    return np.round(np.asarray(arr, dtype=float), 5)
+
+
 @dataclass(slots=True)
 class BoundConfig:
     top: Tuple[float, float] = (0.10, 0.22)
@@ -28,210 +36,208 @@ class BoundConfig:
 CFG = BoundConfig()
 
 
-def _extract_raw_lines(page, cfg: BoundConfig = CFG) -> Tuple[List[float], List[float]]:
+def _extract_raw_lines(page, cfg: BoundConfig = CFG, geometry: Optional[PageGeometry] = None) -> Tuple[List[float], List[float]]:
     """提取所有结构线段（直线、rect、curve）的横纵坐标点"""
     H = page.height
-    v_bucket, h_bucket = [], []
+    g = ensure_geometry(page, geometry)
 
-    if DEBUG:
-        print(f"[DEBUG] _extract_raw_lines：页面高度={H}")
+    logger.debug("_extract_raw_lines：页面高度=%s", H)
 
     # 从 lines 中提取竖线和横线
-    for ln in page.lines:
-        dx, dy = ln["x1"] - ln["x0"], ln["y1"] - ln["y0"]
-        if abs(dx) <= cfg.dx_tol:
-            v_bucket.append(div(ln["x0"]))
-        if abs(dy) <= cfg.dy_tol:
-            h_bucket.append(div(H - ln["y0"]))
-
-    if DEBUG:
-        print(f"[DEBUG] 线条数量={len(page.lines)}，竖线候选={len(v_bucket)}，横线候选={len(h_bucket)}")
-
+    ln_v = g.lines & (np.abs(g.dx) <= cfg.dx_tol)
+    ln_h = g.lines & (np.abs(g.dy) <= cfg.dy_tol)
     # 从 rect 中提取左右、上下边界
-    for rc in page.rects:
-        v_bucket.extend([div(rc["x0"]), div(rc["x1"])])
-        h_bucket.extend([div(H - rc["y0"]), div(H - rc["y1"])])
-
-    if DEBUG:
-        print(f"[DEBUG] 矩形贡献{len(page.rects) * 2}个坐标")
-
+    rc = g.rects
     # 从 curves 中提取结构线
-    for cv in getattr(page, "curves", []):
-        if abs(cv["x1"] - cv["x0"]) <= cfg.dx_tol:
-            v_bucket.extend([div(cv["x0"]), div(cv["x1"])])
-        if abs(cv["y1"] - cv["y0"]) <= cfg.dy_tol:
-            h_bucket.extend([div(H - cv["y0"]), div(H - cv["y1"])])
-
-    if DEBUG:
-        print(f"[DEBUG] Curves：原始 v_bucket 总数={len(v_bucket)}，原始 h_bucket={len(h_bucket)}")
-        print(f"[DEBUG] raw_h 值（排序后）：{sorted(h_bucket)}")
-
-    return v_bucket, h_bucket
-
-
-def _collect_vertical_edges(page, cfg: BoundConfig = CFG) -> List[Tuple[float, float]]:
+    cv_v = g.curves & (np.abs(g.dx) <= cfg.dx_tol)
+    cv_h = g.curves & (np.abs(g.dy) <= cfg.dy_tol)
+
+    v_bucket = _div(np.concatenate([
+        g.x0[ln_v],
+        np.column_stack([g.x0[rc], g.x1[rc]]).ravel(),
+        np.column_stack([g.x0[cv_v], g.x1[cv_v]]).ravel(),
+    ]))
+    h_bucket = _div(H - np.concatenate([
+        g.y0[ln_h],
+        np.column_stack([g.y0[rc], g.y1[rc]]).ravel(),
+        np.column_stack([g.y0[cv_h], g.y1[cv_h]]).ravel(),
+    ]))
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("线条数量=%d，矩形贡献%d个坐标", int(g.lines.sum()), int(rc.sum()) * 2)
+        logger.debug("原始 v_bucket 总数=%d，原始 h_bucket=%d", len(v_bucket), len(h_bucket))
+        logger.log(TRACE, "raw_h 值（排序后）：%s", np.sort(h_bucket).tolist())
+
+    return v_bucket.tolist(), h_bucket.tolist()
+
+
+def _vertical_edge_arrays(g: PageGeometry, cfg: BoundConfig = CFG) -> Tuple[np.ndarray, np.ndarray]:
+    """所有垂直边的 (x, 高度) 数组：lines / rect 左右边 / curves"""
+    ln = g.lines & (np.abs(g.dx) <= cfg.dx_tol)
+    rc = g.rects
+    cv = g.curves & (np.abs(g.dx) <= cfg.dx_tol)
+
+    xs = np.concatenate([
+        g.x0[ln],
+        np.column_stack([g.x0[rc], g.x1[rc]]).ravel(),
+        g.x0[cv],
+    ])
+    hs = np.concatenate([
+        np.abs(g.dy[ln]),
+        np.repeat(g.dy[rc], 2),
+        np.abs(g.dy[cv]),
+    ])
+    return _div(xs), _div(hs)
+
+
+def _collect_vertical_edges(page, cfg: BoundConfig = CFG, geometry: Optional[PageGeometry] = None) -> List[Tuple[float, float]]:
     """收集所有垂直边（含高度信息）"""
-    edges = []
-    H = page.height
-
-    if DEBUG:
-        print(f"[DEBUG] _collect_vertical_edges：页面高度={H}")
-
-    for ln in page.lines:
-        if abs(ln["x1"] - ln["x0"]) <= cfg.dx_tol:
-            edges.append((div(ln["x0"]), div(abs(ln["y1"] - ln["y0"]))))
+    xs, hs = _vertical_edge_arrays(ensure_geometry(page, geometry), cfg)
 
-    if DEBUG:
-        print(f"[DEBUG] Lines：收集自{len(page.lines)}条线")
+    logger.debug("_collect_vertical_edges：垂直边总数=%d", len(xs))
 
-    for rc in page.rects:
-        height = div(rc["y1"] - rc["y0"])
-        edges.extend([(div(rc["x0"]), height), (div(rc["x1"]), height)])
+    return list(zip(xs.tolist(), hs.tolist()))
 
-    if DEBUG:
-        print(f"[DEBUG] Rects：收集自{len(page.rects)}个矩形，总计={len(edges)}")
 
-    for cv in getattr(page, "curves", []):
-        if abs(cv["x1"] - cv["x0"]) <= cfg.dx_tol:
-            edges.append((div(cv["x0"]), div(abs(cv["y1"] - cv["y0"]))))
+def _h_edge_arrays(g: PageGeometry, cfg: BoundConfig) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """所有水平边的 (y_pt, 长度, 图元下标) 数组，顺序与 `_iter_h_edges_with_y` 一致"""
+    H = g.height
+    ln = np.flatnonzero(g.lines & (np.abs(g.dy) <= cfg.dy_tol))
+    rc = np.flatnonzero(g.rects)
+    cv = np.flatnonzero(g.curves & (np.abs(g.dy) <= cfg.dy_tol))
 
-    if DEBUG:
-        print(f"[DEBUG] Curves：垂直边总数={len(edges)}")
+    idx = np.concatenate([ln, np.repeat(rc, 2), cv])
+    ys = np.concatenate([
+        g.y0[ln],
+        np.column_stack([g.y0[rc], g.y1[rc]]).ravel(),
+        g.y0[cv],
+    ])
+    lengths = np.concatenate([
+        np.abs(g.dx[ln]),
+        np.repeat(g.dx[rc], 2),
+        np.abs(g.dx[cv]),
+    ])
+    return _div(H - ys), _div(lengths), idx
 
-    return edges
 
-
-def _iter_h_edges_with_y(page, cfg: BoundConfig):
+def _iter_h_edges_with_y(page, cfg: BoundConfig, geometry: Optional[PageGeometry] = None):
     """遍历所有水平边缘，返回 y 坐标、长度和颜色"""
-    H = page.height
+    g = ensure_geometry(page, geometry)
+    ys, lengths, idx = _h_edge_arrays(g, cfg)
+    for y_pt, length, ix in zip(ys.tolist(), lengths.tolist(), idx.tolist()):
+        yield y_pt, length, g.edge_colors[ix]
+
 
-    for ln in page.lines:
-        if abs(ln["y1"] - ln["y0"]) <= cfg.dy_tol:
-            y_pt = div(H - ln["y0"])
-            length = div(abs(ln["x1"] - ln["x0"]))
-            color = ln.get("non_stroking_color") or ln.get("stroking_color", 0.0)
-            yield y_pt, length, color
-
-    for rc in page.rects:
-        for y_raw in (rc["y0"], rc["y1"]):
-            y_pt = div(H - y_raw)
-            length = div(rc["x1"] - rc["x0"])
-            color = rc.get("non_stroking_color") or rc.get("stroking_color", 0.0)
-            yield y_pt, length, color
-
-    for cv in getattr(page, "curves", []):
-        if abs(cv["y1"] - cv["y0"]) <= cfg.dy_tol:
-            y_pt = div(H - cv["y0"])
-            length = div(abs(cv["x1"] - cv["x0"]))
-            color = cv.get("stroking_color", 0.0)
-            yield y_pt, length, color
-
-
-def _has_dark_longline(page, exp_len: float, cfg: BoundConfig, y_band: Tuple[float, float]) -> bool:
+def _has_dark_longline(
+    page, exp_len: float, cfg: BoundConfig, y_band: Tuple[float, float],
+    geometry: Optional[PageGeometry] = None,
+) -> bool:
     """判断 y_band 区域内是否存在一条黑灰长横线"""
     H = page.height
     tol_len = div(exp_len * cfg.tol_ratio)
     y_min, y_max = y_band
     tol_y = div(H * cfg.tol_ratio)
 
-    def y_ok(y_pt: float) -> bool:
-        return (y_min - tol_y) <= y_pt <= (y_max + tol_y)
+    g = ensure_geometry(page, geometry)
+    ys, lengths, idx = _h_edge_arrays(g, cfg)
+    y_ok = ((y_min - tol_y) <= ys) & (ys <= (y_max + tol_y))
+    if logger.isEnabledFor(TRACE):
+        for y_pt, length, ix in zip(ys[y_ok], lengths[y_ok], idx[y_ok]):
+            logger.log(TRACE, "边@%s：长度=%s，颜色=%s", y_pt, length, g.edge_colors[ix])
 
-    for y_pt, length, color in _iter_h_edges_with_y(page, cfg):
-        if y_ok(y_pt):
-            if DEBUG:
-                print(f"[DEBUG] 边@{y_pt}：长度={length}，颜色={color}")
-            if abs(length - exp_len) <= tol_len and is_dark_and_greyscale_like(color):
-                print("[DEBUG] 找到符合条件的黑色长横线")
-                return True
+    if (y_ok & (np.abs(lengths - exp_len) <= tol_len) & g.edge_dark[idx]).any():
+        logger.debug("找到符合条件的黑色长横线")
+        return True
 
-    print("[DEBUG] 未找到符合条件的黑色长横线")
+    logger.debug("未找到符合条件的黑色长横线")
     return False
 
 
-def _vertical_top_aligned(page, left_x: float, right_x: float, cfg: BoundConfig) -> bool:
+def _vertical_top_aligned(
+    page, left_x: float, right_x: float, cfg: BoundConfig,
+    geometry: Optional[PageGeometry] = None,
+) -> bool:
     """检查左右边界的顶部是否对齐（避免底部误判为大表）"""
     H = page.height
     tol_x = div(page.width * cfg.tol_ratio)
     tol_y = div(H * cfg.tol_ratio)
-    heap_left, heap_right = [], []
-
-    def try_push(x_ref, x_val, y0, heap):
-        if abs(x_val - x_ref) <= tol_x:
-            heapq.heappush(heap, div(H - y0))
-
-    for ln in page.lines:
-        if abs(ln["x1"] - ln["x0"]) <= cfg.dx_tol:
-            try_push(left_x, ln["x0"], ln["y0"], heap_left)
-            try_push(right_x, ln["x0"], ln["y0"], heap_right)
-
-    for rc in page.rects:
-        for x_val in (rc["x0"], rc["x1"]):
-            try_push(left_x, x_val, rc["y0"], heap_left)
-            try_push(right_x, x_val, rc["y0"], heap_right)
-
-    for cv in getattr(page, "curves", []):
-        if abs(cv["x1"] - cv["x0"]) <= cfg.dx_tol:
-            try_push(left_x, cv["x0"], cv["y0"], heap_left)
-            try_push(right_x, cv["x0"], cv["y0"], heap_right)
-
-    if heap_left and heap_right:
-        diff = abs(heap_left[0] - heap_right[0])
-        aligned = diff <= tol_y
-        if DEBUG:
-            print(f"[DEBUG] 顶部对齐差值={diff}，是否对齐={aligned}")
+    g = ensure_geometry(page, geometry)
+
+    ln = g.lines & (np.abs(g.dx) <= cfg.dx_tol)
+    rc = g.rects
+    cv = g.curves & (np.abs(g.dx) <= cfg.dx_tol)
+    xs = np.concatenate([g.x0[ln], g.x0[rc], g.x1[rc], g.x0[cv]])
+    y0s = np.concatenate([g.y0[ln], g.y0[rc], g.y0[rc], g.y0[cv]])
+    tops = _div(H - y0s)
+
+    near_left = np.abs(xs - left_x) <= tol_x
+    near_right = np.abs(xs - right_x) <= tol_x
+
+    if near_left.any() and near_right.any():
+        diff = abs(tops[near_left].min() - tops[near_right].min())
+        aligned = bool(diff <= tol_y)
+        logger.debug("顶部对齐差值=%s，是否对齐=%s", diff, aligned)
         return aligned
 
-    print("[DEBUG] 用于顶部对齐的线迹不足")
+    logger.debug("用于顶部对齐的线迹不足")
     return False
 
 
-def has_large_table(page, cfg: BoundConfig = CFG) -> bool:
+def has_large_table(page, cfg: BoundConfig = CFG, geometry: Optional[PageGeometry] = None) -> bool:
     """主入口函数：判断页面是否含有较大的表格结构"""
     W, H = page.width, page.height
     tol_x, tol_y = div(W * cfg.tol_ratio), div(H * cfg.tol_ratio)
+    g = ensure_geometry(page, geometry)
 
-    raw_v, raw_h = _extract_raw_lines(page, cfg)
-    v_lines = cluster(raw_v, tol_x)
-    h_lines = cluster(raw_h, tol_y)
+    raw_v, raw_h = _extract_raw_lines(page, cfg, geometry=g)
+    v_lines, h_lines = cluster_lists([raw_v, raw_h], [tol_x, tol_y])
 
-    edges = _collect_vertical_edges(page, cfg)
-    if not edges:
-        print("[DEBUG] 无边线：提前结束")
+    xs, hs = _vertical_edge_arrays(g, cfg)
+    if not len(xs):
+        logger.debug("无边线：提前结束")
         return False
 
-    max_h = max(h for _, h in edges)
+    max_h = float(hs.max())
     h_thr = div(max_h * (1 - cfg.tol_ratio))
     left_thr, right_thr = div(W * cfg.side[0]), div(W * cfg.side[1])
 
     # 利用 virtual_v 合并靠近的竖线高度信息
     tol_x = div(W * cfg.tol_ratio)
-    virtual_v = cluster([x for x, _ in edges] + v_lines, tol_x)
-    virtual_edges: List[Tuple[float, float]] = []
+    virtual_v = cluster(xs.tolist() + v_lines, tol_x)
+    order = np.argsort(xs, kind="stable")
+    xs_sorted, hs_sorted = xs[order], hs[order]
+    virtual_x: List[float] = []
+    virtual_h: List[float] = []
     for x_cluster in virtual_v:
-        nearby_h = [h for x, h in edges if abs(x - x_cluster) <= tol_x]
-        if not nearby_h:
+        lo = np.searchsorted(xs_sorted, x_cluster - tol_x, side="left")
+        hi = np.searchsorted(xs_sorted, x_cluster + tol_x, side="right")
+        nearby_h = hs_sorted[lo:hi][np.abs(xs_sorted[lo:hi] - x_cluster) <= tol_x]
+        if not nearby_h.size:
             continue
-        max_h_cluster = max(nearby_h)
-        virtual_edges.append((x_cluster, max_h_cluster))
-    edges.extend(virtual_edges)
+        virtual_x.append(x_cluster)
+        virtual_h.append(float(nearby_h.max()))
+    xs = np.concatenate([xs, virtual_x])
+    hs = np.concatenate([hs, virtual_h])
 
-    has_left = any(x <= left_thr and h >= h_thr for x, h in edges)
-    has_right = any(x >= right_thr and h >= max_h * 0.35 for x, h in edges)
+    left_ok = (xs <= left_thr) & (hs >= h_thr)
+    right_ok = (xs >= right_thr) & (hs >= max_h * 0.35)
+    has_left = bool(left_ok.any())
+    has_right = bool(right_ok.any())
 
     if not (has_left and has_right):
-        print("[DEBUG] 两边没有线段")
+        logger.debug("两边没有线段")
         return False
 
-    left_x = min(x for x, h in edges if x <= left_thr and h >= h_thr)
-    right_x = max(x for x, h in edges if x >= right_thr and h >= max_h * 0.35)
+    left_x = float(xs[left_ok].min())
+    right_x = float(xs[right_ok].max())
     exp_len = div(right_x - left_x)
 
     top_min, top_max = div(H * cfg.top[0]), div(H * cfg.top[1])
     bot_min, bot_max = div(H * cfg.bottom[0]), div(H * cfg.bottom[1])
 
-    has_top = any((top_min - tol_y) <= y <= (top_max + tol_y) for y in h_lines)
-    has_bot = any((bot_min - tol_y) <= y <= (bot_max + tol_y) for y in h_lines)
+    h_arr = np.asarray(h_lines, dtype=float)
+    has_top = bool((((top_min - tol_y) <= h_arr) & (h_arr <= (top_max + tol_y))).any())
+    has_bot = bool((((bot_min - tol_y) <= h_arr) & (h_arr <= (bot_max + tol_y))).any())
 
     # 情况 1：左右 + 顶部
     if has_left and has_right and has_top:
@@ -243,59 +249,60 @@ def has_large_table(page, cfg: BoundConfig = CFG) -> bool:
 
     # 情况 3：只有顶部时的 fallback 检查
     if has_top and not has_bot:
-        max_cluster_y = max(h_lines)
+        max_cluster_y = float(h_arr.max())
         if max_cluster_y > top_max + tol_y:
-            for y_pt, length, color in _iter_h_edges_with_y(page, cfg):
-                if abs(y_pt - max_cluster_y) <= tol_y and is_dark_and_greyscale_like(color):
-                    if DEBUG:
-                        print(f"[DEBUG] 回退：聚类底部黑线于 y={y_pt}")
-                    return True
+            ys, _, idx = _h_edge_arrays(g, cfg)
+            hit = (np.abs(ys - max_cluster_y) <= tol_y) & g.edge_dark[idx]
+            if hit.any():
+                logger.debug("回退：聚类底部黑线于 y=%s", ys[hit][0])
+                return True
 
-        max_top = max(y for y in h_lines if y <= top_max + tol_y)
+        max_top = float(h_arr[h_arr <= top_max + tol_y].max())
         y_band = (max_top, bot_max)
-        if _has_dark_longline(page, exp_len, cfg, y_band):
+        if _has_dark_longline(page, exp_len, cfg, y_band, geometry=g):
             return True
 
     # 情况 4：只有底部时，检查左右边是否顶部对齐
     if has_bot and not has_top:
-        print("[DEBUG] 仅出现底部：检查左右对齐")
+        logger.debug("仅出现底部：检查左右对齐")
 
-        if _vertical_top_aligned(page, left_x, right_x, cfg):
+        if _vertical_top_aligned(page, left_x, right_x, cfg, geometry=g):
             return True
 
-    print("[DEBUG] 最后返回False")
+    logger.debug("最后返回False")
     return False
 
 
-def get_large_table_vlines(page, cfg: BoundConfig = CFG) -> List[float]:
+def get_large_table_vlines(page, cfg: BoundConfig = CFG, geometry: Optional[PageGeometry] = None) -> List[float]:
     """获取大表格的竖线（x 坐标）"""
 
     # 1. 获取所有竖线边缘
-    edges = _collect_vertical_edges(page, cfg)
-    if not edges:
+    xs, hs = _vertical_edge_arrays(ensure_geometry(page, geometry), cfg)
+    if not len(xs):
         return []
 
     # 2. 过滤出接近最高的线条
-    max_h = max(h for _, h in edges)
+    max_h = float(hs.max())
     h_thr = div(max_h * (1 - cfg.tol_ratio))
-    tall = [(x, h) for x, h in edges if h >= h_thr]
+    tall = xs[hs >= h_thr]
     if len(tall) < 2:
         return []
 
     tol_x = div(page.width * cfg.tol_ratio)
-    left_x = min(x for x, _ in tall)
-    right_x = max(x for x, _ in tall)
+    left_x = tall.min()
+    right_x = tall.max()
 
     # 3. 只保留主要左右边界之间的线
-    xs = [x for x, _ in tall if (left_x - tol_x) <= x <= (right_x + tol_x)]
+    xs = tall[((left_x - tol_x) <= tall) & (tall <= (right_x + tol_x))]
 
     # 4. 聚类合并相近线条并排序
-    return sorted(cluster(xs, tol_x))
+    return sorted(cluster(xs.tolist(), tol_x))
 
 
 def get_horizon_edges(
     page,
     cfg: BoundConfig = CFG,
+    geometry: Optional[PageGeometry] = None,
 ) -> List[Tuple[float, float, Any]]:
     """
     收集页面中所有“非白色”水平线。
@@ -307,31 +314,34 @@ def get_horizon_edges(
         • length : 线段长度（经过 div 归一化，与源码保持一致）
         • color  : 原始颜色对象，便于后续调试或进一步分类
     """
-    # 利用现有生成器抽取所有水平线
-    h_edges = [
-        (y_pt, length, color)
-        for y_pt, length, color in _iter_h_edges_with_y(page, cfg)
-        if not _is_white(color)
-    ]
+    g = ensure_geometry(page, geometry)
+    ys, lengths, idx = _h_edge_arrays(g, cfg)
+    keep = ~g.edge_white[idx]
 
     # 按 y 坐标从小到大排序，方便查看
-    h_edges.sort(key=lambda t: t[0])
-    return h_edges
+    order = np.argsort(ys[keep], kind="stable")
+    ys, lengths, idx = ys[keep][order], lengths[keep][order], idx[keep][order]
+    return [
+        (y_pt, length, g.edge_colors[ix])
+        for y_pt, length, ix in zip(ys.tolist(), lengths.tolist(), idx.tolist())
+    ]
 
 
-def get_large_table_hlines(page, cfg: BoundConfig = CFG, do_fallback=False) -> List[float]:
+def get_large_table_hlines(
+    page, cfg: BoundConfig = CFG, do_fallback=False,
+    geometry: Optional[PageGeometry] = None,
+) -> List[float]:
     min_line_ratio = 0.875 if (not do_fallback) else 0.75
-    result = set()
+    g = ensure_geometry(page, geometry)
 
-    raw_v, raw_h = _extract_raw_lines(page, cfg)
+    raw_v, raw_h = _extract_raw_lines(page, cfg, geometry=g)
     v_lines = cluster(raw_v)
     min_x, max_x = min(v_lines), max(v_lines)
     # draw_lines_on_page_plus(page,v_lines=[min_x, max_x],h_lines=[])
     min_table_width = div(max_x - min_x) * min_line_ratio
 
-    for y, length, color in _iter_h_edges_with_y(page, cfg):
-        if (length > min_table_width) and (not _is_white(color)):
-            result.add(y)
+    ys, lengths, idx = _h_edge_arrays(g, cfg)
+    result = set(ys[(lengths > min_table_width) & ~g.edge_white[idx]].tolist())
 
     r = sorted(cluster(result))
     return r
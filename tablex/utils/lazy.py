@@ -0,0 +1,30 @@
+"""
+Lazy package attributes (PEP 562).
+
+A package lists which submodule provides each public name and gets a
+module-level ``__getattr__`` / ``__dir__`` pair; the submodule is imported
+on first access and the value cached in the package namespace::
+
+    __getattr__, __dir__ = attach(__name__, {"extract_document": ".document"})
+"""
+
+import importlib
+import sys
+from typing import Callable, List, Mapping, Tuple
+
+
+def attach(module_name: str, mapping: Mapping[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """``(__getattr__, __dir__)`` for *module_name*; *mapping*: name → (relative) submodule."""
+
+    def __getattr__(name: str):
+        module = mapping.get(name)
+        if module is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, module_name), name)
+        setattr(sys.modules[module_name], name, value)  # later lookups skip __getattr__
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(mapping))
+
+    return __getattr__, __dir__
@@ -0,0 +1,80 @@
+"""
+Logging layer for tablex.
+
+Every module logs through ``get_logger(__name__)``; the ``tablex`` root
+logger carries a `logging.NullHandler`, so the library is silent unless the
+application configures logging.  Levels can be set per module:
+
+>>> set_level("DEBUG", "lines.explicit")     # tablex.lines.explicit only
+>>> set_level("INFO")                          # whole package
+
+or through the ``TABLEX_LOG`` environment variable, read once at import
+(handy for pool workers)::
+
+    TABLEX_LOG="INFO,lines.explicit=DEBUG,utils.large_table=TRACE"
+
+Bulky payloads (full rect / curve dumps) are logged at `TRACE` and are
+only built after an ``isEnabledFor`` check.
+"""
+
+import logging
+import os
+from typing import Optional, Union
+
+
+ROOT = "tablex"
+TRACE = 5  # below DEBUG: full primitive dumps
+logging.addLevelName(TRACE, "TRACE")
+
+logging.getLogger(ROOT).addHandler(logging.NullHandler())
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for a module (``__name__``) below the ``tablex`` root."""
+    return logging.getLogger(name)
+
+
+def _qualify(module: Optional[str]) -> str:
+    if not module:
+        return ROOT
+    if module == ROOT or module.startswith(ROOT + "."):
+        return module
+    return f"{ROOT}.{module}"
+
+
+def _level(level: Union[int, str]) -> int:
+    if isinstance(level, int):
+        return level
+    name = level.strip().upper()
+    if name == "TRACE":
+        return TRACE
+    value = logging.getLevelName(name)
+    if not isinstance(value, int):
+        raise ValueError(f"unknown log level: {level!r}")
+    return value
+
+
+def set_level(level: Union[int, str], module: Optional[str] = None) -> None:
+    """Set the level of ``tablex`` or of one sub-module (``"lines.explicit"``)."""
+    logging.getLogger(_qualify(module)).setLevel(_level(level))
+
+
+def configure(spec: str) -> None:
+    """Apply a ``"LEVEL,module=LEVEL,..."`` spec (see module docstring)."""
+    for item in filter(None, (s.strip() for s in spec.split(","))):
+        module, sep, level = item.rpartition("=")
+        set_level(level, module if sep else None)
+
+
+def enable_console(level: Union[int, str] = logging.DEBUG, module: Optional[str] = None) -> logging.Handler:
+    """Attach a stderr handler (for scripts / debugging) and return it."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("[%(levelname)s] %(name)s: %(message)s"))
+    logger = logging.getLogger(_qualify(module))
+    logger.addHandler(handler)
+    logger.setLevel(_level(level))
+    return handler
+
+
+if os.environ.get("TABLEX_LOG"):
+    configure(os.environ["TABLEX_LOG"])
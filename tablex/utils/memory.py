@@ -0,0 +1,33 @@
+"""
+Process memory helpers for the streaming pipeline.
+
+`rss_mb` reads the current resident set size from ``/proc/self/statm``
+(Linux), else from `psutil` when it is installed (``pip install
+tablex[memory]``).  Without either it returns ``None`` and RSS ceilings
+are not enforced: the peak RSS from `resource` never goes down, so a
+process that crossed the ceiling once would fail on every later page.
+"""
+
+import os
+from typing import Optional
+
+
+class MemoryLimitExceeded(MemoryError):
+    """RSS stayed above the configured ceiling after releasing caches."""
+
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_mb() -> Optional[float]:
+    """Current resident set size in MiB, or ``None`` when unknown."""
+    try:
+        with open("/proc/self/statm", "rb") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import psutil
+    except ImportError:  # pragma: no cover – depends on the environment
+        return None
+    return psutil.Process().memory_info().rss / (1024 * 1024)
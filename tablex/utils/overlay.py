@@ -0,0 +1,330 @@
+"""
+Vector debug overlays.
+
+`Overlay` collects what the extractor decided on one page – explicit
+lines, the cells of the chosen tables, the tables of rejected presets and
+optionally raw rects – and renders it straight from coordinates as SVG or
+HTML (`Overlay.to_svg` / `Overlay.to_html`), without rasterizing the page.
+
+Raster output is optional: `RasterCache` renders a page once per
+resolution (``page.to_image``) and `render_raster` draws an overlay onto a
+copy.  `OverlayWriter` writes overlays from a background thread, so
+debugging a long document never opens a window or blocks extraction:
+
+>>> with OverlayWriter() as writer:
+...     writer.submit(Overlay.from_search(page, result, stats), "p1.html")
+
+`dump_overlay` is the one-liner used by the ``dump_explicit`` /
+``simple_draw`` / ``power_draw`` switches of `tablex.lines`; files go to
+``$TABLEX_DEBUG_DIR`` (default ``./tablex-debug``).
+"""
+
+import atexit
+import html
+import os
+import pathlib
+import queue
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from tablex.utils.log import get_logger
+
+
+logger = get_logger(__name__)
+
+BBox = Tuple[float, float, float, float]
+
+RASTER_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp"}
+VECTOR_SUFFIXES = {".svg", ".html", ".htm"}
+
+# layer → (stroke, fill, dash)
+STYLE: Dict[str, Tuple[str, str, str]] = {
+    "rects": ("#1f5fbf", "rgba(255,0,0,0.15)", ""),
+    "rejected": ("#999999", "none", "4 3"),
+    "tables": ("#0a8a0a", "none", ""),
+    "cells": ("#0a8a0a", "rgba(10,138,10,0.08)", ""),
+    "explicit_v": ("orangered", "none", ""),
+    "explicit_h": ("skyblue", "none", ""),
+}
+
+
+def _bbox(obj: Any) -> BBox:
+    if isinstance(obj, dict):
+        return float(obj["x0"]), float(obj["top"]), float(obj["x1"]), float(obj["bottom"])
+    x0, top, x1, bottom = getattr(obj, "bbox", obj)
+    return float(x0), float(top), float(x1), float(bottom)
+
+
+@dataclass(slots=True)
+class Overlay:
+    """Everything drawn for one page, in page coordinates (``top`` grows down)."""
+
+    bbox: BBox  # page (or crop) bbox, the drawing area
+    page_number: int = 1
+    title: str = ""
+    explicit_v: List[float] = field(default_factory=list)
+    explicit_h: List[float] = field(default_factory=list)  # top-based, as ``explicit_h_img``
+    tables: List[BBox] = field(default_factory=list)
+    cells: List[BBox] = field(default_factory=list)
+    rejected: Dict[str, List[BBox]] = field(default_factory=dict)  # preset → table bboxes
+    rects: List[BBox] = field(default_factory=list)
+
+    @classmethod
+    def from_page(
+        cls,
+        page,
+        explicit_v: Sequence[float] = (),
+        explicit_h: Sequence[float] = (),
+        tables: Sequence[Any] = (),
+        *,
+        rejected: Optional[Dict[str, Sequence[Any]]] = None,
+        rects: Sequence[Any] = (),
+        title: str = "",
+    ) -> "Overlay":
+        """Overlay of *page*; *tables* are pdfplumber ``Table`` objects."""
+        return cls(
+            bbox=_bbox(page.bbox),
+            page_number=getattr(page, "page_number", 1),
+            title=title,
+            explicit_v=[float(x) for x in explicit_v],
+            explicit_h=[float(y) for y in explicit_h],
+            tables=[_bbox(t) for t in tables],
+            cells=[_bbox(c) for t in tables for c in t.cells],
+            rejected={name: [_bbox(b) for b in boxes] for name, boxes in (rejected or {}).items()},
+            rects=[_bbox(r) for r in rects],
+        )
+
+    @classmethod
+    def from_search(cls, page, result: Tuple, stats=None, title: str = "") -> "Overlay":
+        """Overlay of a `search_best_table_settings` result.
+
+        Pass the `SearchStats` the search filled with ``candidates=[]`` to
+        draw the tables of every other preset as “rejected”.
+        """
+        name, _, _, tables, ev, eh = result
+        rejected = {}
+        for preset, score, boxes in getattr(stats, "candidates", None) or ():
+            if preset != name and boxes:
+                label = preset if score is not None else f"{preset} (小表)"
+                rejected[label] = boxes
+        return cls.from_page(page, ev, eh, tables, rejected=rejected, title=title or (name or "no table"))
+
+    # --------------------------------------------------------------- #
+    # vector output
+    # --------------------------------------------------------------- #
+
+    def _layers(self):
+        x0, top, x1, bottom = self.bbox
+        yield "rects", [("rect", b, "") for b in self.rects]
+        yield "rejected", [("rect", b, name) for name, boxes in self.rejected.items() for b in boxes]
+        yield "cells", [("rect", b, "") for b in self.cells]
+        yield "tables", [("rect", b, "") for b in self.tables]
+        yield "explicit_v", [("line", (x, top, x, bottom), f"x={x:.1f}") for x in self.explicit_v]
+        yield "explicit_h", [("line", (x0, y, x1, y), f"y={y:.1f}") for y in self.explicit_h]
+
+    def to_svg(self, scale: float = 1.0) -> str:
+        """Standalone SVG; the viewBox is the page bbox, one ``<g>`` per layer."""
+        x0, top, x1, bottom = self.bbox
+        w, h = x1 - x0, bottom - top
+        out = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{x0:g} {top:g} {w:g} {h:g}" '
+            f'width="{w * scale:g}" height="{h * scale:g}">',
+            f'<rect x="{x0:g}" y="{top:g}" width="{w:g}" height="{h:g}" fill="white" stroke="#ccc"/>',
+        ]
+        for layer, items in self._layers():
+            if not items:
+                continue
+            stroke, fill, dash = STYLE[layer]
+            dash_attr = f' stroke-dasharray="{dash}"' if dash else ""
+            out.append(f'<g class="layer-{layer}" stroke="{stroke}" fill="{fill}" stroke-width="0.8"{dash_attr}>')
+            for shape, (a, b, c, d), label in items:
+                tip = f"<title>{html.escape(label)}</title>" if label else ""
+                if shape == "rect":
+                    out.append(f'<rect x="{a:.2f}" y="{b:.2f}" width="{c - a:.2f}" height="{d - b:.2f}">{tip}</rect>')
+                else:
+                    out.append(f'<line x1="{a:.2f}" y1="{b:.2f}" x2="{c:.2f}" y2="{d:.2f}">{tip}</line>')
+            out.append("</g>")
+        out.append("</svg>")
+        return "\n".join(out)
+
+    def to_html(self, scale: float = 1.5) -> str:
+        """SVG plus a legend whose checkboxes toggle the layers."""
+        counts = {layer: len(items) for layer, items in self._layers()}
+        title = html.escape(f"page {self.page_number}" + (f" – {self.title}" if self.title else ""))
+        legend = "".join(
+            f'<label style="color:{STYLE[layer][0]}"><input type="checkbox" checked '
+            f'onchange="toggle(\'{layer}\', this.checked)"> {layer} ({n})</label> '
+            for layer, n in counts.items() if n
+        )
+        return (
+            f"<!doctype html>\n<html><head><meta charset=\"utf-8\"><title>{title}</title>"
+            "<style>body{font:13px sans-serif} label{margin-right:1em}</style>"
+            "<script>function toggle(l,on){for(const g of document.querySelectorAll('.layer-'+l))"
+            "g.style.display=on?'':'none';}</script></head>\n"
+            f"<body><h3>{title}</h3><div>{legend}</div>\n{self.to_svg(scale)}\n</body></html>\n"
+        )
+
+
+# ------------------------------------------------------------------- #
+# Raster output (optional)
+# ------------------------------------------------------------------- #
+
+class RasterCache:
+    """Page rasters rendered once per ``(page, resolution)``; LRU of *maxsize*."""
+
+    def __init__(self, resolution: float = 72, maxsize: int = 4) -> None:
+        self.resolution = resolution
+        self.maxsize = maxsize
+        self._images: "OrderedDict[Any, Any]" = OrderedDict()
+        self.renders = 0
+
+    def get(self, page, resolution: Optional[float] = None):
+        """PIL image of *page* (do not draw on it: `render_raster` copies)."""
+        resolution = resolution or self.resolution
+        key = (id(getattr(page, "pdf", None)), page.page_number, _bbox(page.bbox), resolution)
+        img = self._images.get(key)
+        if img is None:
+            img = page.to_image(resolution=resolution).original
+            self.renders += 1
+            self._images[key] = img
+            if len(self._images) > self.maxsize:
+                self._images.popitem(last=False)
+        else:
+            self._images.move_to_end(key)
+        return img
+
+
+def render_raster(overlay: Overlay, base, resolution: float = 72):
+    """Copy of the raster *base* with *overlay* drawn on it."""
+    from PIL import ImageDraw
+
+    img = base.copy().convert("RGB")
+    draw = ImageDraw.Draw(img)
+    k = resolution / 72
+    x0, top = overlay.bbox[:2]
+
+    def px(a, b):
+        return (a - x0) * k, (b - top) * k
+
+    for layer, items in overlay._layers():
+        stroke = STYLE[layer][0]
+        for shape, (a, b, c, d), _ in items:
+            if shape == "rect":
+                draw.rectangle([px(a, b), px(c, d)], outline=stroke, width=1)
+            else:
+                draw.line([px(a, b), px(c, d)], fill=stroke, width=2)
+    return img
+
+
+# ------------------------------------------------------------------- #
+# Background writer
+# ------------------------------------------------------------------- #
+
+def write_overlay(overlay: Overlay, path, base=None, resolution: float = 72) -> pathlib.Path:
+    """Write *overlay* by suffix: ``.svg`` / ``.html`` or a raster over *base*."""
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    suffix = path.suffix.lower()
+    if suffix == ".svg":
+        path.write_text(overlay.to_svg(), encoding="utf-8")
+    elif suffix in (".html", ".htm"):
+        path.write_text(overlay.to_html(), encoding="utf-8")
+    elif suffix in RASTER_SUFFIXES:
+        if base is None:
+            raise ValueError(f"{path}: raster output needs a base image")
+        render_raster(overlay, base, resolution).save(path)
+    else:
+        raise ValueError(f"unknown overlay format: {path.suffix!r}")
+    return path
+
+
+class OverlayWriter:
+    """Writes overlays on a daemon thread; `submit` only queues the work.
+
+    Raster targets take their base image from *raster_cache* in the calling
+    thread (pdfplumber pages are not shared across threads), so each page
+    is rasterized at most once per resolution.  Failures are logged and
+    kept in `errors`.
+    """
+
+    def __init__(self, raster_cache: Optional[RasterCache] = None, max_queue: int = 64) -> None:
+        self.raster_cache = raster_cache or RasterCache()
+        self.errors: List[Tuple[str, str]] = []
+        self.written = 0
+        self._queue: "queue.Queue" = queue.Queue(max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                overlay, path, base, resolution = job
+                try:
+                    write_overlay(overlay, path, base, resolution)
+                    self.written += 1
+                except Exception as exc:
+                    logger.warning("overlay %s: %s", path, exc)
+                    self.errors.append((str(path), f"{type(exc).__name__}: {exc}"))
+            finally:
+                self._queue.task_done()
+
+    def submit(self, overlay: Overlay, path, *, page=None, resolution: Optional[float] = None) -> None:
+        """Queue *overlay* for *path*; raster suffixes need the *page*."""
+        base = None
+        resolution = resolution or self.raster_cache.resolution
+        if pathlib.Path(path).suffix.lower() in RASTER_SUFFIXES:
+            if page is None:
+                raise ValueError(f"{path}: raster output needs the page")
+            base = self.raster_cache.get(page, resolution)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tablex-overlay", daemon=True)
+                self._thread.start()
+        self._queue.put((overlay, path, base, resolution))
+
+    def flush(self) -> None:
+        """Block until every queued overlay is written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def __enter__(self) -> "OverlayWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_default_writer: Optional[OverlayWriter] = None
+
+
+def default_writer() -> OverlayWriter:
+    """Process-wide writer used by `dump_overlay`, closed at exit."""
+    global _default_writer
+    if _default_writer is None:
+        _default_writer = OverlayWriter()
+        atexit.register(_default_writer.close)
+    return _default_writer
+
+
+def debug_dir() -> pathlib.Path:
+    """``$TABLEX_DEBUG_DIR`` or ``./tablex-debug``."""
+    return pathlib.Path(os.environ.get("TABLEX_DEBUG_DIR") or "tablex-debug")
+
+
+def dump_overlay(page, overlay: Overlay, name: str, fmt: str = "svg") -> pathlib.Path:
+    """Queue *overlay* as ``<debug_dir>/p<page>-<name>.<fmt>`` on the default writer."""
+    path = debug_dir() / f"p{overlay.page_number}-{name}.{fmt}"
+    default_writer().submit(overlay, path, page=page)
+    return path
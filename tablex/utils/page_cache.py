@@ -0,0 +1,480 @@
+"""
+On-disk primitive cache.
+
+Parsing a PDF page with pdfminer dominates re-runs on the same files.
+`PrimitiveCache` stores the primitives tablex reads (lines, rects, curves,
+chars and the page box) once per page as an uncompressed ``.npz`` archive,
+keyed by the SHA-256 of the file content, the ``pdfplumber.open`` options
+that shape the primitives (``laparams``, ``unicode_norm``, ...) and the
+page number::
+
+    <root>/<key[:2]>/<key>/p00001.npz
+
+Colors and font names are interned in small palettes; coordinates are
+``float64`` columns, so a round trip is exact.  `CachedPage` is a
+`PrimitivePage` over such an archive: it keeps the archive open and reads
+each array on first use, rebuilds the primitive dicts lazily on first
+access and exposes a ready `PageGeometry` through
+``page_geometry`` without going through dicts at all, so
+`tablex.lines.explicit`, `tablex.utils.large_table` and
+`tablex.scoring.search` run on it as on a live pdfplumber page.
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pdfplumber
+
+from tablex.utils.color import ColorArray
+from tablex.utils.geometry import (
+    KIND_CURVE,
+    KIND_LINE,
+    KIND_RECT,
+    ORIENT_H,
+    ORIENT_OTHER,
+    ORIENT_V,
+    ORIENTATION_TOL,
+    PageGeometry,
+)
+from tablex.utils.log import get_logger
+from tablex.utils.pages import PrimitivePage
+
+
+logger = get_logger(__name__)
+
+SCHEMA_VERSION = 1
+
+_BOX = ("x0", "x1", "top", "bottom", "y0", "y1", "doctop")
+_SHAPES = (("line", KIND_LINE), ("rect", KIND_RECT), ("curve", KIND_CURVE))
+
+
+# ------------------------------------------------------------------- #
+# 1.   Encoding helpers
+# ------------------------------------------------------------------- #
+
+class _Palette:
+    """Interns arbitrary JSON-able values (colors, font names) as int ids."""
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+
+    def __call__(self, value: Any) -> int:
+        key = json.dumps(value if not isinstance(value, tuple) else list(value), default=str)
+        return self.ids.setdefault(key, len(self.ids))
+
+    def to_array(self) -> np.ndarray:
+        return np.array(list(self.ids), dtype=str)
+
+
+def _decode(entry: str) -> Any:
+    value = json.loads(entry)
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _encode_shapes(prefix: str, objs: List[Dict[str, Any]], palette: _Palette, out: Dict[str, np.ndarray]) -> None:
+    n = len(objs)
+    out[prefix + "_box"] = np.asarray([[o[f] for f in _BOX] for o in objs], dtype=float).reshape(n, len(_BOX))
+    out[prefix + "_lw"] = np.asarray([o.get("linewidth", 0.0) or 0.0 for o in objs], dtype=float)
+    out[prefix + "_flags"] = np.asarray(
+        [(bool(o.get("stroke")), bool(o.get("fill"))) for o in objs], dtype=bool,
+    ).reshape(n, 2)
+    out[prefix + "_color"] = np.asarray(
+        [(palette(o.get("stroking_color")), palette(o.get("non_stroking_color"))) for o in objs], dtype=np.int32,
+    ).reshape(n, 2)
+    pts = [o.get("pts") or [] for o in objs]
+    out[prefix + "_pts"] = np.asarray([p for ps in pts for p in ps], dtype=float).reshape(-1, 2)
+    out[prefix + "_pts_off"] = np.cumsum([0] + [len(ps) for ps in pts]).astype(np.int64)
+
+
+def _encode_chars(chars: List[Dict[str, Any]], palette: _Palette, fonts: _Palette, out: Dict[str, np.ndarray]) -> None:
+    n = len(chars)
+    out["char_box"] = np.asarray([[c[f] for f in _BOX] for c in chars], dtype=float).reshape(n, len(_BOX))
+    out["char_text"] = np.array([c["text"] for c in chars], dtype=str)
+    out["char_size"] = np.asarray([c.get("size", 0.0) for c in chars], dtype=float)
+    out["char_adv"] = np.asarray([c.get("adv", 0.0) or 0.0 for c in chars], dtype=float)
+    out["char_upright"] = np.asarray([bool(c.get("upright", True)) for c in chars], dtype=bool)
+    out["char_matrix"] = np.asarray(
+        [c.get("matrix") or (0.0,) * 6 for c in chars], dtype=float,
+    ).reshape(n, 6)
+    out["char_font"] = np.asarray([fonts(c.get("fontname")) for c in chars], dtype=np.int32)
+    out["char_color"] = np.asarray(
+        [(palette(c.get("stroking_color")), palette(c.get("non_stroking_color"))) for c in chars], dtype=np.int32,
+    ).reshape(n, 2)
+
+
+def dump_page(page, path) -> pathlib.Path:
+    """Write the primitives of *page* to the ``.npz`` archive *path*."""
+    palette, fonts = _Palette(), _Palette()
+    arrays: Dict[str, np.ndarray] = {
+        "meta": np.asarray([SCHEMA_VERSION, page.page_number, page.width, page.height], dtype=float),
+        "bbox": np.asarray(page.bbox, dtype=float),
+    }
+    for prefix, _ in _SHAPES:
+        _encode_shapes(prefix, list(getattr(page, prefix + "s", [])), palette, arrays)
+    _encode_chars(list(page.chars), palette, fonts, arrays)
+    arrays["palette"] = palette.to_array()
+    arrays["fonts"] = fonts.to_array()
+
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as fh:
+        np.savez(fh, **arrays)
+    os.replace(tmp, path)  # atomic: concurrent workers never see half a file
+    return path
+
+
+class _NpzArrays(Mapping):
+    """Members of a ``.npz`` archive, each read on first access.
+
+    The archive stays open between reads; after `close` it is reopened
+    when a member that was never read is asked for.
+    """
+
+    def __init__(self, path) -> None:
+        self.path = path
+        self._npz = np.load(path, allow_pickle=False)
+        self._files = tuple(self._npz.files)
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self._arrays:
+            if self._npz is None:
+                self._npz = np.load(self.path, allow_pickle=False)
+            self._arrays[key] = self._npz[key]  # NpzFile re-reads the member on every lookup
+        return self._arrays[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def close(self) -> None:
+        if self._npz is not None:
+            self._npz.close()
+            self._npz = None
+
+
+def load_page(path) -> "CachedPage":
+    """Open a cached page written by `dump_page`; arrays are read lazily."""
+    arrays = _NpzArrays(path)
+    try:
+        version = int(arrays["meta"][0])
+        if version != SCHEMA_VERSION:
+            raise ValueError(f"{path}: cache schema {version}, expected {SCHEMA_VERSION}")
+        return CachedPage(arrays)
+    except BaseException:
+        arrays.close()
+        raise
+
+
+# ------------------------------------------------------------------- #
+# 2.   Cached page
+# ------------------------------------------------------------------- #
+
+class CachedPage(PrimitivePage):
+    """`PrimitivePage` backed by the arrays of one cache archive."""
+
+    def __init__(self, arrays: Mapping[str, np.ndarray]) -> None:
+        _, page_number, width, height = arrays["meta"].tolist()
+        self.width = float(width)
+        self.height = float(height)
+        self.page_number = int(page_number)
+        self.bbox = tuple(arrays["bbox"].tolist())
+        self.arrays = arrays
+        self._palette = [_decode(s) for s in arrays["palette"].tolist()]
+        self._fonts = [_decode(s) for s in arrays["fonts"].tolist()]
+        self._objs_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._geometry: Optional[PageGeometry] = None
+
+    # ––––– primitive dicts (built on first access) –––––
+    @property
+    def objects(self) -> Dict[str, List[Dict[str, Any]]]:
+        if self._objs_cache is None:
+            objs = {prefix: self._shape_dicts(prefix) for prefix, _ in _SHAPES}
+            objs["char"] = self._char_dicts()
+            self._objs_cache = objs
+        return self._objs_cache
+
+    def _base_dicts(self, prefix: str) -> List[Dict[str, Any]]:
+        box = self.arrays[prefix + "_box"]
+        out = []
+        for row in box.tolist():
+            d = dict(zip(_BOX, row))
+            d["width"] = d["x1"] - d["x0"]
+            d["height"] = d["bottom"] - d["top"]
+            d["page_number"] = self.page_number
+            out.append(d)
+        return out
+
+    def _shape_dicts(self, prefix: str) -> List[Dict[str, Any]]:
+        a = self.arrays
+        pts, off = a[prefix + "_pts"].tolist(), a[prefix + "_pts_off"].tolist()
+        objs = self._base_dicts(prefix)
+        for i, (d, lw, flags, color) in enumerate(zip(
+            objs, a[prefix + "_lw"].tolist(), a[prefix + "_flags"].tolist(), a[prefix + "_color"].tolist(),
+        )):
+            d.update(
+                object_type=prefix,
+                linewidth=lw,
+                stroke=flags[0],
+                fill=flags[1],
+                stroking_color=self._palette[color[0]],
+                non_stroking_color=self._palette[color[1]],
+                pts=[tuple(p) for p in pts[off[i]:off[i + 1]]],
+            )
+        return objs
+
+    def _char_dicts(self) -> List[Dict[str, Any]]:
+        a = self.arrays
+        objs = self._base_dicts("char")
+        for d, text, size, adv, upright, matrix, font, color in zip(
+            objs,
+            a["char_text"].tolist(),
+            a["char_size"].tolist(),
+            a["char_adv"].tolist(),
+            a["char_upright"].tolist(),
+            a["char_matrix"].tolist(),
+            a["char_font"].tolist(),
+            a["char_color"].tolist(),
+        ):
+            d.update(
+                object_type="char",
+                text=text,
+                size=size,
+                adv=adv,
+                upright=upright,
+                matrix=tuple(matrix),
+                fontname=self._fonts[font],
+                stroking_color=self._palette[color[0]],
+                non_stroking_color=self._palette[color[1]],
+            )
+        return objs
+
+    # ––––– geometry straight from the arrays –––––
+    @property
+    def page_geometry(self) -> PageGeometry:
+        """`PageGeometry` equal to ``PageGeometry.from_page(self)``, built without dicts."""
+        if self._geometry is None:
+            self._geometry = self._build_geometry()
+        return self._geometry
+
+    def _build_geometry(self) -> PageGeometry:
+        a = self.arrays
+        palette = self._palette
+        ns_truthy = np.fromiter((bool(c) for c in palette), bool, len(palette))
+        kinds, boxes, edge_ix, fill_ix = [], [], [], []
+        for prefix, kind in _SHAPES:
+            box = a[prefix + "_box"]
+            color = a[prefix + "_color"]
+            kinds.append(np.full(len(box), kind, dtype=np.int8))
+            boxes.append(box)
+            if kind == KIND_CURVE:
+                edge_ix.append(color[:, 0])
+            else:
+                # `_edge_color`: non_stroking_color or stroking_color
+                edge_ix.append(np.where(ns_truthy[color[:, 1]], color[:, 1], color[:, 0]))
+            fill_ix.append(color[:, 1])
+
+        box = np.concatenate(boxes)
+        x0, x1, top, bottom, y0, y1 = (box[:, _BOX.index(f)] for f in ("x0", "x1", "top", "bottom", "y0", "y1"))
+        dx, dy = x1 - x0, y1 - y0
+        orientation = np.full(len(box), ORIENT_OTHER, dtype=np.int8)
+        orientation[np.abs(dy) <= ORIENTATION_TOL] = ORIENT_H
+        orientation[(np.abs(dx) <= ORIENTATION_TOL) & (orientation == ORIENT_OTHER)] = ORIENT_V
+
+        edge_ix_arr = np.concatenate(edge_ix).astype(np.intp)
+        fill_ix_arr = np.concatenate(fill_ix).astype(np.intp)
+        colors = ColorArray.from_colors(palette)
+        dark = colors.dark_greyscale()
+        white = colors.white()
+        edge_colors = tuple(palette[i] for i in edge_ix_arr.tolist())
+        return PageGeometry(
+            width=self.width,
+            height=self.height,
+            kind=np.concatenate(kinds),
+            x0=x0, x1=x1, y0=y0, y1=y1, top=top, bottom=bottom,
+            length=np.hypot(dx, dy),
+            orientation=orientation,
+            edge_dark=dark[edge_ix_arr],
+            edge_white=white[edge_ix_arr],
+            fill_dark=dark[fill_ix_arr],
+            edge_colors=edge_colors,
+        )
+
+    def close(self) -> None:
+        """Release the parsed dicts and close the archive."""
+        super().close()
+        if isinstance(self.arrays, _NpzArrays):
+            self.arrays.close()
+
+    def __repr__(self) -> str:
+        return f"<CachedPage:{self.page_number} {self.width:g}x{self.height:g}>"
+
+
+# ------------------------------------------------------------------- #
+# 3.   Cache directory
+# ------------------------------------------------------------------- #
+
+def file_digest(path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of the file content."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(chunk_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def default_cache_dir() -> pathlib.Path:
+    """``$TABLEX_CACHE_DIR`` or ``~/.cache/tablex/primitives``."""
+    env = os.environ.get("TABLEX_CACHE_DIR")
+    if env:
+        return pathlib.Path(env)
+    return pathlib.Path(os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache")) / "tablex" / "primitives"
+
+
+class PrimitiveCache:
+    """Per-page primitive archives under *root*, keyed by file digest + open options + page number."""
+
+    def __init__(self, root=None) -> None:
+        self.root = pathlib.Path(root) if root is not None else default_cache_dir()
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def digest(self, path) -> str:
+        """Content digest of *path*, memoised on (path, size, mtime)."""
+        st = os.stat(path)
+        key = (os.fspath(path), st.st_size, st.st_mtime_ns)
+        if key not in self._digests:
+            self._digests[key] = file_digest(path)
+        return self._digests[key]
+
+    def key(self, path, open_kwargs: Optional[Mapping[str, Any]] = None) -> str:
+        """Document key: content digest, plus a digest of *open_kwargs* when any are set.
+
+        ``pdfplumber.open`` options such as ``laparams`` or ``unicode_norm``
+        change the primitives, so pages parsed with other options are
+        stored apart.
+        """
+        digest = self.digest(path)
+        if not open_kwargs:
+            return digest
+        options = json.dumps(dict(open_kwargs), sort_keys=True, default=repr)
+        return f"{digest}-{hashlib.sha256(options.encode()).hexdigest()[:16]}"
+
+    def doc_dir(self, digest: str) -> pathlib.Path:
+        return self.root / digest[:2] / digest
+
+    def page_path(self, digest: str, page_number: int) -> pathlib.Path:
+        return self.doc_dir(digest) / f"p{page_number:05d}.npz"
+
+    def page_count(self, digest: str) -> Optional[int]:
+        """Page count recorded for the document, if any."""
+        try:
+            return int(json.loads((self.doc_dir(digest) / "manifest.json").read_text())["pages"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store_page_count(self, digest: str, n_pages: int) -> None:
+        path = self.doc_dir(digest) / "manifest.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"pages": n_pages, "schema": SCHEMA_VERSION}))
+        os.replace(tmp, path)
+
+    def load(self, digest: str, page_number: int) -> Optional[CachedPage]:
+        """Cached page or ``None`` (missing / unreadable / old schema)."""
+        path = self.page_path(digest, page_number)
+        if not path.exists():
+            return None
+        try:
+            return load_page(path)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("ignoring broken cache entry %s: %s", path, exc)
+            return None
+
+    def store(self, page, digest: str) -> pathlib.Path:
+        return dump_page(page, self.page_path(digest, page.page_number))
+
+    def pages(self, path, indices: Optional[Iterable[int]] = None, **open_kwargs: Any) -> Iterator[CachedPage]:
+        """Cached pages of *path* (0-based *indices*); parses only the misses.
+
+        The PDF is opened only when at least one page is missing, and each
+        parsed page is closed right after it is stored.
+        """
+        source = PageSource(path, cache=self, open_kwargs=open_kwargs)
+        try:
+            ixs = range(len(source)) if indices is None else indices
+            for ix in ixs:
+                yield source[ix]
+        finally:
+            source.close()
+
+
+class PageSource:
+    """Index-able page provider: cache first, pdfplumber on a miss.
+
+    ``source[ix]`` returns a `CachedPage` when *cache* is set (storing the
+    page on a miss), or the live pdfplumber page otherwise.  It also
+    exposes ``pages`` (itself) so it can stand in for an open ``PDF``.
+    """
+
+    def __init__(self, path, cache: Optional[PrimitiveCache] = None, open_kwargs: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.cache = cache
+        self.open_kwargs = dict(open_kwargs or {})
+        self._pdf = None
+        self._digest = cache.key(path, self.open_kwargs) if cache is not None else None
+
+    @property
+    def pdf(self):
+        if self._pdf is None:
+            self._pdf = pdfplumber.open(self.path, **self.open_kwargs)
+            if self.cache is not None:
+                self.cache.store_page_count(self._digest, len(self._pdf.pages))
+        return self._pdf
+
+    @property
+    def pages(self) -> "PageSource":
+        return self
+
+    def __len__(self) -> int:
+        if self.cache is not None and self._pdf is None:
+            n = self.cache.page_count(self._digest)
+            if n is not None:
+                return n
+        return len(self.pdf.pages)
+
+    def __getitem__(self, ix: int):
+        if self.cache is None:
+            return self.pdf.pages[ix]
+        cached = self.cache.load(self._digest, ix + 1)
+        if cached is not None:
+            self.cache.hits += 1
+            return cached
+        self.cache.misses += 1
+        page = self.pdf.pages[ix]
+        path = self.cache.store(page, self._digest)
+        page.close()
+        return load_page(path)
+
+    def close(self) -> None:
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+    def flush_cache(self) -> None:
+        """Drop the parsed document (reopened lazily on the next miss)."""
+        self.close()
+
+    def __enter__(self) -> "PageSource":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,133 @@
+"""
+Duck-typed pages built from primitive dicts.
+
+`PrimitivePage` behaves like a ``pdfplumber.page.Page`` for everything
+tablex touches (``lines`` / ``rects`` / ``curves`` / ``chars``, ``edges``,
+``extract_words``, ``find_tables``) without a PDF behind it.  It is used
+by the benchmark stubs and by pages restored from the primitive cache.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from pdfplumber import utils
+from pdfplumber.container import Container
+from pdfplumber.table import Table, TableFinder
+
+from tablex.utils.table_settings import resolve_table_settings
+
+
+class PrimitivePage(Container):
+    """Page-like container over plain ``line`` / ``rect`` / ``curve`` / ``char`` dicts."""
+
+    def __init__(
+        self,
+        width: float,
+        height: float,
+        *,
+        lines: Iterable[Dict[str, Any]] = (),
+        rects: Iterable[Dict[str, Any]] = (),
+        curves: Iterable[Dict[str, Any]] = (),
+        chars: Iterable[Dict[str, Any]] = (),
+        page_number: int = 1,
+    ) -> None:
+        self.width = float(width)
+        self.height = float(height)
+        self.page_number = page_number
+        self.bbox = (0.0, 0.0, self.width, self.height)
+        self._objs: Dict[str, List[Dict[str, Any]]] = {
+            "line": list(lines),
+            "rect": list(rects),
+            "curve": list(curves),
+            "char": list(chars),
+        }
+
+    @property
+    def objects(self) -> Dict[str, List[Dict[str, Any]]]:
+        return self._objs
+
+    @property
+    def pages(self) -> Optional[List[Any]]:
+        return None
+
+    def __len__(self) -> int:
+        """Number of primitives (lines + rects + curves + chars)."""
+        return sum(len(v) for v in self._objs.values())
+
+    def extract_words(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        return utils.extract_words(self.chars, **kwargs)
+
+    def extract_text(self, **kwargs: Any) -> str:
+        return utils.extract_text(self.chars, **kwargs)
+
+    def find_tables(self, table_settings: Any = None) -> List[Table]:
+        return TableFinder(self, resolve_table_settings(table_settings)).tables
+
+    def crop(self, bbox) -> "PrimitivePage":
+        """Objects clipped to *bbox*, as ``Page.crop``: page coordinates, crop-sized."""
+        x0, top, x1, bottom = (float(v) for v in bbox)
+        page = PrimitivePage(x1 - x0, bottom - top, page_number=self.page_number)
+        page.bbox = (x0, top, x1, bottom)
+        page._objs = {k: utils.crop_to_bbox(v, page.bbox) for k, v in self._objs.items()}
+        return page
+
+    def close(self) -> None:
+        self.flush_cache()
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{k}s={len(v)}" for k, v in self._objs.items())
+        return f"<PrimitivePage:{self.page_number} {self.width:g}x{self.height:g} {counts}>"
+
+
+# ------------------------------------------------------------------- #
+# Primitive dict builders (pdfplumber coordinate conventions)
+# ------------------------------------------------------------------- #
+
+def _box(x0: float, top: float, x1: float, bottom: float, H: float) -> Dict[str, Any]:
+    return {
+        "x0": x0, "x1": x1, "top": top, "bottom": bottom, "doctop": top,
+        "y0": H - bottom, "y1": H - top, "width": x1 - x0, "height": bottom - top,
+    }
+
+
+def make_line(x0, top, x1, bottom, H, color=(0, 0, 0), linewidth=1.0) -> Dict[str, Any]:
+    obj = _box(min(x0, x1), min(top, bottom), max(x0, x1), max(top, bottom), H)
+    obj.update(
+        object_type="line", pts=[(x0, top), (x1, bottom)], linewidth=linewidth,
+        stroke=True, fill=False, stroking_color=color, non_stroking_color=color,
+    )
+    return obj
+
+
+def make_rect(x0, top, x1, bottom, H, fill=(0, 0, 0), stroke=None) -> Dict[str, Any]:
+    obj = _box(x0, top, x1, bottom, H)
+    obj.update(
+        object_type="rect", linewidth=0.0, stroke=stroke is not None, fill=fill is not None,
+        stroking_color=stroke, non_stroking_color=fill,
+    )
+    return obj
+
+
+def make_curve(pts, H, color=(0, 0, 0)) -> Dict[str, Any]:
+    xs = [p[0] for p in pts]
+    ys = [p[1] for p in pts]
+    obj = _box(min(xs), min(ys), max(xs), max(ys), H)
+    obj.update(
+        object_type="curve", pts=list(pts), linewidth=1.0, stroke=True, fill=False,
+        stroking_color=color, non_stroking_color=None,
+    )
+    return obj
+
+
+def make_chars(text: str, x0: float, top: float, H: float, size: float = 10.0) -> List[Dict[str, Any]]:
+    """One char dict per character of *text* on a single baseline."""
+    out = []
+    w = size * 0.5
+    for i, ch in enumerate(text):
+        obj = _box(x0 + i * w, top, x0 + (i + 1) * w, top + size, H)
+        obj.update(
+            object_type="char", text=ch, fontname="Helvetica", size=size, upright=True,
+            adv=w, matrix=(size, 0, 0, size, x0 + i * w, H - top - size),
+            stroking_color=None, non_stroking_color=(0,),
+        )
+        out.append(obj)
+    return out
@@ -31,7 +31,13 @@ Design decisions
   external code does *not* change.
 """
 
-from typing import Any, Dict, Iterator, List, Tuple
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
+
+from pdfplumber.table import TableSettings
+
+from tablex.utils.log import get_logger
 
 
 # ---------------------------------------------------------------------------
@@ -226,6 +232,23 @@ def iter_table_settings() -> Iterator[Tuple[str, Dict[str, Any]]]:
         yield name, _apply_variant_overrides(cfg)
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledPreset:
+    """Immutable, override‑resolved preset (compiled once at import)."""
+
+    name: str
+    settings: Mapping[str, Any]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Fresh mutable copy – values are scalars, so a shallow copy suffices."""
+        return dict(self.settings)
+
+
+def iter_compiled_settings() -> Iterator[CompiledPreset]:
+    """Yield the compiled presets in priority order (no per‑page copying)."""
+    yield from COMPILED_TABLE_SETTINGS
+
+
 # ---------------------------------------------------------------------------
 # 3. **OPTIONAL HELPER** – adaptive override flags
 # ---------------------------------------------------------------------------
@@ -258,4 +281,25 @@ def _apply_variant_overrides(variant_cfg: Dict[str, Any]) -> Dict[str, Any]:
 
     return cfg
 
+
+COMPILED_TABLE_SETTINGS: Tuple[CompiledPreset, ...] = tuple(
+    CompiledPreset(name, MappingProxyType(_apply_variant_overrides(cfg)))
+    for name, cfg in TABLE_SETTINGS_VARIANTS
+)
+
+
+def resolve_table_settings(table_settings: Any = None) -> TableSettings:
+    """``TableSettings.resolve`` that tolerates a ``"text_settings"`` key.
+
+    pdfplumber files every ``text_*`` key under ``text_settings``, so a dict
+    carrying ``text_settings`` itself ends up as ``extract_words(settings=…)``
+    and ``WordExtractor`` raises.  The stray entry is dropped here instead of
+    patching ``WordExtractor.__init__`` for the whole process.
+    """
+    settings = TableSettings.resolve(table_settings)
+    removed = settings.text_settings.pop("settings", None)
+    if removed is not None:
+        get_logger(__name__).debug("Removed settings: %r", removed)
+    return settings
+
 # End of file – happy extracting! 🎉
@@ -0,0 +1,42 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import numpy as np
+import pdfplumber
+
+from tablex.testing import make_grid_pdf
+from tablex.utils.char_index import CharIndex
+
+
+def _char(x0, top, text="a", w=5.0, h=10.0):
+    return {"x0": x0, "x1": x0 + w, "top": top, "bottom": top + h, "text": text}
+
+
+def test_count_uses_half_open_midpoint_test():
+    idx = CharIndex.from_chars([_char(0, 0), _char(10, 0), _char(10, 20)])
+    # midpoints: (2.5, 5), (12.5, 5), (12.5, 25)
+    assert idx.count((0, 0, 12.5, 30)) == 1
+    assert idx.count((0, 0, 12.6, 30)) == 3
+    assert idx.count((0, 5, 20, 25)) == 2
+    assert list(idx.count_many([(0, 0, 20, 10), (100, 0, 200, 10)])) == [2, 0]
+    assert len(CharIndex.from_chars([]).count_many([(0, 0, 1, 1)])) == 1
+
+
+def test_text_lengths_strip_outer_blanks():
+    chars = [_char(0, 0, " "), _char(5, 0, "a"), _char(10, 0, " "), _char(15, 0, "b"), _char(20, 0, " ")]
+    idx = CharIndex.from_chars(chars)
+    assert idx.count((0, 0, 30, 10)) == 5
+    assert list(idx.text_lengths([(0, 0, 30, 10), (0, 0, 5, 10)])) == [3, 0]
+
+
+def test_counts_match_table_extract(tmp_path):
+    path = make_grid_pdf(tmp_path / "g.pdf", n_pages=1, rows=4, cols=3)
+    with pdfplumber.open(path) as pdf:
+        page = pdf.pages[0]
+        (table,) = page.find_tables()
+        idx = CharIndex.from_page(page)
+        cells = [c for r in table.rows for c in r.cells]
+        text = [c for r in table.extract() for c in r]
+        assert np.array_equal(idx.text_lengths(cells), [len(t) for t in text])
@@ -0,0 +1,62 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import random
+
+import numpy as np
+import pytest
+
+from tablex.utils.cluster import cluster, cluster_batch, cluster_lists, cluster_segments
+
+
+def _reference_cluster(coords, cluster_tol=8.0):
+    if not coords:
+        return []
+    coords = sorted(coords)
+    clusters, group = [], [coords[0]]
+    for c in coords[1:]:
+        if abs(c - group[-1]) <= cluster_tol:
+            group.append(c)
+        else:
+            clusters.append(sum(group) / len(group))
+            group = [c]
+    clusters.append(sum(group) / len(group))
+    return clusters
+
+
+def test_cluster_example():
+    assert cluster([10, 11, 12, 50], 5) == [11.0, 50.0]
+    assert cluster([]) == []
+    assert cluster({3.0, 1.0}, 5) == [2.0]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_cluster_matches_reference(seed):
+    rnd = random.Random(seed)
+    coords = [rnd.uniform(0, 800) for _ in range(rnd.randint(0, 200))]
+    tol = rnd.choice([0.5, 3, 8, 20])
+    np.testing.assert_allclose(cluster(coords, tol), _reference_cluster(coords, tol))
+
+
+def test_cluster_batch_matches_per_page():
+    rnd = random.Random(7)
+    pages = {p: [rnd.uniform(0, 600) for _ in range(rnd.randint(1, 60))] for p in range(1, 30)}
+    coords = [c for p in pages for c in pages[p]]
+    ids = [p for p in pages for _ in pages[p]]
+    batched = cluster_batch(coords, ids, 10)
+    assert sorted(batched) == sorted(pages)
+    for p, cs in pages.items():
+        np.testing.assert_allclose(batched[p], _reference_cluster(cs, 10))
+
+
+def test_cluster_segments_per_item_tolerance():
+    centroids, segs = cluster_segments([0, 4, 0, 4], [0, 0, 1, 1], [5, 5, 1, 1])
+    assert centroids.tolist() == [2.0, 0.0, 4.0]
+    assert segs.tolist() == [0, 1, 1]
+
+
+def test_cluster_lists():
+    assert cluster_lists([[1, 2, 50], [], [7]], 5) == [[1.5, 50.0], [], [7.0]]
+    assert cluster_lists([[0, 4], [0, 4]], [5, 1]) == [[2.0], [0.0, 4.0]]
@@ -63,3 +63,39 @@ def test_is_dark_and_greyscale_like_gray(value, expected):
 )
 def test_is_dark_and_greyscale_like_rgb(color, expected):
     assert is_dark_and_greyscale_like(color) is expected
+
+
+def test_color_array_spaces():
+    from tablex.utils.color import SPACE_CMYK, SPACE_GREY, SPACE_NONE, SPACE_OTHER, SPACE_RGB, ColorArray
+
+    colors = [None, 0.1, (0.1,), [0.1, 0.1, 0.1], (0, 0, 0, 1), (0, 0, 0, 0), ("P0",), (0.2, "P1"), (1, 2)]
+    arr = ColorArray.from_colors(colors)
+    assert arr.space.tolist() == [
+        SPACE_NONE, SPACE_GREY, SPACE_GREY, SPACE_RGB, SPACE_CMYK, SPACE_CMYK, SPACE_OTHER, SPACE_OTHER, SPACE_OTHER,
+    ]
+    assert arr.dark_greyscale().tolist() == [False, True, True, True, True, False, False, False, False]
+    assert arr.white().tolist() == [False, False, False, False, False, True, False, False, False]
+
+
+@pytest.mark.parametrize("color", [None, ("P0",), (0.2, "P1")])
+def test_wrappers_reject_unknown_colors(color):
+    from tablex.utils.color import _is_white
+
+    assert not is_near_black(color)
+    assert not is_dark_color(color)
+    assert not is_dark_and_greyscale_like(color)
+    assert not _is_white(color)
+
+
+def test_wrappers_match_arrays():
+    import numpy as np
+
+    from tablex.utils.color import ColorArray, _is_white
+
+    rng = np.random.default_rng(0)
+    colors = [tuple(rng.random(n).round(2)) for n in (1, 3, 4) for _ in range(50)]
+    arr = ColorArray.from_colors(colors)
+    assert arr.near_black().tolist() == [is_near_black(c) for c in colors]
+    assert arr.dark().tolist() == [is_dark_color(c) for c in colors]
+    assert arr.dark_greyscale().tolist() == [is_dark_and_greyscale_like(c) for c in colors]
+    assert arr.white().tolist() == [_is_white(c) for c in colors]
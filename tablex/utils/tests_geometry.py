@@ -0,0 +1,75 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+from types import SimpleNamespace
+
+import numpy as np
+
+from tablex.lines.explicit import (
+    extract_lines_from_page_curves,
+    extract_lines_from_page_lines,
+    extract_lines_from_page_rects,
+)
+from tablex.utils.geometry import KIND_CURVE, KIND_LINE, KIND_RECT, ORIENT_H, ORIENT_V, PageGeometry
+from tablex.utils.large_table import get_horizon_edges, has_large_table
+
+
+def _obj(x0, y0, x1, y1, H=792.0, **colors):
+    return {"x0": x0, "x1": x1, "y0": y0, "y1": y1, "top": H - y1, "bottom": H - y0, **colors}
+
+
+def _page():
+    lines = [
+        _obj(50, 700, 560, 700, stroking_color=(0, 0, 0)),
+        _obj(50, 100, 560, 100, stroking_color=(0, 0, 0)),
+        _obj(50, 100, 50, 700),
+        _obj(560, 100, 560, 700),
+    ]
+    rects = [
+        _obj(50, 400, 560, 401, non_stroking_color=(0.1, 0.1, 0.1)),
+        _obj(300, 400, 301, 600, non_stroking_color=(1, 0, 0)),
+    ]
+    curves = [_obj(100, 200, 100.5, 500, stroking_color=(1, 1, 1))]
+    return SimpleNamespace(width=612.0, height=792.0, page_number=1, lines=lines, rects=rects, curves=curves, chars=[])
+
+
+def test_geometry_columns():
+    g = PageGeometry.from_page(_page())
+    assert len(g) == 7
+    assert g.kind.tolist() == [KIND_LINE] * 4 + [KIND_RECT] * 2 + [KIND_CURVE]
+    assert g.orientation[:4].tolist() == [ORIENT_H, ORIENT_H, ORIENT_V, ORIENT_V]
+    np.testing.assert_allclose(g.length[0], 510.0)
+    assert g.fill_dark[4] and not g.fill_dark[5]
+    assert g.edge_white[6] and not g.edge_dark[6]
+
+
+def test_geometry_overrides():
+    page = _page()
+    g = PageGeometry.from_page(page, rects=[], curves=[])
+    assert len(g) == 4
+    assert not g.rects.any()
+
+
+def test_shared_geometry_matches_standalone():
+    page = _page()
+    g = PageGeometry.from_page(page)
+    assert extract_lines_from_page_lines(page) == extract_lines_from_page_lines(page, geometry=g)
+    assert extract_lines_from_page_rects(page, dump_log=False) == extract_lines_from_page_rects(
+        page, dump_log=False, geometry=g
+    )
+    assert has_large_table(page) == has_large_table(page, geometry=g)
+    assert get_horizon_edges(page) == get_horizon_edges(page, geometry=g)
+    assert extract_lines_from_page_curves(page) == extract_lines_from_page_curves(page, geometry=g)
+
+
+def test_prebuilt_geometry_skips_page_curves():
+    class Page(SimpleNamespace):
+        @property
+        def curves(self):
+            raise AssertionError("page.curves re-read")
+
+    page = _page()
+    g = PageGeometry.from_page(page)
+    assert extract_lines_from_page_curves(Page(height=page.height), geometry=g) == ([100.0, 100.5], [])
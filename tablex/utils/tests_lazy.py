@@ -0,0 +1,35 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import types
+
+import pytest
+
+from tablex.utils.lazy import attach
+
+
+def test_attach_resolves_and_caches(monkeypatch):
+    pkg = types.ModuleType("fakepkg")
+    monkeypatch.setitem(sys.modules, "fakepkg", pkg)
+    pkg.__getattr__, pkg.__dir__ = attach("fakepkg", {"dumps": "json", "nope": "json"})
+    import json
+
+    assert pkg.dumps is json.dumps
+    assert vars(pkg)["dumps"] is json.dumps  # cached, __getattr__ no longer involved
+    assert {"dumps", "nope"} <= set(pkg.__dir__())
+    with pytest.raises(AttributeError):
+        pkg.nope
+    with pytest.raises(AttributeError, match="fakepkg"):
+        pkg.missing
+
+
+def test_packages_share_the_helper():
+    import tablex
+    import tablex.pipeline
+    import tablex.scoring
+
+    for pkg in (tablex, tablex.pipeline, tablex.scoring):
+        assert pkg.__getattr__.__module__ == "tablex.utils.lazy"
+        assert set(pkg.__all__) <= set(dir(pkg))
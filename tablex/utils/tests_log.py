@@ -0,0 +1,61 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import logging
+
+import pdfplumber
+import pytest
+
+from tablex.lines import extract_explicit_lines
+from tablex.lines.explicit import extract_lines_from_page_rects
+from tablex.testing import make_grid_pdf
+from tablex.utils.geometry import PageGeometry
+from tablex.utils.log import TRACE, configure, set_level
+
+
+@pytest.fixture
+def reset_levels():
+    names = ["tablex", "tablex.lines.explicit", "tablex.scoring"]
+    before = {n: logging.getLogger(n).level for n in names}
+    yield
+    for n, lvl in before.items():
+        logging.getLogger(n).setLevel(lvl)
+
+
+def test_silent_by_default(tmp_path, capsys):
+    path = make_grid_pdf(tmp_path / "g.pdf", n_pages=1)
+    with pdfplumber.open(path) as pdf:
+        extract_explicit_lines(pdf.pages[0])
+    out = capsys.readouterr()
+    assert out.out == "" and out.err == ""
+
+
+def test_per_module_levels(reset_levels):
+    configure("WARNING,lines.explicit=TRACE,scoring=info")
+    assert logging.getLogger("tablex").level == logging.WARNING
+    assert logging.getLogger("tablex.lines.explicit").level == TRACE
+    assert logging.getLogger("tablex.scoring").level == logging.INFO
+    with pytest.raises(ValueError):
+        set_level("LOUD")
+
+
+class _Page:
+    width, height = 612.0, 792.0
+    page_number = 1
+
+    @property
+    def rects(self):
+        raise AssertionError("rect dump built while TRACE is disabled")
+
+
+def test_rect_dump_only_at_trace(reset_levels):
+    page = _Page()
+    geometry = PageGeometry.from_page(page, lines=[], rects=[], curves=[])
+    set_level("DEBUG", "lines.explicit")
+    extract_lines_from_page_rects(page, dump_log=True, geometry=geometry)
+
+    set_level(TRACE, "lines.explicit")
+    with pytest.raises(AssertionError):
+        extract_lines_from_page_rects(page, dump_log=True, geometry=geometry)
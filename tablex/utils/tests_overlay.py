@@ -0,0 +1,74 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pdfplumber
+
+from tablex.bench.stubs import make_page
+from tablex.lines.explicit import extract_lines_from_page_rects
+from tablex.testing import make_grid_pdf
+from tablex.scoring import SearchStats, search_best_table_settings
+from tablex.utils import overlay as ov
+from tablex.utils.overlay import Overlay, OverlayWriter, RasterCache
+
+
+def _search(page):
+    stats = SearchStats(candidates=[])
+    return search_best_table_settings(page, debug=False, stats=stats), stats
+
+
+def test_svg_from_search():
+    page = make_page("grid", 400)
+    result, stats = _search(page)
+    overlay = Overlay.from_search(page, result, stats)
+    assert overlay.title == result[0]
+    assert len(overlay.cells) == len(result[3][0].cells)
+    assert result[0] not in overlay.rejected and overlay.rejected
+    svg = overlay.to_svg()
+    assert svg.startswith("<svg") and svg.endswith("</svg>")
+    assert f'viewBox="0 0 {page.width:g} {page.height:g}"' in svg
+    assert svg.count("<line") == len(result[4]) + len(result[5])
+    html = overlay.to_html()
+    assert "layer-rejected" in html and "toggle('cells'" in html
+
+
+def test_search_records_candidates():
+    result, stats = _search(make_page("grid", 400))
+    assert stats.find_tables_calls == len(stats.candidates)
+    assert max(sc for _, sc, _ in stats.candidates if sc is not None) == stats.best_score
+
+
+def test_writer_vector_and_raster(tmp_path):
+    pdf_path = make_grid_pdf(tmp_path / "g.pdf", n_pages=1)
+    cache = RasterCache(resolution=36)
+    with pdfplumber.open(pdf_path) as pdf, OverlayWriter(cache) as writer:
+        page = pdf.pages[0]
+        overlay = Overlay.from_search(page, *_search(page))
+        for name in ("a.svg", "a.html", "a.png", "b.png"):
+            writer.submit(overlay, tmp_path / "out" / name, page=page)
+        writer.flush()
+        assert writer.written == 4 and not writer.errors
+        assert cache.renders == 1  # one raster per page and resolution
+    from PIL import Image
+
+    with Image.open(tmp_path / "out" / "a.png") as img:
+        assert img.size == (306, 396)
+    assert (tmp_path / "out" / "a.svg").read_text(encoding="utf-8").startswith("<svg")
+
+
+def test_writer_reports_errors(tmp_path):
+    with OverlayWriter() as writer:
+        writer.submit(Overlay((0, 0, 10, 10)), tmp_path / "x.txt")
+        writer.flush()
+    assert writer.written == 0 and writer.errors[0][0].endswith("x.txt")
+
+
+def test_simple_draw_writes_one_overlay(tmp_path, monkeypatch):
+    monkeypatch.setenv("TABLEX_DEBUG_DIR", str(tmp_path))
+    page = make_page("dashed", 800)
+    extract_lines_from_page_rects(page, dump_log=False, simple_draw=True)
+    ov.default_writer().flush()
+    files = list(tmp_path.iterdir())
+    assert [f.name for f in files] == ["p1-rects.svg"]
+    assert files[0].read_text(encoding="utf-8").count("<rect") == len(page.rects) + 1
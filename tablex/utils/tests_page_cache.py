@@ -0,0 +1,81 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import numpy as np
+import pdfplumber
+
+from tablex.bench.stubs import make_page
+from tablex.lines import extract_explicit_lines
+from tablex.pipeline import extract_document
+from tablex.testing import make_grid_pdf
+from tablex.scoring import search_best_table_settings
+from tablex.utils.geometry import PageGeometry
+from tablex.utils.large_table import has_large_table
+from tablex.utils.page_cache import PrimitiveCache, dump_page, load_page
+
+
+def _assert_same_geometry(a: PageGeometry, b: PageGeometry) -> None:
+    for name in a.__dataclass_fields__:
+        va, vb = getattr(a, name), getattr(b, name)
+        assert np.array_equal(va, vb) if isinstance(va, np.ndarray) else va == vb, name
+
+
+def test_round_trip_is_exact(tmp_path):
+    page = make_page("noise", 1_500)
+    cached = load_page(dump_page(page, tmp_path / "p.npz"))
+    for kind in ("lines", "rects", "curves", "chars"):
+        orig, back = getattr(page, kind), getattr(cached, kind)
+        assert [{k: b[k] for k in o} for o, b in zip(orig, back)] == orig, kind
+    _assert_same_geometry(PageGeometry.from_page(page), cached.page_geometry)
+    assert PageGeometry.from_page(cached) is cached.page_geometry
+
+
+def test_cached_pages_match_live_pages(tmp_path):
+    path = make_grid_pdf(tmp_path / "g.pdf", n_pages=2, prose_lines=3)
+    cache = PrimitiveCache(tmp_path / "cache")
+    first = list(cache.pages(path))
+    assert (cache.hits, cache.misses) == (0, 2)
+    again = list(cache.pages(path))
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    with pdfplumber.open(path) as pdf:
+        for live, cached in zip(pdf.pages, again):
+            assert extract_explicit_lines(cached) == extract_explicit_lines(live)
+            assert has_large_table(cached) == has_large_table(live)
+            a = search_best_table_settings(live, debug=False)
+            b = search_best_table_settings(cached, debug=False)
+            assert a[:3] == b[:3]
+            assert [t.extract() for t in a[3]] == [t.extract() for t in b[3]]
+    assert [p.page_number for p in first] == [1, 2]
+
+
+def test_extract_document_with_cache(tmp_path):
+    path = make_grid_pdf(tmp_path / "g.pdf", n_pages=3)
+    plain = [r.to_dict() for r in extract_document(path, max_workers=0)]
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        cached = [r.to_dict() for r in extract_document(path, max_workers=0, cache_dir=cache_dir)]
+        assert cached == plain
+    assert len(list(cache_dir.rglob("*.npz"))) == 3
+
+
+def test_arrays_read_on_demand(tmp_path):
+    cached = load_page(dump_page(make_page("noise", 300), tmp_path / "p.npz"))
+    assert "char_box" not in cached.arrays._arrays
+    cached.page_geometry
+    assert "line_box" in cached.arrays._arrays and "char_box" not in cached.arrays._arrays
+    cached.close()
+    assert len(cached.chars) > 0  # reopened for the arrays not read yet
+
+
+def test_cache_key_includes_open_options(tmp_path):
+    path = make_grid_pdf(tmp_path / "g.pdf", n_pages=1)
+    cache = PrimitiveCache(tmp_path / "cache")
+    list(cache.pages(path))
+    list(cache.pages(path, unicode_norm="NFKC"))
+    assert (cache.hits, cache.misses) == (0, 2)
+    list(cache.pages(path, unicode_norm="NFKC"))
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.key(path) == cache.digest(path) != cache.key(path, {"unicode_norm": "NFKC"})
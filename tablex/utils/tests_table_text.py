@@ -0,0 +1,36 @@
+import pathlib
+import sys
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+import pdfplumber
+import pytest
+
+from tablex.testing import make_grid_pdf
+from tablex.utils.char_index import CharIndex
+from tablex.utils.table_text import extract_table, extract_tables
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(rows=12, cols=8), dict(rows=6, cols=5, prose_lines=10), dict(rows=4, cols=3, ruled=False)],
+)
+def test_extract_tables_matches_table_extract(tmp_path, kwargs):
+    path = make_grid_pdf(tmp_path / "g.pdf", n_pages=1, **kwargs)
+    settings = {} if kwargs.get("ruled", True) else {"vertical_strategy": "text", "horizontal_strategy": "text"}
+    with pdfplumber.open(path) as pdf:
+        page = pdf.pages[0]
+        tables = page.find_tables(settings)
+        assert tables
+        assert extract_tables(tables, page) == [t.extract() for t in tables]
+        assert extract_tables(tables, page, layout=True) == [t.extract(layout=True) for t in tables]
+
+
+def test_extract_table_with_shared_index(tmp_path):
+    path = make_grid_pdf(tmp_path / "g.pdf", n_pages=1, rows=3, cols=2)
+    with pdfplumber.open(path) as pdf:
+        page = pdf.pages[0]
+        (table,) = page.find_tables()
+        rows = extract_table(table, CharIndex.from_page(page))
+    assert rows == [[f"p0r{r}c{c}" for c in range(2)] for r in range(3)]
+    assert extract_tables([], page) == []